@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import time
+import timeit
+import tracemalloc
+
+from datetime import datetime
+from typing import Callable
+
+from easyb.data import Data
+from easyb.data.base import Type, to_epoch
+
+__all__ = [
+    "bit",
+    "bulk",
+    "excel",
+    "importtime",
+    "message",
+    "receive",
+    "text",
+
+    "Result",
+    "measure",
+    "measure_once",
+    "report",
+    "create_data"
+]
+
+
+class Result(object):
+
+    def __init__(self, name: str, number: int, seconds: float):
+        self.name: str = name
+        self.number: int = number
+        self.seconds: float = seconds
+        self.peak: int = 0
+        return
+
+    @property
+    def per_call(self) -> float:
+        return self.seconds / float(self.number)
+
+
+def measure(name: str, func: Callable, number: int = 10000, repeat: int = 5) -> Result:
+    timer = timeit.Timer(func)
+    seconds = min(timer.repeat(repeat=repeat, number=number))
+    result = Result(name, number, seconds)
+    return result
+
+
+def measure_once(name: str, func: Callable) -> Result:
+    """Run func a single time and record wall time and peak traced memory."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = Result(name, 1, seconds)
+    result.peak = peak
+    return result
+
+
+def report(result: Result, reference: Result = None):
+    if result.number == 1:
+        line = "{0:40s} {1:10.3f} s".format(result.name, result.seconds)
+    else:
+        line = "{0:40s} {1:10.3f} us/call".format(result.name, result.per_call * 1000000.0)
+
+    if reference is not None:
+        speedup = reference.per_call / result.per_call
+        line += "  (x{0:.1f})".format(speedup)
+
+    if result.peak != 0:
+        line += "  peak {0:.1f} MB".format(result.peak / 1048576.0)
+
+    print(line)
+    return
+
+
+def create_data(rows: int) -> Data:
+    """Create a data collection with the columns of a GMH 3710 and the given number of rows."""
+    data = Data()
+    data.add_column("datetime", "Time", Type.datetime)
+    data.add_column("number", "Number", Type.integer)
+    data.add_column("value", "Temperature", Type.float)
+    data.add_column("error", "Error", Type.string)
+
+    start = to_epoch(datetime(2020, 1, 1))
+    step = 1000000
+
+    data.values["datetime"].extend(range(start, start + rows * step, step))
+    data.values["number"].extend(range(rows))
+    data.values["value"].extend(20.0 + (counter % 100) * 0.01 for counter in range(rows))
+    data.values["error"].extend([""] * rows)
+    data.size = rows
+    return data
@@ -0,0 +1,135 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import sys
+
+from easyb.bit import Value, debug_data, decode_u16, decode_u32, crop_u8, crop_u16, crop_u32, create_crc, check_crc
+from benchmarks import measure, report
+
+__all__ = [
+    "crop_u8_size",
+    "crop_u16_size",
+    "crop_u32_size",
+    "create_crc_loop",
+    "debug_data_concat",
+    "run"
+]
+
+
+def crop_u8_size(value: int) -> int:
+    """Reference implementation, mask selected by sys.getsizeof."""
+    size = sys.getsizeof(value)
+    result = value
+
+    if (size > 16) and (size <= 64):
+        result = value & 0x00000000000000ff
+    return result
+
+
+def crop_u16_size(value: int) -> int:
+    """Reference implementation, mask selected by sys.getsizeof."""
+    size = sys.getsizeof(value)
+    result = value
+
+    if (size > 16) and (size <= 64):
+        result = value & 0x000000000000ffff
+    return result
+
+
+def crop_u32_size(value: int) -> int:
+    """Reference implementation, mask selected by sys.getsizeof."""
+    size = sys.getsizeof(value)
+    result = value
+
+    if size > 32:
+        result = value & 0x00000000ffffffff
+    return result
+
+
+def create_crc_loop(byte1: int, byte2: int) -> int:
+    """Reference implementation, the 16 step bit loop used before the lookup table."""
+    ui16_integer = (byte1 << 8) | byte2
+
+    counter = 0
+    while counter < 16:
+        check_value = crop_u16_size(ui16_integer & 0x8000)
+        if check_value == 0x8000:
+            ui16_integer = ui16_integer << 1
+            ui16_integer = ui16_integer ^ 0x0700
+        else:
+            ui16_integer = ui16_integer << 1
+
+        counter += 1
+
+    crop = crop_u8_size(ui16_integer >> 8)
+    crc = 255 - crop
+    return crc
+
+
+def debug_data_concat(data: bytes) -> str:
+    """Reference implementation, string concatenation per byte."""
+    debug = ""
+    for item in data:
+        value = int(item)
+        if debug == "":
+            debug = "0x{:02x}".format(value)
+        else:
+            debug = debug + " 0x{:02x}".format(value)
+
+    return debug
+
+
+def run():
+    frame = bytes([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+    data16 = [0, 0, 0, 183, 70, 14]
+    data32 = list(frame)
+
+    value = 0x1234567890
+
+    reference = measure("crop_u8 (sys.getsizeof)", lambda: crop_u8_size(value))
+    report(reference)
+    report(measure("crop_u8", lambda: crop_u8(value)), reference)
+
+    reference = measure("crop_u16 (sys.getsizeof)", lambda: crop_u16_size(value))
+    report(reference)
+    report(measure("crop_u16", lambda: crop_u16(value)), reference)
+
+    reference = measure("crop_u32 (sys.getsizeof)", lambda: crop_u32_size(value))
+    report(reference)
+    report(measure("crop_u32", lambda: crop_u32(value)), reference)
+
+    reference = measure("create_crc (bit loop)", lambda: create_crc_loop(0xfe, 0x05))
+    report(reference)
+    report(measure("create_crc (lookup table)", lambda: create_crc(0xfe, 0x05)), reference)
+
+    report(measure("check_crc", lambda: check_crc(0xfe, 0x05, 0x26)))
+    report(measure("decode_u16", lambda: decode_u16(0x71, 0x00)))
+    report(measure("decode_u32", lambda: decode_u32(0x8eff, 0x077b)))
+    reference = measure("debug_data (concatenation)", lambda: debug_data_concat(frame))
+    report(reference)
+    report(measure("debug_data (hex table)", lambda: debug_data(frame)), reference)
+
+    report(measure("Value.decode16", lambda: Value(data=data16).decode16()))
+    report(measure("Value.encode16", lambda: Value(value=7.0).encode16()))
+    report(measure("Value.decode32", lambda: Value(data=data32).decode32()))
+    report(measure("Value.encode32", lambda: Value(value=53.84).encode32()))
+    return
+
+
+if __name__ == '__main__':
+    run()
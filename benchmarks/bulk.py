@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import sys
+import random
+
+from easyb.bit import Value
+from easyb.bulk import decode32_bulk
+from benchmarks import measure, report
+
+__all__ = [
+    "decode32_values",
+    "create_frames",
+    "run"
+]
+
+
+def decode32_values(frames: bytes) -> list:
+    """Reference implementation, one Value object and decode32 call per frame."""
+    values = []
+
+    for position in range(0, len(frames), 9):
+        bitio = Value(data=frames[position:position + 9])
+        bitio.decode32()
+        values.append(bitio.value)
+    return values
+
+
+def create_frames(number: int) -> bytes:
+    """Create number measurement responses with random values."""
+    random.seed(0)
+    frames = bytearray()
+
+    for _ in range(number):
+        bitio = Value(value=round(random.uniform(-100.0, 100.0), 2))
+        bitio.encode32()
+        frames.extend([0xfe, 0x05, 0x26] + bitio.data)
+
+    result = bytes(frames)
+    return result
+
+
+def run(number: int = 1000000):
+    frames = create_frames(number)
+    print("Decode {0:d} captured 32 bit responses".format(number))
+
+    reference = measure("Value.decode32 (per frame)", lambda: decode32_values(frames), number=1, repeat=3)
+    report(reference)
+    report(measure("decode32_bulk", lambda: decode32_bulk(frames), number=1, repeat=3), reference)
+    return
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(int(sys.argv[1]))
+    else:
+        run()
@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import sys
+
+from typing import Any
+
+from easyb.data.base import Type
+from easyb.data.excel import ExcelStorage
+from benchmarks import measure_once, report, create_data
+
+__all__ = [
+    "ExcelStorageFormats",
+    "run"
+]
+
+
+class ExcelStorageFormats(ExcelStorage):
+    """Reference implementation, one new format object per cell."""
+
+    def _write_cell(self, row: int, column: int, data_type: Type, value: Any, writer: Any):
+        cell_format = self.workbook.add_format()
+        cell_format.set_font_name("Arial")
+        cell_format.set_font_size(10)
+
+        if data_type is Type.datetime:
+            cell_format.set_num_format('hh:mm:ss')
+
+        if data_type is Type.float:
+            cell_format.set_num_format('0.00')
+
+        writer(row, column, value, cell_format)
+        return
+
+    def _write_data(self):
+        for row in self.data.rows:
+
+            for column in self.data.columns:
+                writer = self._get_writer(self.data_sheet, column.type)
+                value = getattr(row, column.name)
+
+                self._write_cell(self.row, column.index, column.type, value, writer)
+            self.row += 1
+        return
+
+
+def _store(storage: ExcelStorage, filename: str):
+    storage.data.filename = filename
+    storage.store()
+    os.remove(storage.data.filename)
+    return
+
+
+def run(rows: int = 1000000):
+    data = create_data(rows)
+    print("Excel export of {0:d} rows".format(rows))
+
+    reference = measure_once("ExcelStorage (format per cell)", lambda: _store(ExcelStorageFormats(data), "bench_ref"))
+    report(reference)
+    report(measure_once("ExcelStorage (format cache)", lambda: _store(ExcelStorage(data), "bench")), reference)
+    return
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(int(sys.argv[1]))
+    else:
+        run()
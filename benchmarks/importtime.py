@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import sys
+import subprocess
+
+from typing import List
+
+from benchmarks import Result, report
+
+__all__ = [
+    "import_time",
+    "run"
+]
+
+_statements = [
+    ("import easyb", "easyb"),
+    ("import easyb; easyb.log", "easyb.logging"),
+    ("import easyb; easyb.conf.get_error(16365)", "easyb.config"),
+    ("import easyb.console", "easyb.console")
+]
+
+
+def import_time(statement: str, module: str, repeat: int = 5) -> Result:
+    """Run statement in a fresh interpreter with -X importtime and take the cumulative time of module."""
+    times: List[float] = []
+
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                                 stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+        for line in process.stderr.splitlines():
+            fields = line.split("|")
+            if (len(fields) != 3) or (fields[2].strip() != module):
+                continue
+            times.append(int(fields[1]) / 1000000.0)
+
+    result = Result(statement, 1, min(times))
+    return result
+
+
+def run():
+    for (statement, module) in _statements:
+        report(import_time(statement, module))
+    return
+
+
+if __name__ == '__main__':
+    run()
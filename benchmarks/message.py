@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+from easyb.bit import crop_u8
+from easyb.message import Message
+from easyb.message.stream import Stream
+from easyb.definitions import Direction, Length, Priority, get_direction, get_length, get_priority
+from benchmarks import measure, report
+
+__all__ = [
+    "MessageShift",
+    "run"
+]
+
+
+class MessageShift(Message):
+    """Reference implementation, header bits shifted and looked up in the enums for every frame."""
+
+    def _encode_header(self, data: bytearray):
+        u8 = 0
+
+        direction = crop_u8(self.direction.value)
+        length = crop_u8(self.length.value << 1)
+        priority = crop_u8(self.priority.value << 3)
+        code = crop_u8(self.code << 4)
+
+        u8 = crop_u8(u8 | direction)
+        u8 = crop_u8(u8 | length)
+        u8 = crop_u8(u8 | priority)
+        u8 = crop_u8(u8 | code)
+
+        data[0] = crop_u8(self.address)
+        data[1] = u8
+        data[2] = 0
+        return
+
+    def _decode_header(self):
+        byte0 = self.stream.data[0]
+        byte1 = self.stream.data[1]
+
+        self.address = 255 - byte0
+        self.code = (byte1 & 0xf0) >> 4
+
+        priority = (byte1 & 0x8) >> 3
+        length = (byte1 & 0x6) >> 1
+        direction = byte1 & 0x1
+
+        self.priority = get_priority(priority)
+        self.length = get_length(length)
+        self.direction = get_direction(direction)
+        return
+
+
+def _create(message: Message) -> Message:
+    message.address = 1
+    message.code = 0
+    message.priority = Priority.NoPriority
+    message.length = Length.Variable
+    message.direction = Direction.FromSlave
+    message.stream = Stream(Length.Byte3)
+    message.stream.data = bytearray([0xfe, 0x07, 0x28])
+    return message
+
+
+def run():
+    data = bytearray(3)
+    reference = _create(MessageShift())
+    message = _create(Message())
+
+    print("Message header")
+
+    result = measure("_decode_header (shift and enum search)", reference._decode_header)
+    report(result)
+    report(measure("_decode_header (table)", message._decode_header), result)
+
+    result = measure("_encode_header (shift and crop)", lambda: reference._encode_header(data))
+    report(result)
+    report(measure("_encode_header (table)", lambda: message._encode_header(data)), result)
+    return
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import sys
+import time
+
+from easyb.devices.gmh3710 import GMH3710
+from benchmarks import measure_once, report
+
+__all__ = [
+    "LineSerial",
+    "PlainSerial",
+    "run"
+]
+
+_frame = [254, 7, 40] + [141, 255, 83] * 10
+
+
+class LineSerial(object):
+    """Serial port replaying one frame at line speed, bytes arrive one character time apart."""
+
+    def __init__(self, data: list, baudrate: int, timeout: float):
+        self.data: bytes = bytes(data)
+        self.byte_time: float = 10.0 / float(baudrate)
+        self.timeout: float = timeout
+        self.position: int = 0
+        self.start: float = time.monotonic()
+        return
+
+    def _available(self) -> int:
+        count = int((time.monotonic() - self.start) / self.byte_time)
+        count = min(count, len(self.data))
+        return count - self.position
+
+    @property
+    def in_waiting(self) -> int:
+        return self._available()
+
+    def read(self, size: int = 1) -> bytes:
+        deadline = time.monotonic() + self.timeout
+
+        while (self._available() < size) and (time.monotonic() < deadline):
+            time.sleep(self.byte_time / 4.0)
+
+        count = min(size, self._available())
+        result = self.data[self.position:self.position + count]
+        self.position += count
+        return result
+
+
+class PlainSerial(LineSerial):
+    """Reference port without in_waiting, the variable frame ends with a read timing out."""
+
+    @property
+    def in_waiting(self) -> str:
+        return "unsupported"
+
+
+def _receive(device: GMH3710, port: LineSerial):
+    device.serial = port
+    message = device.receive()
+    assert message is not None
+    return
+
+
+def run(timeout: float = 2.0):
+    device = GMH3710(timeout=timeout)
+    print("Receive a variable length frame of {0:d} bytes at 4800 baud".format(len(_frame)))
+
+    reference = measure_once("receive (read until timeout)",
+                             lambda: _receive(device, PlainSerial(_frame, 4800, timeout)))
+    report(reference)
+    report(measure_once("receive (in_waiting and byte gap)",
+                        lambda: _receive(device, LineSerial(_frame, 4800, timeout))), reference)
+    return
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(float(sys.argv[1]))
+    else:
+        run()
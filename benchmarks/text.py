@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import sys
+
+from easyb.data.base import convert_data
+from easyb.data.text import TextStorage
+from benchmarks import measure_once, report, create_data
+
+__all__ = [
+    "TextStorageLines",
+    "run"
+]
+
+
+class TextStorageLines(TextStorage):
+    """Reference implementation, string concatenation and one write per line."""
+
+    def _write_rows(self):
+
+        for row in self.data.rows:
+
+            line = ""
+            for column in self.data.columns:
+                data = getattr(row, column.name)
+                value = convert_data(column.type, data)
+
+                if line == "":
+                    line = value
+                else:
+                    line += "\t{0:s}".format(value)
+
+            line += "\n"
+            self.file.write(line)
+
+        return
+
+
+def _store(storage: TextStorage, filename: str):
+    storage.data.filename = filename
+    storage.store()
+    os.remove(filename + ".csv")
+    return
+
+
+def run(rows: int = 1000000):
+    data = create_data(rows)
+    print("Text export of {0:d} rows".format(rows))
+
+    reference = measure_once("TextStorage (line by line)", lambda: _store(TextStorageLines(data), "bench_ref"))
+    report(reference)
+    report(measure_once("TextStorage (chunked writelines)", lambda: _store(TextStorage(data), "bench")), reference)
+    return
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        run(int(sys.argv[1]))
+    else:
+        run()
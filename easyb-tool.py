@@ -44,10 +44,13 @@ if __name__ == '__main__':
     if main.prepare() is False:
         sys.exit(1)
 
-    if main.run() is False:
-        sys.exit(1)
+    # close also after a failed run, it finishes the files of a streaming measurement
+    check = main.run()
 
     if main.close() is False:
         sys.exit(1)
 
+    if check is False:
+        sys.exit(1)
+
     sys.exit(0)
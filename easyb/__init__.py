@@ -21,12 +21,18 @@ __all__ = [
     "devices",
     "message",
 
+    "aio",
     "bit",
+    "bulk",
+    "bus",
+    "capture",
     "command",
     "config",
     "console",
     "definitions",
-    "device"
+    "device",
+    "engine",
+    "timing"
 ]
 
 
@@ -73,11 +79,30 @@ __version__ = "{0:d}.{1:d}.{2:d}.{3:d}".format(__milestone__, __major__, __minor
 __maintainer__ = __author__
 
 
-from easyb.logging import SerialLogging
-import easyb.config
+import threading
 
-log: SerialLogging = SerialLogging()
-conf = easyb.config.Config()
+_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    """Create the shared logging and configuration on first access."""
+    if name not in ["log", "conf"]:
+        raise AttributeError("module {0:s} has no attribute {1:s}".format(__name__, name))
+
+    with _lock:
+        value = globals().get(name, None)
+        if value is not None:
+            return value
+
+        if name == "log":
+            from easyb.logging import SerialLogging
+            value = SerialLogging()
+        else:
+            from easyb.config import Config
+            value = Config()
+
+        globals()[name] = value
+    return value
 
 
 def set_logging(new_log):
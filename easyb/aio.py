@@ -0,0 +1,305 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import abc
+import time
+import asyncio
+import easyb
+import serial
+
+from abc import ABCMeta
+from serial import Serial
+from typing import List, Union
+
+from easyb.command import Command
+from easyb.device import Device
+from easyb.message import Message
+from easyb.timing import Ticker
+
+__all__ = [
+    "Transport",
+    "SerialTransport",
+    "AsyncDevice",
+    "run_devices"
+]
+
+
+class Transport(metaclass=ABCMeta):
+    """Byte transport for the asyncio device, one transaction at a time is guarded by lock."""
+
+    def __init__(self):
+        self.lock: asyncio.Lock = asyncio.Lock()
+        return
+
+    @abc.abstractmethod
+    async def open(self) -> bool:  # pragma: no cover
+        return True
+
+    @abc.abstractmethod
+    async def close(self) -> bool:  # pragma: no cover
+        return True
+
+    @abc.abstractmethod
+    async def write(self, data: bytes):  # pragma: no cover
+        return
+
+    @abc.abstractmethod
+    async def read(self, number: int, timeout: float) -> bytes:  # pragma: no cover
+        """Read number bytes, returns less if the timeout is reached."""
+        return bytes()
+
+
+class SerialTransport(Transport):
+    """Non blocking transport on the file descriptor of an opened pyserial port (posix only)."""
+
+    def __init__(self, port: Serial):
+        Transport.__init__(self)
+
+        self.serial: Serial = port
+        self.buffer: bytearray = bytearray()
+
+        # noinspection PyTypeChecker
+        self._loop: asyncio.AbstractEventLoop = None
+
+        # noinspection PyTypeChecker
+        self._waiter: asyncio.Future = None
+        return
+
+    def _readable(self):
+        try:
+            count = self.serial.in_waiting
+            data = self.serial.read(max(count, 1))
+        except serial.SerialException as e:
+            if (self._waiter is not None) and (self._waiter.done() is False):
+                self._waiter.set_exception(e)
+            return
+
+        self.buffer.extend(data)
+
+        if (self._waiter is not None) and (self._waiter.done() is False):
+            self._waiter.set_result(None)
+        return
+
+    async def open(self) -> bool:
+        self._loop = asyncio.get_running_loop()
+        self.serial.timeout = 0
+        self._loop.add_reader(self.serial.fileno(), self._readable)
+        return True
+
+    async def close(self) -> bool:
+        if self._loop is not None:
+            self._loop.remove_reader(self.serial.fileno())
+            self._loop = None
+        return True
+
+    async def write(self, data: bytes):
+        self.serial.write(data)
+        return
+
+    async def read(self, number: int, timeout: float) -> bytes:
+        deadline = self._loop.time() + timeout
+
+        while len(self.buffer) < number:
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+
+            self._waiter = self._loop.create_future()
+            try:
+                await asyncio.wait_for(self._waiter, remaining)
+            except asyncio.TimeoutError:
+                break
+            finally:
+                self._waiter = None
+
+        data = bytes(self.buffer[0:number])
+        del self.buffer[0:number]
+        return data
+
+
+class AsyncDevice(object):
+    """Drive a device from an event loop, commands and decoding are taken from the wrapped device."""
+
+    def __init__(self, device: Device, transport: Transport = None):
+        self.device: Device = device
+        self.transport: Transport = transport
+        return
+
+    @property
+    def name(self) -> str:
+        return self.device.name
+
+    async def connect(self) -> bool:
+        if self.transport is None:
+            self.device.setup()
+
+            check = self.device.connect()
+            if check is False:
+                return False
+
+            self.transport = SerialTransport(self.device.serial)
+
+        check = await self.transport.open()
+        return check
+
+    async def disconnect(self) -> bool:
+        check = await self.transport.close()
+        if self.device.serial is not None:
+            self.device.disconnect()
+        return check
+
+    async def receive(self) -> Union[None, Message]:
+        device = self.device
+        decoder = device.decoder
+        decoder.reset()
+        dropped = 0
+
+        deadline = time.monotonic() + device.timeout
+
+        while True:
+            data = bytes()
+            remaining = deadline - time.monotonic()
+
+            # a variable length frame ends when no byte arrives for gap_time
+            if decoder.variable is True:
+                remaining = min(remaining, device.gap_time)
+
+            if remaining > 0:
+                try:
+                    data = await self.transport.read(decoder.needed, remaining)
+                except serial.SerialException as e:
+                    easyb.log.error("Problem during reading of message!")
+                    easyb.log.exception(e)
+                    return None
+
+            if len(data) == 0:
+                messages = decoder.flush()
+            else:
+                easyb.log.serial_read(data)
+                messages = decoder.feed(data)
+
+            (check, message) = device.select_message(messages)
+
+            if decoder.dropped != dropped:
+                easyb.log.warn(device.name, "Skipped {0:d} bytes of invalid data".format(decoder.dropped - dropped))
+                dropped = decoder.dropped
+
+            if check is True:
+                return message
+
+            if len(data) == 0:
+                return None
+
+    async def execute(self, command: Command) -> Union[None, Message]:
+        frame = self.device.compile_command(command)
+        if frame is None:
+            return None
+
+        easyb.log.debug2("SEND", command.name)
+
+        async with self.transport.lock:
+            start = time.monotonic()
+
+            easyb.log.serial_write(frame)
+
+            try:
+                await self.transport.write(frame)
+            except serial.SerialException as e:
+                easyb.log.error("Problem during write to serial port!")
+                easyb.log.exception(e)
+                return None
+
+            message = await self.receive()
+
+        if message is None:
+            return None
+
+        self.device.latency.add(time.monotonic() - start)
+        return message
+
+    async def run_command(self, number: int) -> bool:
+        command = self.device.get_command(number)
+
+        if command is None:
+            return False
+
+        message = await self.execute(command)
+        if message is None:
+            return False
+
+        check = command.call(message)
+        return check
+
+    async def run(self) -> bool:
+        command = self.device.get_command(self.device.measure_command)
+
+        if command is None:
+            return False
+
+        message = await self.execute(command)
+        if message is None:
+            return False
+
+        check = self.device.handle_response(message)
+        return check
+
+    async def run_loop(self):
+        device = self.device
+
+        device.active = True
+        easyb.log.inform(device.name, "Start measurements")
+
+        device.ticker = Ticker(device.interval, device.catch_up)
+        device.ticker.start()
+
+        while True:
+            device.status = device.end_step(await self.run())
+            device.flush_batch()
+
+            if device.abort is True:
+                easyb.log.inform(device.name, "Stop measurements")
+                break
+
+            if device.status is False:
+                device.abort = True
+                easyb.log.warn(device.name, "Abort measurements")
+                break
+
+            await asyncio.sleep(device.ticker.delay())
+
+        device.finish_loop()
+
+        easyb.log.inform(device.name, "Round trip: {0:s}".format(str(device.latency)))
+        easyb.log.inform(device.name, "Schedule: {0:s}".format(str(device.ticker)))
+        device.active = False
+        return
+
+
+async def run_devices(devices: List[AsyncDevice]) -> bool:
+    """Run the measurement loops of all devices concurrently on the current event loop.
+
+    :return: True if all devices stopped without error
+    :rtype: bool
+    """
+
+    await asyncio.gather(*[item.run_loop() for item in devices])
+
+    for item in devices:
+        if item.device.status is False:
+            return False
+    return True
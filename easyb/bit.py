@@ -17,7 +17,6 @@
 #
 
 import easyb
-import sys
 
 from typing import List
 from easyb.definitions import Error
@@ -34,6 +33,7 @@ __all__ = [
     "crop_u8",
     "crop_u16",
     "crop_u32",
+    "get_crc_table",
     "create_crc",
     "check_crc",
 
@@ -41,15 +41,14 @@ __all__ = [
 ]
 
 
-def debug_data(data: bytes) -> str:
-    debug = ""
-    for item in data:
-        value = int(item)
-        if debug == "":
-            debug = "0x{:02x}".format(value)
-        else:
-            debug = debug + " 0x{:02x}".format(value)
+_hex_table = ["0x{:02x}".format(value) for value in range(256)]
 
+
+def debug_data(data: bytes) -> str:
+    try:
+        debug = " ".join([_hex_table[item] for item in data])
+    except (IndexError, TypeError):
+        debug = " ".join(["0x{:02x}".format(int(item)) for item in data])
     return debug
 
 
@@ -80,56 +79,53 @@ def decode_u32(inputa: int, inputb: int) -> int:
 
 
 def crop_u8(value: int) -> int:
-    size = sys.getsizeof(value)
-    result = value
+    return value & 0xff
 
-    if size <= 16:  # pragma: no cover
-        result = value & 0x00ff
 
-    if (size > 16) and (size <= 32):
-        result = value & 0x000000ff
+def crop_u16(value: int) -> int:
+    return value & 0xffff
 
-    if (size > 32) and (size <= 64):
-        result = value & 0x00000000000000ff
-    return result
 
+def crop_u32(value: int) -> int:
+    return value & 0xffffffff
 
-def crop_u16(value: int) -> int:
-    size = sys.getsizeof(value)
-    result = value
 
-    if (size > 16) and (size <= 32):
-        result = value & 0x0000ffff
+def _create_crc_table() -> List[int]:
+    table = []
 
-    if (size > 32) and (size <= 64):
-        result = value & 0x000000000000ffff
-    return result
+    for value in range(256):
+        crc = value
 
+        counter = 0
+        while counter < 8:
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0x07) & 0xff
+            else:
+                crc = (crc << 1) & 0xff
+            counter += 1
 
-def crop_u32(value: int) -> int:
-    size = sys.getsizeof(value)
-    result = value
+        table.append(crc)
+    return table
 
-    if size > 32:
-        result = value & 0x00000000ffffffff
-    return result
 
+#: CRC-8 (polynom 0x07) for every single byte, the 16 bit CRC of a byte pair is done by two lookups
+_crc_table: List[int] = _create_crc_table()
+_crc_bytes: bytes = bytes(_crc_table)
 
-def create_crc(byte1: int, byte2: int) -> int:
-    ui16_integer = (byte1 << 8) | byte2
-
-    counter = 0
-    while counter < 16:
-        check_value = crop_u16(ui16_integer & 0x8000)
-        if check_value == 0x8000:
-            ui16_integer = ui16_integer << 1
-            ui16_integer = ui16_integer ^ 0x0700
-        else:
-            ui16_integer = ui16_integer << 1
 
-        counter += 1
+def get_crc_table() -> bytes:
+    """Get the CRC-8 lookup table for batch checks, indexing it gives the CRC of a single byte.
+
+    :return: read-only table of 256 entries.
+    :rtype: bytes
+    """
+    return _crc_bytes
+
+
+def create_crc(byte1: int, byte2: int) -> int:
+    ui16_integer = ((byte1 << 8) | byte2) & 0xffff
 
-    crop = crop_u8(ui16_integer >> 8)
+    crop = _crc_table[_crc_table[ui16_integer >> 8] ^ (ui16_integer & 0xff)]
     crc = 255 - crop
     return crc
 
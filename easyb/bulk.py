@@ -0,0 +1,213 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+from typing import List, Tuple, Union
+
+from easyb.bit import get_crc_table, to_signed32
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = [
+    "check_crc_bulk",
+    "decode16_bulk",
+    "decode32_bulk"
+]
+
+#: powers of ten for the decimal point positions -15..16 of a 32 bit value, computed like Value.decode32
+_scale32: List[float] = [float(10.0 ** float(position)) for position in range(-15, 17)]
+
+
+def _check_crc_numpy(data) -> "numpy.ndarray":
+    table = numpy.frombuffer(get_crc_table(), dtype=numpy.uint8)
+    frame = numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, 3)
+
+    crc = 255 - table[table[frame[:, 0]] ^ frame[:, 1]]
+    result = crc == frame[:, 2]
+    return result
+
+
+def _check_crc_python(data) -> List[bool]:
+    table = get_crc_table()
+    view = memoryview(data).cast("B")
+
+    result = [(255 - table[table[byte1] ^ byte2]) == crc
+              for (byte1, byte2, crc) in zip(view[0::3], view[1::3], view[2::3])]
+    return result
+
+
+def check_crc_bulk(data: Union[bytes, bytearray, memoryview]) -> Union[List[bool], "numpy.ndarray"]:
+    """Check the CRC of every triplet in a buffer of concatenated frames.
+
+    :param data: raw serial data, a multiple of 3 bytes
+    :return: one entry per triplet, True if the CRC is valid. A numpy bool array if numpy is available,
+             otherwise a list of bool, both index and iterate alike.
+    """
+
+    length = memoryview(data).nbytes
+
+    check = length % 3
+    if check != 0:
+        raise ValueError("Data size is not a triplet! ({0:d})".format(length))
+
+    if numpy is None:  # pragma: no cover
+        return _check_crc_python(data)
+
+    return _check_crc_numpy(data)
+
+
+def _get_frames(frames, size: int) -> "numpy.ndarray":
+    if isinstance(frames, numpy.ndarray):
+        array = frames.astype(numpy.int64, copy=False)
+    else:
+        array = numpy.frombuffer(frames, dtype=numpy.uint8).astype(numpy.int64)
+
+    array = array.reshape(-1, array.shape[-1] if array.ndim == 2 else size)
+    if array.shape[1] < size:
+        raise ValueError("Frame size is too small! ({0:d})".format(array.shape[1]))
+    return array
+
+
+def _check_size(frames, size: int):
+    if (numpy is not None) and isinstance(frames, numpy.ndarray):
+        return
+
+    length = memoryview(frames).nbytes
+
+    check = length % size
+    if check != 0:
+        raise ValueError("Data size is not a multiple of the frame size! ({0:d})".format(length))
+    return
+
+
+def _decode16_numpy(frames) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    array = _get_frames(frames, 6)
+
+    u16_integer = ((255 - array[:, 3]) << 8) | array[:, 4]
+    float_pos = (u16_integer & 0xc000) >> 14
+    u16_integer = u16_integer & 0x3fff
+
+    invalid = u16_integer >= 0x3fe0
+
+    values = (u16_integer - 2048.0) / numpy.power(10, float_pos)
+    values[invalid] = 0.0
+
+    errors = numpy.where(invalid, u16_integer, -1).astype(numpy.int32)
+    return values, errors
+
+
+def _decode16_python(frames) -> Tuple[List[float], List[int]]:
+    view = memoryview(frames).cast("B")
+
+    values = []
+    errors = []
+
+    for position in range(0, len(view), 6):
+        u16_integer = ((255 - view[position + 3]) << 8) | view[position + 4]
+        float_pos = (u16_integer & 0xc000) >> 14
+        u16_integer = u16_integer & 0x3fff
+
+        if u16_integer >= 0x3fe0:
+            values.append(0.0)
+            errors.append(u16_integer)
+            continue
+
+        values.append((u16_integer - 2048.0) / (10 ** float_pos))
+        errors.append(-1)
+
+    return values, errors
+
+
+def _decode32_numpy(frames) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    array = _get_frames(frames, 9)
+
+    u32_integer = ((255 - array[:, 3]) << 24) | (array[:, 4] << 16) | ((255 - array[:, 6]) << 8) | array[:, 7]
+    float_pos = (255 - array[:, 3]) >> 3
+    u32_integer = u32_integer & 0x07ffffff
+
+    invalid = u32_integer >= (100000000 + 0x2000000)
+    errors = numpy.where(invalid, u32_integer - 0x02000000 - 100000000, -1).astype(numpy.int32)
+
+    negative = (u32_integer & 0x04000000) != 0
+    u32_integer = numpy.where(negative, u32_integer | 0xf8000000, u32_integer)
+    u32_integer = (u32_integer + 0x02000000) & 0xffffffff
+    i32_integer = (u32_integer ^ 0x80000000) - 0x80000000
+
+    values = i32_integer / numpy.asarray(_scale32)[float_pos]
+    values[invalid] = 0.0
+    return values, errors
+
+
+def _decode32_python(frames) -> Tuple[List[float], List[int]]:
+    view = memoryview(frames).cast("B")
+
+    values = []
+    errors = []
+
+    for position in range(0, len(view), 9):
+        byte3 = view[position + 3]
+        u32_integer = ((255 - byte3) << 24) | (view[position + 4] << 16) | \
+                      ((255 - view[position + 6]) << 8) | view[position + 7]
+        float_pos = (255 - byte3) >> 3
+        u32_integer = u32_integer & 0x07ffffff
+
+        if u32_integer >= (100000000 + 0x2000000):
+            values.append(0.0)
+            errors.append(u32_integer - 0x02000000 - 100000000)
+            continue
+
+        if u32_integer & 0x04000000:
+            u32_integer = u32_integer | 0xf8000000
+
+        i32_integer = to_signed32(u32_integer + 0x02000000)
+        values.append(float(i32_integer) / _scale32[float_pos])
+        errors.append(-1)
+
+    return values, errors
+
+
+def decode16_bulk(frames) -> Union[Tuple[List[float], List[int]], Tuple["numpy.ndarray", "numpy.ndarray"]]:
+    """Decode the 16 bit value of many 6 byte response frames, same result as Value.decode16 per frame.
+
+    :param frames: N x 6 uint8 array or concatenated raw frames
+    :return: values and error codes, -1 for a valid reading. numpy float64 and int32 arrays if numpy is
+             available, otherwise lists of float and int.
+    """
+    _check_size(frames, 6)
+
+    if numpy is None:  # pragma: no cover
+        return _decode16_python(frames)
+
+    return _decode16_numpy(frames)
+
+
+def decode32_bulk(frames) -> Union[Tuple[List[float], List[int]], Tuple["numpy.ndarray", "numpy.ndarray"]]:
+    """Decode the 32 bit value of many 9 byte response frames, same result as Value.decode32 per frame.
+
+    :param frames: N x 9 uint8 array or concatenated raw frames
+    :return: values and error codes, -1 for a valid reading. numpy float64 and int32 arrays if numpy is
+             available, otherwise lists of float and int.
+    """
+    _check_size(frames, 9)
+
+    if numpy is None:  # pragma: no cover
+        return _decode32_python(frames)
+
+    return _decode32_numpy(frames)
@@ -0,0 +1,310 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import time
+import heapq
+import easyb
+import serial
+
+from serial import Serial
+from typing import Callable, List, Union
+
+from easyb.device import Device
+
+__all__ = [
+    "Schedule",
+    "Bus"
+]
+
+
+class Schedule(object):
+
+    def __init__(self, device: Device, priority: int, interval: float, number: int):
+        self.device: Device = device
+        self.priority: int = priority
+        self.interval: float = interval
+        self.number: int = number
+        self.deadline: float = 0.0
+        self.errors: int = 0
+        return
+
+
+class Bus(object):
+    """Several devices on one serial port (EASYBus multi-drop), polled one transaction at a time.
+
+    Devices which are due are served by priority first and by deadline second, so equal priorities
+    are served round robin. A device which overruns its interval is scheduled again right away
+    without queuing up the missed runs.
+    """
+
+    def __init__(self, **kwargs):
+        self.name: str = "BUS"
+        self.port: str = ""
+        self.baudrate: int = 4800
+        self.timeout: int = 2
+        self.write_timeout: int = 2
+        self.response_driven: bool = True
+
+        # noinspection PyTypeChecker
+        self.serial: Serial = None
+        self.schedules: List[Schedule] = []
+
+        self.abort: bool = False
+        self.status: bool = False
+        self.active: bool = False
+        self.counter: int = 0
+
+        # noinspection PyTypeChecker
+        self.callback: Callable[["Bus", Device], None] = None
+
+        self._waiting: list = []
+        self._ready: list = []
+
+        item = kwargs.get("name", None)
+        if item is not None:
+            self.name = item
+
+        item = kwargs.get("port", None)
+        if item is not None:
+            self.port = item
+
+        item = kwargs.get("baudrate", None)
+        if item is not None:
+            self.baudrate = item
+
+        item = kwargs.get("timeout", None)
+        if item is not None:
+            self.timeout = item
+
+        item = kwargs.get("write_timeout", None)
+        if item is not None:
+            self.write_timeout = item
+
+        item = kwargs.get("response_driven", None)
+        if item is not None:
+            self.response_driven = item
+        return
+
+    @property
+    def devices(self) -> List[Device]:
+        result = [item.device for item in self.schedules]
+        return result
+
+    def get_device(self, address: int) -> Union[None, Device]:
+        for item in self.schedules:
+            if item.device.address == address:
+                return item.device
+        return None
+
+    def add_device(self, device: Device, priority: int = 0, interval: float = None) -> bool:
+        check = self.get_device(device.address)
+        if check is not None:
+            easyb.log.error("Device with address {0:d} is already on the bus!".format(device.address))
+            return False
+
+        if interval is None:
+            interval = device.interval
+
+        schedule = Schedule(device, priority, interval, len(self.schedules))
+        self.schedules.append(schedule)
+
+        device.port = self.port
+        device.baudrate = self.baudrate
+        device.timeout = self.timeout
+        device.write_timeout = self.write_timeout
+        device.response_driven = self.response_driven
+        device.shared_port = True
+        device.serial = self.serial
+        return True
+
+    def setup(self):
+        ser = Serial(baudrate=self.baudrate,
+                     bytesize=serial.EIGHTBITS,
+                     parity=serial.PARITY_NONE,
+                     stopbits=serial.STOPBITS_ONE,
+                     timeout=self.timeout,
+                     xonxoff=0,
+                     rtscts=0,
+                     dsrdtr=0,
+                     interCharTimeout=None,
+                     writeTimeout=self.write_timeout)
+        self.serial = ser
+
+        for item in self.schedules:
+            item.device.serial = ser
+        return
+
+    def connect(self) -> bool:
+        if self.port == "":
+            easyb.log.error("Port is missing/not configured!")
+            return False
+
+        if self.serial is None:
+            easyb.log.error("Serial port is not set up!")
+            return False
+
+        easyb.log.debug1(self.name, "Port:          {0:s}".format(self.port))
+        easyb.log.debug1(self.name, "Baudrate:      {0:d}".format(self.baudrate))
+        easyb.log.debug1(self.name, "Devices:       {0:d}".format(len(self.schedules)))
+
+        self.serial.port = self.port
+
+        try:
+            self.serial.open()
+        except serial.SerialException as e:
+            easyb.log.error("Problem during opening of serial port!")
+            easyb.log.exception(e)
+            return False
+
+        easyb.log.inform(self.name, "Establish connection to {0:s}".format(self.port))
+        return True
+
+    def disconnect(self) -> bool:
+        if self.serial is None:
+            easyb.log.error("Serial port is not set up!")
+            return False
+
+        if self.serial.is_open is False:
+            easyb.log.warn(self.name, "Connection to {0:s} is already closed!".format(self.port))
+            return False
+
+        try:
+            self.serial.close()
+        except serial.SerialException as e:
+            easyb.log.error("Problem during closing of serial port!")
+            easyb.log.exception(e)
+            return False
+
+        easyb.log.inform(self.name, "Disconnect from {0:s}".format(self.port))
+        return True
+
+    def prepare(self) -> bool:
+        for item in self.schedules:
+            check = item.device.prepare()
+            if check is False:
+                easyb.log.error("Unable to prepare device at address {0:d}".format(item.device.address))
+                return False
+        return True
+
+    def close(self) -> bool:
+        result = True
+
+        for item in self.schedules:
+            check = item.device.close()
+            if check is False:
+                result = False
+        return result
+
+    def start(self):
+        now = time.monotonic()
+
+        self._waiting = []
+        self._ready = []
+
+        for item in self.schedules:
+            item.deadline = now
+            heapq.heappush(self._waiting, (item.deadline, item.number, item))
+        return
+
+    def next_schedule(self) -> Union[None, Schedule]:
+        """Next schedule to run now, None if no device is due yet."""
+        now = time.monotonic()
+
+        while (len(self._waiting) > 0) and (self._waiting[0][0] <= now):
+            (deadline, number, item) = heapq.heappop(self._waiting)
+            heapq.heappush(self._ready, (-item.priority, deadline, number, item))
+
+        if len(self._ready) == 0:
+            return None
+
+        (_, _, _, item) = heapq.heappop(self._ready)
+        return item
+
+    def run_once(self) -> Union[None, Device]:
+        """Run the next due device, waits for the earliest deadline if none is due.
+
+        :return: device which was run
+        :rtype: Device
+        """
+        item = self.next_schedule()
+
+        # sleep can return a little before the deadline, wait again until a schedule is due
+        while item is None:
+            if len(self._waiting) == 0:
+                return None
+
+            delay = self._waiting[0][0] - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            item = self.next_schedule()
+
+        device = item.device
+        device.status = device.run_step()
+        self.counter += 1
+
+        if device.status is False:
+            item.errors += 1
+            easyb.log.warn(self.name, "Run failed for address {0:d}".format(device.address))
+        elif self.callback is not None:
+            self.callback(self, device)
+
+        device.flush_batch()
+
+        now = time.monotonic()
+
+        item.deadline += item.interval
+        if item.deadline < now:
+            item.deadline = now
+
+        heapq.heappush(self._waiting, (item.deadline, item.number, item))
+        return device
+
+    # noinspection PyUnusedLocal
+    def do_abort(self, signum, frame):
+        self.abort = True
+        return
+
+    def run_loop(self):
+        if len(self.schedules) == 0:
+            easyb.log.error("No devices on the bus!")
+            self.status = False
+            return
+
+        self.active = True
+        self.status = True
+        easyb.log.inform(self.name, "Start measurements with {0:d} devices".format(len(self.schedules)))
+
+        self.start()
+
+        while self.abort is False:
+            self.run_once()
+
+        for item in self.schedules:
+            item.device.finish_loop()
+
+            line = "Address {0:d}: {1:d} runs, {2:d} errors, {3:s}"
+            line = line.format(item.device.address, item.device.interval_counter, item.errors,
+                               str(item.device.latency))
+            easyb.log.inform(self.name, line)
+
+            if item.errors != 0:
+                self.status = False
+
+        easyb.log.inform(self.name, "Stop measurements")
+        self.active = False
+        return
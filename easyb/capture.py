@@ -0,0 +1,111 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+from array import array
+from typing import Tuple
+
+__all__ = [
+    "Capture"
+]
+
+
+class Capture(object):
+    """Timestamped raw response frames in preallocated buffers.
+
+    Every frame gets a slot of frame_size bytes, its length, capture time in epoch microseconds and interval
+    counter are kept in parallel arrays. When full, the buffers are replaced by copies of twice the size, so views
+    returned by data stay valid and keep showing the frames captured before.
+    """
+
+    def __init__(self, **kwargs):
+        self.frame_size: int = 9
+        self.capacity: int = 4096
+        self.size: int = 0
+
+        item = kwargs.get("frame_size", 9)
+        if item is not None:
+            self.frame_size = item
+
+        item = kwargs.get("capacity", 4096)
+        if item is not None:
+            self.capacity = item
+
+        self.buffer: bytearray = bytearray(self.capacity * self.frame_size)
+        self.lengths: array = array("B", bytes(self.capacity))
+        self.timestamps: array = array("q", bytes(8 * self.capacity))
+        self.numbers: array = array("q", bytes(8 * self.capacity))
+        return
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def data(self) -> memoryview:
+        """Slots of all captured frames, can be passed to the bulk decoders if all frames have frame_size bytes."""
+        res = memoryview(self.buffer)[0:self.size * self.frame_size]
+        return res
+
+    def _grow(self):
+        # new buffers instead of resizing in place, that fails while a view on the old buffer exists
+        buffer = bytearray(2 * len(self.buffer))
+        buffer[0:len(self.buffer)] = self.buffer
+        self.buffer = buffer
+
+        self.lengths = self.lengths + array("B", bytes(self.capacity))
+        self.timestamps = self.timestamps + array("q", bytes(8 * self.capacity))
+        self.numbers = self.numbers + array("q", bytes(8 * self.capacity))
+        self.capacity *= 2
+        return
+
+    def add(self, frame: bytes, timestamp: int, number: int) -> bool:
+        """Store a frame, returns False if it does not fit into a slot.
+
+        :return: True if stored.
+        :rtype: bool
+        """
+        length = len(frame)
+        if length > self.frame_size:
+            return False
+
+        if self.size == self.capacity:
+            self._grow()
+
+        position = self.size * self.frame_size
+        self.buffer[position:position + length] = frame
+        self.lengths[self.size] = length
+        self.timestamps[self.size] = timestamp
+        self.numbers[self.size] = number
+        self.size += 1
+        return True
+
+    def get(self, index: int) -> Tuple[int, int, bytes]:
+        """Capture time, interval counter and raw bytes of a frame.
+
+        :return: timestamp, number and frame.
+        :rtype: Tuple[int, int, bytes]
+        """
+        if (index < 0) or (index >= self.size):
+            raise IndexError("Frame index out of range: {0:d}".format(index))
+
+        position = index * self.frame_size
+        frame = bytes(self.buffer[position:position + self.lengths[index]])
+        return self.timestamps[index], self.numbers[index], frame
+
+    def clear(self):
+        self.size = 0
+        return
@@ -15,7 +15,7 @@
 #
 #    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
 #
-from typing import List
+from typing import List, Union
 
 from easyb.definitions import Length
 
@@ -26,6 +26,23 @@ class Command(object):
         check = self._func_call(message)
         return check
 
+    def _frame_key(self) -> tuple:
+        key = (self.address, self.code, self.length, tuple(self.param))
+        return key
+
+    @property
+    def frame(self) -> Union[None, bytes]:
+        """Encoded request, None if not compiled or address, code, length or param changed since."""
+        if self._key != self._frame_key():
+            return None
+        return self._frame
+
+    @frame.setter
+    def frame(self, frame: bytes):
+        self._key = self._frame_key()
+        self._frame = frame
+        return
+
     def __init__(self, **kwargs):
         self.number = 0
         self.address = 1
@@ -36,6 +53,12 @@ class Command(object):
         self.param: List[int] = []
         self._func_call = None
 
+        # noinspection PyTypeChecker
+        self._frame: bytes = None
+
+        # noinspection PyTypeChecker
+        self._key: tuple = None
+
         item = kwargs.get("name", "")
         if item is not None:
             self.name = item
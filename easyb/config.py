@@ -16,7 +16,11 @@
 #    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
 #
 
-from typing import List, Union
+import os
+import json
+import easyb
+
+from typing import List, Union, Dict, Any
 
 from easyb.definitions import Error, Status, Unit
 
@@ -518,30 +522,125 @@ _units = [
 ]
 
 
+_default_error: List[Error] = []
+_default_units: List[Unit] = []
+_default_error_index: Dict[int, Error] = {}
+_default_units_index: Dict[int, Unit] = {}
+
+
+def _create_index(items: List[Any]) -> Dict[int, Any]:
+    # keep the first entry for duplicate codes like the linear search did
+    index = {}
+    for item in items:
+        if item.code not in index:
+            index[item.code] = item
+    return index
+
+
+def _load_defaults():
+    if len(_default_error) != 0:
+        return
+
+    for item in _error:
+        _default_error.append(Error(item))
+
+    for item in _units:
+        _default_units.append(Unit(item))
+
+    _default_error_index.update(_create_index(_default_error))
+    _default_units_index.update(_create_index(_default_units))
+    return
+
+
+def _read_table(filename: str) -> Union[None, List[dict]]:
+    filename = os.path.abspath(os.path.normpath(filename))
+
+    try:
+        with open(filename, mode="r") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        easyb.log.error("Unable to read table {0:s}".format(filename))
+        easyb.log.exception(e)
+        return None
+
+    if isinstance(data, list) is False:
+        easyb.log.error("Table is not a list: {0:s}".format(filename))
+        return None
+    return data
+
+
 class Config(object):
+    """Error and unit tables of the devices.
+
+    The built-in tables and their indexes are created once and shared by all instances. Tables loaded from
+    JSON files are placed in front of the built-in entries, so their codes take precedence.
+    """
+
+    def __init__(self, **kwargs):
+        _load_defaults()
 
-    def __init__(self):
-        self.error: List[Error] = []
-        self.units: List[Unit] = []
+        self.error: List[Error] = _default_error
+        self.units: List[Unit] = _default_units
 
-        for item in _error:
-            self.error.append(Error(item))
+        self._error_index: Dict[int, Error] = _default_error_index
+        self._units_index: Dict[int, Unit] = _default_units_index
 
-        for item in _units:
-            self.units.append(Unit(item))
+        item = kwargs.get("errors", "")
+        if item != "":
+            self.load_errors(item)
+
+        item = kwargs.get("units", "")
+        if item != "":
+            self.load_units(item)
         return
 
+    def load_errors(self, filename: str) -> bool:
+        """Load an error table, a JSON list of objects with code and text.
+
+        :return: True if the table is loaded, otherwise False.
+        :rtype: bool
+        """
+        data = _read_table(filename)
+        if data is None:
+            return False
+
+        try:
+            items = [Error(item) for item in data]
+        except ValueError as e:
+            easyb.log.exception(e)
+            return False
+
+        self.error = items + self.error
+        self._error_index = _create_index(self.error)
+        return True
+
+    def load_units(self, filename: str) -> bool:
+        """Load a unit table, a JSON list of objects with code and value.
+
+        :return: True if the table is loaded, otherwise False.
+        :rtype: bool
+        """
+        data = _read_table(filename)
+        if data is None:
+            return False
+
+        try:
+            items = [Unit(item) for item in data]
+        except ValueError as e:
+            easyb.log.exception(e)
+            return False
+
+        self.units = items + self.units
+        self._units_index = _create_index(self.units)
+        return True
+
     def get_error(self, code: int) -> Union[None, Error]:
-        for item in self.error:
-            if item.code == code:
-                return item
-        return None
+        item = self._error_index.get(code, None)
+        return item
 
     def get_unit(self, code: int) -> Union[None, Unit]:
-        for item in self.units:
-            if item.code == code:
-                return item
-        return None
+        item = self._units_index.get(code, None)
+        return item
 
     @staticmethod
     def create_status(status_list: List[Status]):
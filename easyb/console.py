@@ -27,6 +27,7 @@ import easyb.devices
 from optparse import OptionParser, OptionGroup
 
 from easyb.device import Device
+from easyb.engine import Engine
 from easyb.devices import get_device, get_devices
 
 __all__ = [
@@ -44,6 +45,10 @@ class Console(object):
     def device(self) -> Device:
         return self._device
 
+    @property
+    def engine(self) -> Engine:
+        return self._engine
+
     def __init__(self):
 
         self.options = None
@@ -57,10 +62,13 @@ class Console(object):
         parser.add_option("-l", "--list", help="list device and commands", action="store_true", default=False)
         parser.add_option("-i", "--interval", help="interval between measurements for read mode (in seconds)",
                           metavar="2.0", type="float", default=2.0)
+        parser.add_option("-C", "--config", help="read continuously from ports and devices in config file",
+                          metavar="rig.json", type="string", default="")
 
         device = OptionGroup(parser, "Device Options", "Set device type, command or address to use.")
         device.add_option("-d", "--device", help="use device", type="string", default="")
         device.add_option("-c", "--command", help="run command", metavar="0", type="int", default=None)
+        device.add_option("-a", "--address", help="device address on the bus", metavar="1", type="int", default=1)
 
         parser.add_option_group(device)
 
@@ -70,12 +78,16 @@ class Console(object):
         serial.add_option("-t", "--timeout", help="serial port timeout (in seconds)", metavar="2", type="int",
                           default=2)
         serial.add_option("-w", "--writetimeout", help="serial port write timeout", metavar="2", type="int", default=2)
+        serial.add_option("-s", "--response", help="read the response as soon as it arrives instead of waiting",
+                          action="store_true", default=False)
+        serial.add_option("-R", "--raw", help="capture raw responses in read mode and decode them at the end",
+                          action="store_true", default=False)
 
         parser.add_option_group(serial)
 
         output = OptionGroup(parser, "Output Options", "Set output to file.")
-        serial.add_option("-o", "--output", help="output type", metavar="excel/text", type="string",
-                          default="none")
+        serial.add_option("-o", "--output", help="output type", metavar="excel/text/binary/parquet/sqlite",
+                          type="string", default="none")
         serial.add_option("-f", "--filename", help="filename for output", metavar="measurement", type="string",
                           default="measurement")
 
@@ -84,12 +96,16 @@ class Console(object):
         self._parser = parser
 
         self._device = None
+        self._engine = None
         return
 
     def _check_params(self) -> bool:
         if self.options.list is True:
             return True
 
+        if self.options.config != "":
+            return True
+
         if self.options.device == "":
             easyb.log.error("No device given!")
             return False
@@ -165,14 +181,20 @@ class Console(object):
             self._list_commands()
             return True
 
+        if self.options.config != "":
+            check = self._prepare_engine()
+            return check
+
         c = get_device(self.options.device)
         if c is None:
             easyb.log.error("Unable to find device {0:s}".format(self.options.device))
             return False
 
         # noinspection PyCallingNonCallable
-        self._device = c(address=1, port=self.options.port, baudrate=self.options.baudrate,
-                         timeout=self.options.timeout, write_timeout=self.options.writetimeout)
+        self._device = c(address=self.options.address, port=self.options.port, baudrate=self.options.baudrate,
+                         timeout=self.options.timeout, write_timeout=self.options.writetimeout,
+                         response_driven=self.options.response, interval=self.options.interval,
+                         capture=self.options.raw)
 
         if self.options.read is False:
             if self.options.command not in self.device.command_list:
@@ -192,6 +214,51 @@ class Console(object):
         check = self.device.prepare()
         return check
 
+    def _prepare_engine(self) -> bool:
+        engine = Engine()
+
+        check = engine.load(self.options.config)
+        if check is False:
+            return False
+
+        self._engine = engine
+
+        engine.setup()
+
+        check = engine.connect()
+        if check is False:
+            return False
+
+        check = engine.prepare()
+        return check
+
+    def _run_engine(self) -> bool:
+        if self.options.output != "none":
+            check = self.engine.open(self.options.output, self.options.filename)
+            if check is False:
+                return False
+
+        try:
+            signal.signal(signal.SIGINT, self.engine.do_abort)
+        except ValueError:
+            pass
+
+        check = self.engine.run()
+        return check
+
+    def _close_engine(self) -> bool:
+        result = self.engine.close()
+
+        self.engine.disconnect()
+
+        # the storages opened for streaming are only closed by store, so it runs even if closing failed
+        if self.options.output != "none":
+            check = self.engine.store(self.options.output, self.options.filename)
+            if check is False:
+                result = False
+
+        return result
+
     def run_command(self, command: int) -> bool:
         command_item = self.device.get_command(command)
         easyb.log.inform("Command", "{0:d}: {1:s}".format(command_item.number, command_item.name))
@@ -201,6 +268,11 @@ class Console(object):
 
     def run_continuously(self) -> bool:
 
+        if self.options.output != "none":
+            check = self.device.open_storage(self.options.output, self.options.filename)
+            if check is False:
+                return False
+
         try:
             signal.signal(signal.SIGINT, self.device.do_abort)
         except ValueError:
@@ -231,6 +303,10 @@ class Console(object):
         if self.options.list is True:
             return True
 
+        if self.engine is not None:
+            check = self._run_engine()
+            return check
+
         easyb.log.inform("Port", self.options.port)
         easyb.log.inform("Device", self.options.device)
 
@@ -250,22 +326,23 @@ class Console(object):
         if self.options.list is True:
             return True
 
+        if self.engine is not None:
+            check = self._close_engine()
+            return check
+
         if self.options.read is False:
             if self.device is not None:
                 self.device.disconnect()
             return True
 
-        check = self.device.close()
-        if check is False:
-            return False
+        result = self.device.close()
 
-        if self.device is not None:
-            self.device.disconnect()
+        self.device.disconnect()
 
+        # the storage opened for streaming is only closed by store, so it runs even if closing failed
         if self.options.output != "none":
-
             check = self.device.store(self.options.output, self.options.filename)
-            if check is False:  # pragma: no cover
-                return False
+            if check is False:
+                result = False
 
-        return True
+        return result
@@ -19,23 +19,37 @@ import easyb
 
 from datetime import datetime
 
-from typing import Any, List
+from typing import Any, List, Union
 
 __all__ = [
+    "arrow",
     "base",
+    "binary",
     "excel",
+    "sqlite",
 
     "Data"
 ]
 
 __storage__ = [
-    "excel"
+    "arrow",
+    "binary",
+    "excel",
+    "sqlite"
 ]
 
 
-from easyb.data.base import Type, Column, Row, Collection, FormatInfo
+from easyb.data.base import Type, Column, Row, Collection, FormatInfo, Storage, to_epoch
 from bbutil.utils import get_attribute
 
+_defaults = {
+    Type.datetime: 0,
+    Type.bool: False,
+    Type.float: 0.0,
+    Type.integer: 0,
+    Type.string: ""
+}
+
 
 class Data(Collection):
 
@@ -44,15 +58,27 @@ class Data(Collection):
 
         self.format: List[FormatInfo] = [
             FormatInfo("excel", "easyb.data.excel", "ExcelStorage"),
-            FormatInfo("text", "easyb.data.text", "TextStorage")
+            FormatInfo("text", "easyb.data.text", "TextStorage"),
+            FormatInfo("binary", "easyb.data.binary", "BinaryStorage"),
+            FormatInfo("parquet", "easyb.data.arrow", "ParquetStorage"),
+            FormatInfo("sqlite", "easyb.data.sqlite", "SqliteStorage")
         ]
 
         self.counter: int = 0
+        self.stored: int = 0
+
+        # noinspection PyTypeChecker
+        self.storage: Storage = None
         return
 
     @property
     def len(self) -> int:
-        result = len(self.rows)
+        result = self.size
+        return result
+
+    @property
+    def total(self) -> int:
+        result = self.stored + self.size
         return result
 
     def get_column(self, name: str) -> Column:
@@ -76,44 +102,37 @@ class Data(Collection):
 
         column = Column(self.counter, name, desc, column_type)
         self.columns.append(column)
+        self.add_values(column)
 
         self.counter += 1
         return True
 
-    def create_row(self) -> Any:
-        key_list = []
-        value_list = []
+    def create_row(self, timestamp: int = None) -> Any:
+        """Append a row with default values, datetime columns get timestamp (epoch microseconds) or now.
 
+        :return: the new row or None if a column type is unknown.
+        :rtype: Any
+        """
         for column in self.columns:
-            key_list.append(column.name)
-
-            value = None
-
-            if column.type is Type.datetime:
-                value = datetime.now()
-
-            if column.type is Type.bool:
-                value = False
-
-            if column.type is Type.float:
-                value = 0.0
-
-            if column.type is Type.integer:
-                value = 0
+            if column.type not in _defaults:  # pragma: no cover
+                return None
 
-            if column.type is Type.string:
-                value = ""
+        if timestamp is None:
+            timestamp = to_epoch(datetime.now())
 
-            if value is None:  # pragma: no cover
-                return None
+        for column in self.columns:
+            values = self.values[column.name]
 
-            value_list.append(value)
+            if column.type is Type.datetime:
+                values.append(timestamp)
+            else:
+                values.append(_defaults[column.type])
 
-        row = Row(key_list, value_list)
-        self.rows.append(row)
+        row = Row(self, self.size)
+        self.size += 1
         return row
 
-    def store(self, file_type: str, filename: str) -> bool:
+    def _create_storage(self, file_type: str, filename: str) -> Union[None, Storage]:
 
         if filename == "":
             raise ValueError("Filename is missing!")
@@ -127,7 +146,7 @@ class Data(Collection):
 
         if info is None:
             easyb.log.error("Unable to find storge format: {0:s}".format(file_type))
-            return False
+            return None
 
         easyb.log.inform("Data", "Open {0:s}".format(info.name))
 
@@ -135,5 +154,66 @@ class Data(Collection):
         self.filename = filename
 
         storage = c(self)
+        return storage
+
+    def store(self, file_type: str, filename: str) -> bool:
+        storage = self._create_storage(file_type, filename)
+        if storage is None:
+            return False
+
         check = storage.store()
         return check
+
+    def open(self, file_type: str, filename: str) -> bool:
+        """Open a storage to stream rows to while measuring.
+
+        :return: True if the storage is open, otherwise False.
+        :rtype: bool
+        """
+        storage = self._create_storage(file_type, filename)
+        if storage is None:
+            return False
+
+        check = storage.open()
+        if check is False:
+            return False
+
+        self.storage = storage
+        return True
+
+    def flush(self) -> bool:
+        """Write pending rows to the open storage and release them from memory.
+
+        :return: True on success, otherwise False.
+        :rtype: bool
+        """
+        if self.storage is None:
+            return False
+
+        if self.size > 0:
+            check = self.storage.append()
+            if check is False:
+                return False
+
+            self.stored += self.size
+            self.clear()
+
+        check = self.storage.flush()
+        return check
+
+    def close(self) -> bool:
+        """Flush pending rows, write infos and status and close the storage.
+
+        :return: True on success, otherwise False.
+        :rtype: bool
+        """
+        if self.storage is None:
+            return False
+
+        check = self.flush()
+        if check is False:
+            return False
+
+        check = self.storage.close()
+        self.storage = None
+        return check
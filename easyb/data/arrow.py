@@ -0,0 +1,181 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import json
+import easyb
+
+from typing import List, Tuple
+
+from easyb.data.base import Storage, Type, Column, Collection, Info, encode_info, decode_info
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+__all__ = [
+    "ParquetStorage",
+    "read_infos"
+]
+
+_types = {}
+
+if pyarrow is not None:
+    _types = {
+        Type.datetime: pyarrow.timestamp("us"),
+        Type.integer: pyarrow.int64(),
+        Type.float: pyarrow.float64(),
+        Type.string: pyarrow.string(),
+        Type.bool: pyarrow.bool_()
+    }
+
+
+def read_infos(filename: str) -> Tuple[List[Info], List[Info]]:
+    """Read infos and status from the key value metadata of a parquet file.
+
+    :return: infos and status.
+    :rtype: Tuple[List[Info], List[Info]]
+    """
+    metadata = pyarrow.parquet.ParquetFile(filename).metadata.metadata
+    if metadata is None:
+        return [], []
+
+    infos = [decode_info(item) for item in json.loads(metadata.get(b"easyb.infos", b"[]"))]
+    status = [decode_info(item) for item in json.loads(metadata.get(b"easyb.status", b"[]"))]
+    return infos, status
+
+
+class ParquetStorage(Storage):
+    """Parquet file with one typed column per data column.
+
+    Appended rows are collected until row_group_size rows are pending and then written as one row group,
+    infos and status are stored as key value metadata when the file is closed.
+    """
+
+    # noinspection PyTypeChecker
+    def __init__(self, data: Collection):
+        self.writer: "pyarrow.parquet.ParquetWriter" = None
+        self.schema: "pyarrow.Schema" = None
+        self.batches: List["pyarrow.RecordBatch"] = []
+        self.pending: int = 0
+        self.row_group_size: int = 65536
+        self.row: int = 0
+
+        Storage.__init__(self, "PARQUET", data)
+        return
+
+    def _prepare(self) -> bool:
+        if pyarrow is None:
+            easyb.log.error("Parquet output needs pyarrow, please install it!")
+            return False
+
+        filename = os.path.abspath(os.path.normpath(self.data.filename + ".parquet"))
+        easyb.log.inform(self.name, "Open {0:s}".format(filename))
+
+        fields = [pyarrow.field(column.name, _types[column.type]) for column in self.data.columns]
+        self.schema = pyarrow.schema(fields)
+
+        try:
+            self.writer = pyarrow.parquet.ParquetWriter(filename, self.schema)
+        except OSError as e:
+            easyb.log.exception(e)
+            return False
+        return True
+
+    def _create_array(self, column: Column) -> "pyarrow.Array":
+        values = self.data.values[column.name]
+        data_type = _types[column.type]
+
+        if column.type is Type.bool:
+            return pyarrow.array([value != 0 for value in values], type=data_type)
+
+        if column.type is Type.string:
+            return pyarrow.array(values, type=data_type)
+
+        # datetime, integer and float columns are typed arrays with the same memory layout
+        array = pyarrow.Array.from_buffers(data_type, len(values), [None, pyarrow.py_buffer(values.tobytes())])
+        return array
+
+    def _write_batches(self):
+        if self.pending == 0:
+            return
+
+        table = pyarrow.Table.from_batches(self.batches, schema=self.schema)
+        self.writer.write_table(table, row_group_size=self.row_group_size)
+
+        self.row += self.pending
+        self.batches = []
+        self.pending = 0
+        return
+
+    def store(self) -> bool:
+        check = self.open()
+        if check is False:
+            return False
+
+        self.append()
+
+        check = self.close()
+        return check
+
+    def open(self) -> bool:
+        check = self._prepare()
+        return check
+
+    def append(self) -> bool:
+        if self.writer is None:
+            return False
+
+        if self.data.size == 0:
+            return True
+
+        arrays = [self._create_array(column) for column in self.data.columns]
+        batch = pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+        self.batches.append(batch)
+        self.pending += batch.num_rows
+
+        if self.pending >= self.row_group_size:
+            self._write_batches()
+        return True
+
+    def flush(self) -> bool:
+        # rows stay pending until a row group is full, parquet is only readable after close anyway
+        if self.writer is None:
+            return False
+        return True
+
+    def close(self) -> bool:
+        if self.writer is None:
+            return False
+
+        self._write_batches()
+
+        metadata = {
+            "easyb.infos": json.dumps([encode_info(item) for item in self.data.infos]),
+            "easyb.status": json.dumps([encode_info(item) for item in self.data.status])
+        }
+
+        self.writer.add_key_value_metadata(metadata)
+
+        easyb.log.inform(self.name, "Write number of rows {0:d}".format(self.row))
+        self.writer.close()
+        self.writer = None
+        return True
@@ -17,7 +17,9 @@
 
 import abc
 
-from typing import List, Any
+from array import array
+from datetime import datetime, timedelta
+from typing import List, Any, Dict, Iterator, Union
 
 from enum import Enum
 from abc import ABCMeta
@@ -28,7 +30,13 @@ __all__ = [
     "Column",
     "convert_data",
     "Info",
+    "encode_info",
+    "decode_info",
+    "to_epoch",
+    "from_epoch",
+    "create_array",
     "Row",
+    "Rows",
     "Collection",
     "Storage"
 ]
@@ -96,24 +104,242 @@ class Info(object):
         return
 
 
+_epoch = datetime(1970, 1, 1)
+_microsecond = timedelta(microseconds=1)
+
+_typecodes = {
+    Type.datetime: "q",
+    Type.integer: "q",
+    Type.float: "d",
+    Type.bool: "b"
+}
+
+
+_converters = {
+    Type.integer: round,
+    Type.float: float,
+    Type.bool: bool,
+    Type.string: str
+}
+
+
+def to_epoch(value: datetime) -> int:
+    """Convert a naive datetime to microseconds since the epoch.
+
+    :return: microseconds since 1970-01-01.
+    :rtype: int
+    """
+    result = (value - _epoch) // _microsecond
+    return result
+
+
+def from_epoch(value: int) -> datetime:
+    """Convert microseconds since the epoch back to a naive datetime.
+
+    :return: datetime.
+    :rtype: datetime
+    """
+    result = _epoch + timedelta(microseconds=value)
+    return result
+
+
+def create_array(column_type: Type) -> Union[array, list]:
+    """Create an empty column for the given type, strings are kept in a plain list.
+
+    :return: typed array or list.
+    :rtype: Union[array, list]
+    """
+    typecode = _typecodes.get(column_type, None)
+
+    if typecode is None:
+        return []
+
+    result = array(typecode)
+    return result
+
+
+def encode_info(item: Info) -> List[Any]:
+    """Convert an info to a JSON compatible list, datetimes and durations become tagged microseconds.
+
+    :return: name, type value and value.
+    :rtype: List[Any]
+    """
+    value = item.value
+
+    if isinstance(value, timedelta):
+        value = ["timedelta", value // _microsecond]
+    elif isinstance(value, datetime):
+        value = ["datetime", to_epoch(value)]
+
+    result = [item.name, item.type.value, value]
+    return result
+
+
+def decode_info(item: List[Any]) -> Info:
+    """Create an info from a list written by encode_info.
+
+    :return: info.
+    :rtype: Info
+    """
+    (name, type_value, value) = item
+
+    if isinstance(value, list):
+        if value[0] == "timedelta":
+            value = timedelta(microseconds=value[1])
+        else:
+            value = from_epoch(value[1])
+
+    info = Info(name, Type(type_value), value)
+    return info
+
+
 class Row(object):
+    """View on a single row of a collection, attributes read and write the column arrays.
+
+    A row is only valid until the collection is cleared, e.g. by flushing to a storage. Using it
+    afterwards raises an IndexError.
+    """
+
+    __slots__ = ["_data", "_index", "_generation"]
+
+    def __init__(self, data: "Collection", index: int):
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_index", index)
+        object.__setattr__(self, "_generation", data.generation)
+        return
+
+    def _check(self):
+        if self._generation != self._data.generation:
+            raise IndexError("Row is no longer valid, data was cleared!")
+        return
+
+    def __getattr__(self, name: str) -> Any:
+        data = object.__getattribute__(self, "_data")
+        index = object.__getattribute__(self, "_index")
+        self._check()
+
+        try:
+            value = data.get_value(name, index)
+        except KeyError:
+            raise AttributeError(name)
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        self._check()
+
+        try:
+            self._data.set_value(name, self._index, value)
+        except KeyError:
+            raise AttributeError(name)
+        return
 
-    def __init__(self, keys, values):
-        for (key, value) in zip(keys, values):
-            self.__dict__[key] = value
+
+class Rows(object):
+    """Sequence of row views over a collection."""
+
+    def __init__(self, data: "Collection"):
+        self.data: Collection = data
+        return
+
+    def __len__(self) -> int:
+        return self.data.size
+
+    def __getitem__(self, index: int) -> Row:
+        size = self.data.size
+
+        if index < 0:
+            index += size
+
+        if (index < 0) or (index >= size):
+            raise IndexError("Row index out of range!")
+
+        row = Row(self.data, index)
+        return row
+
+    def __iter__(self) -> Iterator[Row]:
+        for index in range(self.data.size):
+            yield Row(self.data, index)
         return
 
 
 class Collection(object):
 
     def __init__(self):
-        self.rows: List[Row] = []
         self.columns: List[Column] = []
+        self.values: Dict[str, Union[array, list]] = {}
+        self.lookup: Dict[str, Column] = {}
+        self.size: int = 0
+        self.generation: int = 0
         self.infos: List[Info] = []
         self.status: List[Info] = []
         self.filename: str = ""
         return
 
+    @property
+    def rows(self) -> Rows:
+        rows = Rows(self)
+        return rows
+
+    def add_values(self, column: Column):
+        values = create_array(column.type)
+
+        if self.size > 0:
+            default = 0
+            if column.type is Type.string:
+                default = ""
+            if column.type is Type.datetime:
+                default = to_epoch(datetime.now())
+            values.extend([default] * self.size)
+
+        self.values[column.name] = values
+        self.lookup[column.name] = column
+        return
+
+    def get_value(self, name: str, index: int) -> Any:
+        column_type = self.get_type(name)
+        value = self.values[name][index]
+
+        if column_type is Type.datetime:
+            return from_epoch(value)
+
+        if column_type is Type.bool:
+            return value != 0
+
+        return value
+
+    def set_value(self, name: str, index: int, value: Any):
+        """Set a value converted to the column type, None sets the column default.
+
+        :raises ValueError: or TypeError if the value cannot be converted.
+        """
+        column_type = self.get_type(name)
+
+        if value is None:
+            value = 0
+            if column_type is Type.string:
+                value = ""
+        elif column_type is Type.datetime:
+            if isinstance(value, datetime):
+                value = to_epoch(value)
+            else:
+                value = int(value)
+        else:
+            value = _converters[column_type](value)
+
+        self.values[name][index] = value
+        return
+
+    def get_type(self, name: str) -> Type:
+        column = self.lookup[name]
+        return column.type
+
+    def clear(self):
+        for column in self.columns:
+            self.values[column.name] = create_array(column.type)
+        self.size = 0
+        self.generation += 1
+        return
+
 
 class Storage(metaclass=ABCMeta):
 
@@ -125,3 +351,23 @@ class Storage(metaclass=ABCMeta):
     @abc.abstractmethod
     def store(self) -> bool:  # pragma: no cover
         return True
+
+    @abc.abstractmethod
+    def open(self) -> bool:  # pragma: no cover
+        """Open the file and write the column header for streaming."""
+        return True
+
+    @abc.abstractmethod
+    def append(self) -> bool:  # pragma: no cover
+        """Write all rows currently held by the collection."""
+        return True
+
+    @abc.abstractmethod
+    def flush(self) -> bool:  # pragma: no cover
+        """Push written rows to disk."""
+        return True
+
+    @abc.abstractmethod
+    def close(self) -> bool:  # pragma: no cover
+        """Write infos and status and close the file."""
+        return True
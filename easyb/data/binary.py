@@ -0,0 +1,379 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import json
+import mmap
+import struct
+import easyb
+
+from array import array
+from io import FileIO
+from typing import List, Union
+
+from easyb.data.base import Storage, Collection, Column, Info, Type, create_array, encode_info, decode_info
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = [
+    "MAGIC",
+    "VERSION",
+    "BinaryStorage",
+    "BinaryReader"
+]
+
+MAGIC = b"EASYBDAT"
+VERSION = 1
+
+#: magic, version, number of columns, record size, data offset, trailer offset
+_header = struct.Struct("<8sHHIQQ")
+_column = struct.Struct("<BHHH")
+
+_trailer_position = 24
+
+_fields = {
+    Type.datetime: "q",
+    Type.integer: "q",
+    Type.float: "d",
+    Type.bool: "?"
+}
+
+_dtypes = {
+    Type.datetime: "<i8",
+    Type.integer: "<i8",
+    Type.float: "<f8",
+    Type.bool: "?"
+}
+
+
+def _get_field(column_type: Type, width: int) -> str:
+    field = _fields.get(column_type, None)
+    if field is None:
+        field = "{0:d}s".format(width)
+    return field
+
+
+def _truncate(value: bytes, width: int) -> bytes:
+    """Cut UTF-8 bytes to width without splitting a multibyte character."""
+    return value[:width].decode("utf-8", "ignore").encode("utf-8")
+
+
+def _decode(value: bytes) -> str:
+    return value.rstrip(b"\x00").decode("utf-8", "replace")
+
+
+class BinaryStorage(Storage):
+    """Append-only file with one fixed-width little-endian record per row.
+
+    String columns are null padded UTF-8, their width is string_size or the longest value present when
+    the file is opened. Longer values appended later are cut on a character boundary. Infos and status are
+    written as JSON trailer on close, its offset is patched into the header so that files of an
+    interrupted measurement can still be read up to the last complete record.
+    """
+
+    # noinspection PyTypeChecker
+    def __init__(self, data: Collection):
+        self.file: FileIO = None
+        self.filename: str = ""
+        self.string_size: int = 64
+        self.widths: List[int] = []
+        self.chunk_size: int = 10000
+        self.record: struct.Struct = None
+        self.row: int = 0
+
+        Storage.__init__(self, "BINARY", data)
+        return
+
+    def _prepare(self) -> bool:
+        self.filename = os.path.abspath(os.path.normpath(self.data.filename + ".ebd"))
+        easyb.log.inform(self.name, "Open {0:s}".format(self.filename))
+        try:
+            self.file = open(self.filename, mode="wb")
+        except OSError as e:
+            easyb.log.exception(e)
+            return False
+        return True
+
+    def _get_width(self, column: Column) -> int:
+        if column.type is not Type.string:
+            return 0
+
+        width = self.string_size
+        for value in self.data.values[column.name]:
+            width = max(width, len(value.encode("utf-8")))
+        return width
+
+    def _write_header(self):
+        fields = "<"
+        columns = b""
+
+        self.widths = []
+        for column in self.data.columns:
+            width = self._get_width(column)
+            self.widths.append(width)
+
+            fields += _get_field(column.type, width)
+
+            name = column.name.encode("utf-8")
+            desc = column.description.encode("utf-8")
+            columns += _column.pack(column.type.value, width, len(name), len(desc)) + name + desc
+
+        self.record = struct.Struct(fields)
+
+        offset = _header.size + len(columns)
+        offset += (-offset) % 8
+
+        header = _header.pack(MAGIC, VERSION, len(self.data.columns), self.record.size, offset, 0)
+        padding = bytes(offset - _header.size - len(columns))
+
+        self.file.write(header + columns + padding)
+        return
+
+    def _write_rows(self):
+        columns = []
+        truncated = 0
+
+        for (column, width) in zip(self.data.columns, self.widths):
+            values = self.data.values[column.name]
+
+            if column.type is Type.string:
+                values = [value.encode("utf-8") for value in values]
+                for (index, value) in enumerate(values):
+                    if len(value) > width:
+                        values[index] = _truncate(value, width)
+                        truncated += 1
+
+            columns.append(values)
+
+        if truncated > 0:
+            easyb.log.warn(self.name, "Truncated {0:d} strings to column width".format(truncated))
+
+        pack = self.record.pack
+        size = self.data.size
+
+        for start in range(0, size, self.chunk_size):
+            end = min(start + self.chunk_size, size)
+            items = [values[start:end] for values in columns]
+            self.file.write(b"".join([pack(*values) for values in zip(*items)]))
+
+        self.row += size
+        return
+
+    def _write_trailer(self):
+        trailer = {
+            "infos": [encode_info(item) for item in self.data.infos],
+            "status": [encode_info(item) for item in self.data.status]
+        }
+
+        offset = self.file.tell()
+        self.file.write(json.dumps(trailer).encode("utf-8"))
+
+        self.file.seek(_trailer_position)
+        self.file.write(struct.pack("<Q", offset))
+        return
+
+    def store(self) -> bool:
+        check = self.open()
+        if check is False:
+            return False
+
+        self.append()
+
+        check = self.close()
+        return check
+
+    def open(self) -> bool:
+        check = self._prepare()
+        if check is False:
+            return False
+
+        self._write_header()
+        return True
+
+    def append(self) -> bool:
+        if self.file is None:
+            return False
+
+        self._write_rows()
+        return True
+
+    def flush(self) -> bool:
+        if self.file is None:
+            return False
+
+        self.file.flush()
+        return True
+
+    def close(self) -> bool:
+        if self.file is None:
+            return False
+
+        self._write_trailer()
+
+        easyb.log.inform(self.name, "Write number of rows {0:d}".format(self.row))
+        self.file.close()
+        self.file = None
+        return True
+
+
+class BinaryReader(object):
+    """Memory mapped reader for files written by BinaryStorage.
+
+    Columns are returned as zero-copy numpy views into the mapping when numpy is available, otherwise
+    they are unpacked into typed arrays. String columns are always decoded into a list of str. Drop all
+    column references before calling close.
+    """
+
+    # noinspection PyTypeChecker
+    def __init__(self, filename: str):
+        self.filename: str = filename
+        self.file: FileIO = None
+        self.map: mmap.mmap = None
+        self.columns: List[Column] = []
+        self.infos: List[Info] = []
+        self.status: List[Info] = []
+        self.record: struct.Struct = None
+        self.offset: int = 0
+        self.rows: int = 0
+        self._widths: List[int] = []
+        return
+
+    @property
+    def len(self) -> int:
+        return self.rows
+
+    def _read_columns(self, number: int):
+        position = _header.size
+        fields = "<"
+
+        for index in range(number):
+            (type_value, width, name_size, desc_size) = _column.unpack_from(self.map, position)
+            position += _column.size
+
+            name = bytes(self.map[position:position + name_size]).decode("utf-8")
+            position += name_size
+
+            desc = bytes(self.map[position:position + desc_size]).decode("utf-8")
+            position += desc_size
+
+            column_type = Type(type_value)
+            self.columns.append(Column(index, name, desc, column_type))
+            self._widths.append(width)
+            fields += _get_field(column_type, width)
+
+        self.record = struct.Struct(fields)
+        return
+
+    def _read_trailer(self, position: int):
+        trailer = json.loads(bytes(self.map[position:]).decode("utf-8"))
+
+        self.infos = [decode_info(item) for item in trailer["infos"]]
+        self.status = [decode_info(item) for item in trailer["status"]]
+        return
+
+    def open(self) -> bool:
+        try:
+            self.file = open(self.filename, mode="rb")
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            easyb.log.exception(e)
+            self.close()
+            return False
+
+        if len(self.map) < _header.size:
+            easyb.log.error("File is too short: {0:s}".format(self.filename))
+            self.close()
+            return False
+
+        (magic, version, number, size, offset, trailer) = _header.unpack_from(self.map, 0)
+
+        if (magic != MAGIC) or (version != VERSION):
+            easyb.log.error("Unknown file format: {0:s}".format(self.filename))
+            self.close()
+            return False
+
+        self._read_columns(number)
+        self.offset = offset
+
+        end = len(self.map)
+        if trailer != 0:
+            end = trailer
+            self._read_trailer(trailer)
+
+        self.rows = (end - offset) // size
+        return True
+
+    def get_column(self, name: str) -> Union["numpy.ndarray", array, list]:
+        """Get the values of a column, datetimes are epoch microseconds.
+
+        :return: numpy view or typed array, list of str for strings.
+        """
+        column = None
+        for item in self.columns:
+            if item.name == name:
+                column = item
+
+        if column is None:
+            raise ValueError("Column {0:s} not found!".format(name))
+
+        if numpy is None:  # pragma: no cover
+            return self._get_column_python(column)
+
+        values = self._get_records()[name]
+        if column.type is Type.string:
+            return [_decode(item) for item in values]
+        return values
+
+    def _get_records(self) -> "numpy.ndarray":
+        formats = []
+        for (column, width) in zip(self.columns, self._widths):
+            dtype = _dtypes.get(column.type, "S{0:d}".format(width))
+            formats.append((column.name, dtype))
+
+        records = numpy.frombuffer(self.map, dtype=numpy.dtype(formats), count=self.rows, offset=self.offset)
+        return records
+
+    def _get_column_python(self, column: Column) -> Union[array, list]:
+        values = create_array(column.type)
+        end = self.offset + self.rows * self.record.size
+        view = memoryview(self.map)[self.offset:end]
+
+        index = column.index
+        if column.type is Type.string:
+            values.extend(_decode(item[index]) for item in self.record.iter_unpack(view))
+        else:
+            values.extend(item[index] for item in self.record.iter_unpack(view))
+
+        view.release()
+        return values
+
+    def close(self):
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                easyb.log.warn("BINARY", "Column views are still in use, mapping stays open")
+            self.map = None
+
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        return
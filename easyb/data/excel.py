@@ -17,9 +17,9 @@
 
 import os
 import easyb
-from typing import Any
+from typing import Any, Dict, List, Tuple, Callable
 
-from easyb.data.base import Storage, Type, Collection
+from easyb.data.base import Storage, Type, Collection, from_epoch
 import xlsxwriter
 
 __all__ = [
@@ -34,6 +34,9 @@ class ExcelStorage(Storage):
         self.workbook: xlsxwriter.Workbook = None
         self.info_sheet: xlsxwriter.workbook.Worksheet = None
         self.data_sheet: xlsxwriter.workbook.Worksheet = None
+        self.header_format: xlsxwriter.workbook.Format = None
+        self.name_format: xlsxwriter.workbook.Format = None
+        self.formats: Dict[Type, xlsxwriter.workbook.Format] = {}
         self.row: int = 0
 
         Storage.__init__(self, "EXCEL", data)
@@ -46,17 +49,40 @@ class ExcelStorage(Storage):
         self.workbook = xlsxwriter.Workbook(self.data.filename, {'constant_memory': True})
         self.info_sheet = self.workbook.add_worksheet("Information")
         self.data_sheet = self.workbook.add_worksheet("Data")
+        self._create_formats()
         return
 
-    def _create_header(self):
-        cell_format = self.workbook.add_format()
-        cell_format.set_bottom(5)
-        cell_format.set_font_name("Arial")
-        cell_format.set_font_size(10)
-        cell_format.set_bold()
+    def _create_formats(self):
+        self.header_format = self.workbook.add_format()
+        self.header_format.set_bottom(5)
+        self.header_format.set_font_name("Arial")
+        self.header_format.set_font_size(10)
+        self.header_format.set_bold()
+
+        self.name_format = self.workbook.add_format()
+        self.name_format.set_font_name("Arial")
+        self.name_format.set_font_size(10)
+        self.name_format.set_bold()
+
+        self.formats = {}
+
+        for data_type in Type:
+            cell_format = self.workbook.add_format()
+            cell_format.set_font_name("Arial")
+            cell_format.set_font_size(10)
+
+            if data_type is Type.datetime:
+                cell_format.set_num_format('hh:mm:ss')
 
+            if data_type is Type.float:
+                cell_format.set_num_format('0.00')
+
+            self.formats[data_type] = cell_format
+        return
+
+    def _create_header(self):
         for column in self.data.columns:
-            self.data_sheet.write_string(self.row, column.index, column.description, cell_format)
+            self.data_sheet.write_string(self.row, column.index, column.description, self.header_format)
 
         self.data_sheet.freeze_panes(1, 0)
         self.row += 1
@@ -86,50 +112,50 @@ class ExcelStorage(Storage):
         return writer
 
     def _write_cell(self, row: int, column: int, data_type: Type, value: Any, writer: Any):
-        cell_format = self.workbook.add_format()
-        cell_format.set_font_name("Arial")
-        cell_format.set_font_size(10)
+        writer(row, column, value, self.formats[data_type])
+        return
 
-        if data_type is Type.datetime:
-            cell_format.set_num_format('hh:mm:ss')
+    def _get_columns(self) -> List[Tuple[int, Any, Callable, Any, Any]]:
+        columns = []
 
-        if data_type is Type.float:
-            cell_format.set_num_format('0.00')
+        for column in self.data.columns:
+            writer = self._get_writer(self.data_sheet, column.type)
+            values = self.data.values[column.name]
 
-        writer(row, column, value, cell_format)
-        return
+            convert = None
+            if column.type is Type.datetime:
+                convert = from_epoch
+
+            if column.type is Type.bool:
+                convert = bool
+
+            columns.append((column.index, values, writer, self.formats[column.type], convert))
+        return columns
 
     def _write_data(self):
-        for row in self.data.rows:
+        columns = self._get_columns()
+
+        for index in range(self.data.size):
+
+            for (column, values, writer, cell_format, convert) in columns:
+                value = values[index]
 
-            for column in self.data.columns:
-                writer = self._get_writer(self.data_sheet, column.type)
-                value = getattr(row, column.name)
+                if convert is not None:
+                    value = convert(value)
 
-                self._write_cell(self.row, column.index, column.type, value, writer)
+                writer(self.row, column, value, cell_format)
             self.row += 1
         return
 
     def _write_infos(self):
-        header = self.workbook.add_format()
-        header.set_bottom(5)
-        header.set_font_name("Arial")
-        header.set_font_size(10)
-        header.set_bold()
-
-        value_text = self.workbook.add_format()
-        value_text.set_font_name("Arial")
-        value_text.set_font_size(10)
-        value_text.set_bold()
-
-        self.info_sheet.write_string(0, 0, "Name", header)
-        self.info_sheet.write_string(0, 1, "Value", header)
+        self.info_sheet.write_string(0, 0, "Name", self.header_format)
+        self.info_sheet.write_string(0, 1, "Value", self.header_format)
 
         row = 1
 
         for item in self.data.infos:
             writer = self._get_writer(self.info_sheet, item.type)
-            self.info_sheet.write_string(row, 0, item.name, value_text)
+            self.info_sheet.write_string(row, 0, item.name, self.name_format)
             self._write_cell(row, 1, item.type, item.value, writer)
             row += 1
 
@@ -137,7 +163,7 @@ class ExcelStorage(Storage):
 
         for item in self.data.status:
             writer = self._get_writer(self.info_sheet, item.type)
-            self.info_sheet.write_string(row, 0, item.name, value_text)
+            self.info_sheet.write_string(row, 0, item.name, self.name_format)
             self._write_cell(row, 1, item.type, item.value, writer)
             row += 1
         return
@@ -154,3 +180,30 @@ class ExcelStorage(Storage):
         self._write_data()
         self._close()
         return True
+
+    def open(self) -> bool:
+        self._prepare()
+        self._create_header()
+        return True
+
+    def append(self) -> bool:
+        if self.workbook is None:
+            return False
+
+        self._write_data()
+        return True
+
+    def flush(self) -> bool:
+        # with constant_memory each finished row is already written to the temporary sheet file
+        if self.workbook is None:
+            return False
+        return True
+
+    def close(self) -> bool:
+        if self.workbook is None:
+            return False
+
+        self._write_infos()
+        self._close()
+        self.workbook = None
+        return True
@@ -0,0 +1,210 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import json
+import sqlite3
+import easyb
+
+from contextlib import closing
+from datetime import datetime
+from typing import List, Tuple, Any
+
+from easyb.data.base import Storage, Type, Collection, Info, to_epoch, encode_info
+
+__all__ = [
+    "SqliteStorage",
+    "query_range"
+]
+
+_types = {
+    Type.datetime: "INTEGER",
+    Type.integer: "INTEGER",
+    Type.float: "REAL",
+    Type.string: "TEXT",
+    Type.bool: "INTEGER"
+}
+
+_schema = [
+    "CREATE TABLE IF NOT EXISTS sessions (id INTEGER PRIMARY KEY, name TEXT, started INTEGER)",
+    "CREATE TABLE IF NOT EXISTS columns (session INTEGER, position INTEGER, name TEXT, description TEXT, "
+    "type INTEGER)",
+    "CREATE TABLE IF NOT EXISTS infos (session INTEGER, position INTEGER, name TEXT, type INTEGER, value TEXT)",
+    "CREATE TABLE IF NOT EXISTS status (session INTEGER, position INTEGER, name TEXT, type INTEGER, value TEXT)"
+]
+
+
+def _quote(name: str) -> str:
+    text = '"{0:s}"'.format(name.replace('"', '""'))
+    return text
+
+
+def query_range(filename: str, session: int, start: datetime, end: datetime) -> List[Tuple[Any, ...]]:
+    """Select the rows of a session with start <= datetime < end, datetimes are epoch microseconds.
+
+    :return: rows ordered by datetime.
+    :rtype: List[Tuple[Any, ...]]
+    """
+    table = _quote("session_{0:d}".format(session))
+    sql = "SELECT * FROM {0:s} WHERE datetime >= ? AND datetime < ? ORDER BY datetime".format(table)
+
+    with closing(sqlite3.connect(filename)) as connection:
+        rows = connection.execute(sql, (to_epoch(start), to_epoch(end))).fetchall()
+    return rows
+
+
+class SqliteStorage(Storage):
+    """SQLite database with one table per measurement session.
+
+    Datetimes are stored as epoch microseconds and indexed, infos and status are kept in side tables
+    keyed by the session id. Several sessions can share one database file.
+    """
+
+    # noinspection PyTypeChecker
+    def __init__(self, data: Collection):
+        self.connection: sqlite3.Connection = None
+        self.session: int = 0
+        self.table: str = ""
+        self.insert: str = ""
+        self.row: int = 0
+
+        Storage.__init__(self, "SQLITE", data)
+        return
+
+    def _prepare(self) -> bool:
+        filename = os.path.abspath(os.path.normpath(self.data.filename + ".sqlite"))
+        easyb.log.inform(self.name, "Open {0:s}".format(filename))
+
+        try:
+            self.connection = sqlite3.connect(filename)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+
+            for sql in _schema:
+                self.connection.execute(sql)
+        except sqlite3.Error as e:
+            easyb.log.exception(e)
+            self.connection = None
+            return False
+        return True
+
+    def _create_session(self) -> bool:
+        try:
+            self._create_tables()
+        except sqlite3.Error as e:
+            easyb.log.exception(e)
+            self.connection.close()
+            self.connection = None
+            return False
+
+        easyb.log.inform(self.name, "Session {0:d}".format(self.session))
+        return True
+
+    def _create_tables(self):
+        cursor = self.connection.execute("INSERT INTO sessions (name, started) VALUES (?, ?)",
+                                         (os.path.basename(self.data.filename), to_epoch(datetime.now())))
+        self.session = cursor.lastrowid
+        self.table = "session_{0:d}".format(self.session)
+
+        definitions = []
+        names = []
+
+        for column in self.data.columns:
+            definitions.append("{0:s} {1:s}".format(_quote(column.name), _types[column.type]))
+            names.append(_quote(column.name))
+
+            self.connection.execute("INSERT INTO columns VALUES (?, ?, ?, ?, ?)",
+                                    (self.session, column.index, column.name, column.description,
+                                     column.type.value))
+
+        self.connection.execute("CREATE TABLE {0:s} ({1:s})".format(_quote(self.table), ", ".join(definitions)))
+
+        for column in self.data.columns:
+            if column.type is not Type.datetime:
+                continue
+
+            index = _quote("{0:s}_{1:s}".format(self.table, column.name))
+            sql = "CREATE INDEX {0:s} ON {1:s} ({2:s})".format(index, _quote(self.table), _quote(column.name))
+            self.connection.execute(sql)
+
+        self.insert = "INSERT INTO {0:s} ({1:s}) VALUES ({2:s})".format(_quote(self.table), ", ".join(names),
+                                                                        ", ".join(["?"] * len(names)))
+        self.connection.commit()
+        return
+
+    def _write_infos(self, table: str, items: List[Info]):
+        values = []
+
+        for (position, item) in enumerate(items):
+            (name, type_value, value) = encode_info(item)
+            values.append((self.session, position, name, type_value, json.dumps(value)))
+
+        self.connection.executemany("INSERT INTO {0:s} VALUES (?, ?, ?, ?, ?)".format(table), values)
+        return
+
+    def store(self) -> bool:
+        check = self.open()
+        if check is False:
+            return False
+
+        check1 = self.append()
+        check2 = self.close()
+        return check1 and check2
+
+    def open(self) -> bool:
+        check = self._prepare()
+        if check is False:
+            return False
+
+        check = self._create_session()
+        return check
+
+    def append(self) -> bool:
+        if self.connection is None:
+            return False
+
+        columns = [self.data.values[column.name] for column in self.data.columns]
+
+        try:
+            self.connection.executemany(self.insert, zip(*columns))
+        except sqlite3.Error as e:
+            easyb.log.exception(e)
+            return False
+
+        self.row += self.data.size
+        return True
+
+    def flush(self) -> bool:
+        if self.connection is None:
+            return False
+
+        self.connection.commit()
+        return True
+
+    def close(self) -> bool:
+        if self.connection is None:
+            return False
+
+        self._write_infos("infos", self.data.infos)
+        self._write_infos("status", self.data.status)
+        self.connection.commit()
+
+        easyb.log.inform(self.name, "Write number of rows {0:d}".format(self.row))
+        self.connection.close()
+        self.connection = None
+        return True
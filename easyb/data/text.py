@@ -19,19 +19,78 @@
 import os
 import easyb
 
-from easyb.data.base import Storage, Collection, convert_data
+from easyb.data.base import Storage, Collection, Type
 from io import FileIO
+from typing import Any, Callable, List
 
 __all__ = [
+    "convert_time",
+    "get_converter",
     "TextStorage"
 ]
 
 
+def convert_time(value: int) -> str:
+    """Format epoch microseconds as time of day, like strftime("%H:%M:%S").
+
+    :return: time text.
+    :rtype: str
+    """
+    seconds = (value // 1000000) % 86400
+    text = "%02d:%02d:%02d" % (seconds // 3600, (seconds // 60) % 60, seconds % 60)
+    return text
+
+
+def _convert_float(value: float) -> str:
+    return format(value, ".2f")
+
+
+def _convert_bool(value: int) -> str:
+    if value != 0:
+        return "True"
+    return "False"
+
+
+def _convert_string(value: str) -> str:
+    return value
+
+
+def get_converter(data_type: Type) -> Callable[[Any], str]:
+    """Get the text converter for raw column values of the given type.
+
+    :return: converter function.
+    :rtype: Callable[[Any], str]
+    """
+    converter = None
+
+    if data_type is Type.datetime:
+        converter = convert_time
+
+    if data_type is Type.float:
+        converter = _convert_float
+
+    if data_type is Type.integer:
+        converter = str
+
+    if data_type is Type.string:
+        converter = _convert_string
+
+    if data_type is Type.bool:
+        converter = _convert_bool
+
+    if converter is None:  # pragma: no cover
+        raise ValueError("Unknown type: {0:s}".format(data_type.name))
+
+    return converter
+
+
 class TextStorage(Storage):
 
     # noinspection PyTypeChecker
     def __init__(self, data: Collection):
         self.file: FileIO = None
+        self.chunk_size: int = 10000
+        self.buffer_size: int = 1048576
         Storage.__init__(self, "TEXT", data)
         return
 
@@ -39,7 +98,7 @@ class TextStorage(Storage):
         filename = os.path.abspath(os.path.normpath(self.data.filename + ".csv"))
         easyb.log.inform(self.name, "Open {0:s}".format(filename))
         try:
-            self.file = open(filename, mode="w")
+            self.file = open(filename, mode="w", buffering=self.buffer_size)
         except OSError as e:
             easyb.log.exception(e)
             return False
@@ -67,7 +126,7 @@ class TextStorage(Storage):
         self.file.write("\n")
         return
 
-    def _write_data(self):
+    def _write_header(self):
 
         line = ""
         for column in self.data.columns:
@@ -78,22 +137,27 @@ class TextStorage(Storage):
 
         line += "\n"
         self.file.write(line)
+        return
 
-        for row in self.data.rows:
+    def _get_columns(self) -> List[Any]:
+        columns = []
 
-            line = ""
-            for column in self.data.columns:
-                data = getattr(row, column.name)
-                value = convert_data(column.type, data)
+        for column in self.data.columns:
+            values = self.data.values[column.name]
+            converter = get_converter(column.type)
+            columns.append((values, converter))
+        return columns
 
-                if line == "":
-                    line = value
-                else:
-                    line += "\t{0:s}".format(value)
+    def _write_rows(self):
+        columns = self._get_columns()
+        size = self.data.size
 
-            line += "\n"
-            self.file.write(line)
+        for start in range(0, size, self.chunk_size):
+            end = min(start + self.chunk_size, size)
 
+            texts = [map(converter, values[start:end]) for (values, converter) in columns]
+            lines = ["\t".join(items) + "\n" for items in zip(*texts)]
+            self.file.writelines(lines)
         return
 
     def store(self) -> bool:
@@ -103,8 +167,43 @@ class TextStorage(Storage):
 
         self._write_info()
         self._write_status()
-        self._write_data()
+        self._write_header()
+        self._write_rows()
 
         if self.file is not None:
             self.file.close()
         return True
+
+    def open(self) -> bool:
+        check = self._prepare()
+        if check is False:
+            return False
+
+        self._write_header()
+        return True
+
+    def append(self) -> bool:
+        if self.file is None:
+            return False
+
+        self._write_rows()
+        return True
+
+    def flush(self) -> bool:
+        if self.file is None:
+            return False
+
+        self.file.flush()
+        return True
+
+    def close(self) -> bool:
+        if self.file is None:
+            return False
+
+        self.file.write("\n")
+        self._write_info()
+        self._write_status()
+
+        self.file.close()
+        self.file = None
+        return True
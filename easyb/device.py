@@ -22,14 +22,18 @@ import easyb
 import serial
 
 from serial import Serial
-from typing import List, Union, Any
+from datetime import datetime
+from typing import List, Union, Any, Tuple
 
 from easyb.data import Data
-from easyb.data.base import Type
+from easyb.data.base import Type, to_epoch
 from easyb.bit import debug_data
+from easyb.capture import Capture
 from easyb.message import Message
+from easyb.message.decoder import Decoder
 from easyb.command import Command
-from easyb.definitions import Length, Status
+from easyb.definitions import Status
+from easyb.timing import Latency, Ticker
 
 from abc import ABCMeta
 
@@ -53,14 +57,30 @@ class Device(metaclass=ABCMeta):
         self.timeout: int = 2
         self.write_timeout: int = 2
         self.wait_time: float = 0.0
+        self.gap_time: float = 0.05
+        self.response_driven: bool = False
+        self.shared_port: bool = False
+        self.latency: Latency = Latency()
+        self.decoder: Decoder = Decoder()
 
         # members for reading via thread
+        self.measure_command: int = 0
         self.interval: float = 2.0
+        self.catch_up: bool = False
+        self.batch_size: int = 10
+        self.ticker: Ticker = Ticker(self.interval)
         self.abort: bool = False
         self.status: bool = False
         self.active: bool = False
         self.interval_counter: int = 0
 
+        # members for raw frame capture
+        self.capture: bool = False
+        self.frames: Capture = Capture()
+
+        # noinspection PyTypeChecker
+        self.frame_time: int = None
+
         # data type members
         self.data: Data = Data()
 
@@ -80,6 +100,14 @@ class Device(metaclass=ABCMeta):
         if item is not None:
             self.wait_time = item
 
+        item = kwargs.get("gap_time", 0.05)
+        if item is not None:
+            self.gap_time = item
+
+        item = kwargs.get("response_driven", False)
+        if item is not None:
+            self.response_driven = item
+
         item = kwargs.get("baudrate", 4800)
         if item is not None:
             self.baudrate = item
@@ -96,6 +124,18 @@ class Device(metaclass=ABCMeta):
         if item is not None:
             self.write_timeout = item
 
+        item = kwargs.get("catch_up", False)
+        if item is not None:
+            self.catch_up = item
+
+        item = kwargs.get("batch_size", 10)
+        if item is not None:
+            self.batch_size = item
+
+        item = kwargs.get("capture", False)
+        if item is not None:
+            self.capture = item
+
         self.init_commands()
 
         self.data.add_column("datetime", "Time", Type.datetime)
@@ -170,6 +210,7 @@ class Device(metaclass=ABCMeta):
         easyb.log.debug1(self.name, "Address:       {0:d}".format(self.address))
         easyb.log.debug1(self.name, "Timeout:       {0:d}".format(self.timeout))
         easyb.log.debug1(self.name, "Write timeout: {0:d}".format(self.write_timeout))
+        easyb.log.debug1(self.name, "Response mode: {0:s}".format(str(self.response_driven)))
 
         self.serial.port = self.port
 
@@ -205,6 +246,19 @@ class Device(metaclass=ABCMeta):
         easyb.log.inform(self.name, "Disconnect from {0:s}".format(self.port))
         return True
 
+    def write(self, data: bytes) -> bool:
+        easyb.log.serial_write(data)
+
+        try:
+            self.serial.write(data)
+        except serial.SerialException as e:
+            easyb.log.error("Problem during write to serial port!")
+            easyb.log.exception(e)
+            easyb.log.traceback()
+            return False
+
+        return True
+
     def send(self, message: Message) -> bool:
 
         check = message.encode()
@@ -213,126 +267,165 @@ class Device(metaclass=ABCMeta):
 
         message.info("SEND")
 
-        stream = message.stream.bytes
+        check = self.write(message.stream.bytes)
+        return check
 
-        easyb.log.serial_write(stream)
+    def compile_command(self, command: Command) -> Union[None, bytes]:
+        """Encode the request of a command once and keep it as template.
 
-        try:
-            self.serial.write(stream)
-        except serial.SerialException as e:
-            easyb.log.error("Problem during write to serial port!")
-            easyb.log.exception(e)
-            easyb.log.traceback()
-            return False
+        :return: encoded request, None if the command is invalid
+        :rtype: bytes
+        """
+        frame = command.frame
+        if frame is not None:
+            return frame
 
-        return True
+        message = Message()
+        message.command(command)
+
+        check = message.encode()
+        if check is False:
+            return None
+
+        frame = bytes(message.stream.data)
+        command.frame = frame
+        return frame
+
+    def in_waiting(self) -> int:
+        """Number of received bytes waiting in the port buffer.
 
-    def read_unit_timeout(self) -> bytes:
-        result = []
+        :return: number of bytes, -1 if the port does not provide in_waiting.
+        :rtype: int
+        """
+        count = getattr(self.serial, "in_waiting", None)
+        if type(count) is not int:
+            return -1
+        return count
+
+    def read_until_gap(self, deadline: float) -> bytes:
+        """Read everything that arrives until no byte came for gap_time or the deadline is reached.
+
+        :param deadline: time.monotonic() value to give up at
+        :return: data read
+        :rtype: bytes
+        """
+        result = bytearray()
+        last = time.monotonic()
 
         while True:
-            check = False
-            try:
-                _in = self.serial.read()
-
-                for item in _in:
-                    check = True
-                    value = int(item)
-                    result.append(value)
-
-            except serial.SerialException as e:
-                easyb.log.error("Problem during reading of message body!")
-                easyb.log.exception(e)
-                easyb.log.traceback()
-                break
+            count = self.in_waiting()
+            now = time.monotonic()
 
-            if check is False:
+            if count > 0:
+                result.extend(self.serial.read(count))
+                last = now
+                continue
+
+            if ((now - last) >= self.gap_time) or (now >= deadline):
                 break
 
+            time.sleep(self.gap_time / 10.0)
+
         res = bytes(result)
         return res
 
-    def receive(self) -> Union[None, Message]:
-        try:
-            header = self.serial.read(3)
-        except serial.SerialException as e:
-            easyb.log.error("Problem during reading of message header!")
-            easyb.log.exception(e)
-            return None
+    def select_message(self, messages: List[Message]) -> Tuple[bool, Union[None, Message]]:
+        """Pick the response, on a shared port or after a resync it must match the device address.
 
-        easyb.log.serial_read(header)
+        :return: True if a frame was found, and the message or None if the command is not supported.
+        :rtype: Tuple[bool, Union[None, Message]]
+        """
+        for message in messages:
+            message.info("RECEIVE")
+
+            # after skipping invalid data a body triplet can pass as header, on a bus a late reply of another
+            # device can arrive, only trust our own address then
+            check = self.shared_port or (self.decoder.dropped != 0)
+            if check and (message.address != self.address):
+                easyb.log.warn(self.name, "Ignore frame for address {0:d}".format(message.address))
+                continue
 
-        message = Message()
-        check = message.decode(header)
-        if check is False:
-            return None
+            if message.code == 5:
+                easyb.log.warn(self.name, "Command not supported!")
+                return True, None
 
-        message.info("RECEIVE")
+            return True, message
 
-        if message.code == 5:
-            easyb.log.warn(self.name, "Command not supported!")
-            return None
+        return False, None
 
-        number = 0
+    def receive(self) -> Union[None, Message]:
+        """Read the response, a variable length response ends after gap_time without new bytes.
 
-        if message.length is Length.Byte6:
-            number = 3
+        :return: message or None on error.
+        :rtype: Union[None, Message]
+        """
+        deadline = time.monotonic() + self.timeout
+        decoder = self.decoder
+        decoder.reset()
+        dropped = 0
 
-        if message.length is Length.Byte9:
-            number = 6
+        while True:
+            data = bytes()
+            ended = False
 
-        if message.length is Length.Variable:
-            number = -1
+            if time.monotonic() < deadline:
+                try:
+                    if (decoder.variable is True) and (self.in_waiting() >= 0):
+                        data = self.read_until_gap(deadline)
+                        ended = True
+                    else:
+                        data = self.serial.read(decoder.needed)
+                except serial.SerialException as e:
+                    easyb.log.error("Problem during reading of message!")
+                    easyb.log.exception(e)
+                    return None
 
-        if number == 0:
-            easyb.log.warn(self.name, "Message body has no size!")
-            message.data = header
-            return message
+            messages = []
 
-        if number == -1:
-            easyb.log.warn(self.name, "Message body is variable!")
-            data = self.read_unit_timeout()
-        else:
-            try:
-                data = self.serial.read(number)
-            except serial.SerialException as e:
-                easyb.log.error("Problem during reading of message body!")
-                easyb.log.exception(e)
-                easyb.log.traceback()
-                return None
+            if len(data) != 0:
+                easyb.log.serial_read(data)
+                messages = decoder.feed(data)
 
-        stream = message.stream
+            if (len(data) == 0) or (ended is True):
+                messages.extend(decoder.flush())
 
-        easyb.log.serial_read(data)
-        check = stream.append(data)
-        if check is False:
-            return None
+            (check, message) = self.select_message(messages)
 
-        stream.length = message.length
-        check = stream.verify_length()
-        if check is False:
-            return None
+            if decoder.dropped != dropped:
+                easyb.log.warn(self.name, "Skipped {0:d} bytes of invalid data".format(decoder.dropped - dropped))
+                dropped = decoder.dropped
 
-        return message
+            if check is True:
+                return message
+
+            if (len(data) == 0) or (ended is True):
+                return None
 
     def execute(self, command: Command) -> Union[None, Message]:
-        message = Message()
-        message.command(command)
+        frame = self.compile_command(command)
+        if frame is None:
+            return None
+
+        easyb.log.debug2("SEND", command.name)
 
-        check = self.send(message)
+        start = time.monotonic()
+
+        check = self.write(frame)
         if check is False:
             return None
 
-        time.sleep(self.wait_time)
+        if self.response_driven is False:
+            time.sleep(self.wait_time)
 
         data = self.receive()
         if data is None:
             return None
 
+        self.latency.add(time.monotonic() - start)
         return data
 
     def create_row(self) -> Any:
-        row = self.data.create_row()
+        row = self.data.create_row(self.frame_time)
 
         if row is None:
             raise ValueError("Data row is empty!")
@@ -366,6 +459,7 @@ class Device(metaclass=ABCMeta):
     def add_command(self, command: Command):
         command.number = self.command_counter
         command.address = self.address
+        self.compile_command(command)
         self.commands.append(command)
         self.command_list.append(command.number)
         self.command_counter += 1
@@ -380,11 +474,14 @@ class Device(metaclass=ABCMeta):
         self.active = True
         easyb.log.inform(self.name, "Start measurements")
 
+        self.ticker = Ticker(self.interval, self.catch_up)
+        self.ticker.start()
+
         while True:
-            self.status = self.run()
-            self.interval_counter += 1
+            self.status = self.run_step()
+            self.flush_batch()
 
-            time.sleep(self.interval)
+            self.ticker.wait()
 
             if self.abort is True:
                 easyb.log.inform(self.name, "Stop measurements")
@@ -395,14 +492,148 @@ class Device(metaclass=ABCMeta):
                 easyb.log.warn(self.name, "Abort measurements")
                 break
 
+        self.finish_loop()
+
+        easyb.log.inform(self.name, "Round trip: {0:s}".format(str(self.latency)))
+        easyb.log.inform(self.name, "Schedule: {0:s}".format(str(self.ticker)))
         self.active = False
         return
 
+    def run_step(self) -> bool:
+        """One measurement of the loop, the response is only captured in capture mode.
+
+        :return: status of the run.
+        :rtype: bool
+        """
+        if self.capture is True:
+            check = self.capture_frame()
+        else:
+            check = self.run()
+
+        check = self.end_step(check)
+        return check
+
+    def handle_response(self, message: Message) -> bool:
+        """Evaluate the response of the measure command, in capture mode it is only kept for decode_frames.
+
+        :return: status of the evaluation.
+        :rtype: bool
+        """
+        if self.capture is True:
+            check = self.store_frame(message)
+        else:
+            check = self.measure(message)
+        return check
+
+    def end_step(self, check: bool) -> bool:
+        """Count the interval of a finished loop step, also if it failed.
+
+        :return: status of the step.
+        :rtype: bool
+        """
+        self.interval_counter += 1
+        return check
+
+    def _write_batch(self):
+        if (self.data.storage is not None) and (self.data.size >= self.batch_size):
+            self.data.flush()
+        return
+
+    def flush_batch(self):
+        """Write the rows to an open storage once batch_size rows are collected.
+
+        In capture mode the frames are decoded first once batch_size frames are collected.
+        """
+        if (self.capture is True) and (self.data.storage is not None) and (len(self.frames) >= self.batch_size):
+            self.decode_frames()
+
+        self._write_batch()
+        return
+
+    def finish_loop(self):
+        """Decode captured frames and write the remaining rows to an open storage."""
+        if self.capture is True:
+            self.decode_frames()
+
+        if self.data.storage is not None:
+            self.data.flush()
+        return
+
+    def store_frame(self, message: Message) -> bool:
+        """Keep the raw response with capture time and interval counter for decode_frames."""
+        check = self.frames.add(message.stream.data, to_epoch(datetime.now()), self.interval_counter)
+        if check is False:
+            easyb.log.error("Frame does not fit into capture slot: {0:d}".format(len(message.stream.data)))
+        return check
+
+    def capture_frame(self) -> bool:
+        """Run the measure command and only capture the response, decoding is done by decode_frames."""
+        command = self.get_command(self.measure_command)
+
+        message = self.execute(command)
+        if message is None:
+            return False
+
+        check = self.store_frame(message)
+        return check
+
+    def decode_frames(self) -> bool:
+        """Evaluate all captured frames with measure, rows get the capture time and interval counter.
+
+        :return: False if a frame could not be decoded or measured.
+        :rtype: bool
+        """
+        interval_counter = self.interval_counter
+        result = True
+
+        for index in range(len(self.frames)):
+            (timestamp, number, frame) = self.frames.get(index)
+
+            message = Message()
+            check = message.decode(frame)
+            if check is False:
+                result = False
+                continue
+
+            message.stream.length = message.length
+
+            self.frame_time = timestamp
+            self.interval_counter = number
+
+            check = self.measure(message)
+            if check is False:
+                result = False
+
+            self._write_batch()
+
+        easyb.log.inform(self.name, "Decoded {0:d} captured frames".format(len(self.frames)))
+
+        self.frames.clear()
+        self.frame_time = None
+        self.interval_counter = interval_counter
+        return result
+
+    def open_storage(self, file_type: str, filename: str) -> bool:
+        """Open a storage so run_loop streams the measured rows in batches of batch_size."""
+        ret = self.data.open(file_type, filename)
+        return ret
+
     def store(self, file_type: str, filename: str) -> bool:
-        easyb.log.inform(self.name, "Number of data points: {0:d}".format(self.data.len))
+        easyb.log.inform(self.name, "Number of data points: {0:d}".format(self.data.total))
+
+        if self.data.storage is not None:
+            ret = self.data.close()
+            return ret
+
         ret = self.data.store(file_type, filename)
         return ret
 
+    # noinspection PyUnusedLocal
+    @abc.abstractmethod
+    def measure(self, message: Message) -> bool:
+        """Evaluate the response of the measure command and store it as new data row."""
+        raise NotImplementedError
+
     # noinspection PyUnusedLocal
     @abc.abstractmethod
     def init_commands(self):
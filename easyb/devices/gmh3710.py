@@ -239,13 +239,7 @@ class GMH3710(Device):
             return False
         return True
 
-    def run(self) -> bool:
-        command = self.get_command(0)
-
-        message = self.execute(command)
-        if message is None:
-            return False
-
+    def measure(self, message: Message) -> bool:
         data = message.stream.data
         bitio = Value(data=data)
 
@@ -264,6 +258,16 @@ class GMH3710(Device):
             easyb.log.inform(self.name, debug)
         return check
 
+    def run(self) -> bool:
+        command = self.get_command(self.measure_command)
+
+        message = self.execute(command)
+        if message is None:
+            return False
+
+        check = self.measure(message)
+        return check
+
     def close(self) -> bool:
         self.end_measure = datetime.now()
 
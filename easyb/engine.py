@@ -0,0 +1,282 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import json
+import heapq
+import easyb
+import threading
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from easyb.bus import Bus
+from easyb.device import Device
+from easyb.devices import get_device
+from bbutil.utils import check_dict
+
+__all__ = [
+    "Sample",
+    "Sink",
+    "Engine"
+]
+
+
+class Sample(object):
+    """Copy of a measured row, the row itself is cleared when the device flushes its storage."""
+
+    def __init__(self, timestamp: datetime, port: str, device: Device, values: Dict[str, Any]):
+        self.timestamp: datetime = timestamp
+        self.port: str = port
+        self.address: int = device.address
+        self.name: str = device.name
+        self.values: Dict[str, Any] = values
+        return
+
+
+class Sink(object):
+    """Collects samples of all ports, ordered by timestamp.
+
+    At most size samples are kept, the oldest samples are dropped first and counted in dropped.
+    """
+
+    def __init__(self, size: int = 10000):
+        self.lock: threading.Lock = threading.Lock()
+        self.counter: int = 0
+        self.dropped: int = 0
+        self.size: int = size
+        self._heap: list = []
+        return
+
+    @property
+    def len(self) -> int:
+        return len(self._heap)
+
+    def append(self, sample: Sample):
+        with self.lock:
+            heapq.heappush(self._heap, (sample.timestamp, self.counter, sample))
+            self.counter += 1
+
+            if len(self._heap) > self.size:
+                heapq.heappop(self._heap)
+                self.dropped += 1
+        return
+
+    def pop(self, before: datetime = None) -> List[Sample]:
+        """Remove and return the samples in timestamp order, only those older than before if given."""
+        result = []
+
+        with self.lock:
+            while len(self._heap) > 0:
+                if (before is not None) and (self._heap[0][0] >= before):
+                    break
+                (_, _, sample) = heapq.heappop(self._heap)
+                result.append(sample)
+        return result
+
+
+class Engine(object):
+    """Parallel acquisition on several serial ports, one bus worker thread per port.
+
+    The configuration is a json file::
+
+        {
+            "ports": [
+                {
+                    "port": "/dev/ttyUSB0",
+                    "baudrate": 4800,
+                    "devices": [
+                        {"device": "GMH 3710", "address": 1, "interval": 2.0, "priority": 0}
+                    ]
+                }
+            ]
+        }
+    """
+
+    def __init__(self):
+        self.name: str = "ENGINE"
+        self.buses: List[Bus] = []
+        self.sink: Sink = Sink()
+        self.status: bool = False
+        return
+
+    @property
+    def devices(self) -> List[Device]:
+        result = []
+        for bus in self.buses:
+            result.extend(bus.devices)
+        return result
+
+    def _add_port(self, data: dict) -> bool:
+        check = check_dict(data, ["port", "devices"])
+        if check is False:
+            easyb.log.error("Invalid port configuration: {0:s}".format(str(data)))
+            return False
+
+        bus = Bus(name=data["port"], port=data["port"], baudrate=data.get("baudrate", None),
+                  timeout=data.get("timeout", None), write_timeout=data.get("write_timeout", None))
+        bus.callback = self._collect
+
+        for item in data["devices"]:
+            check = check_dict(item, ["device", "address"])
+            if check is False:
+                easyb.log.error("Invalid device configuration: {0:s}".format(str(item)))
+                return False
+
+            c = get_device(item["device"])
+            if c is None:
+                easyb.log.error("Unable to find device {0:s}".format(item["device"]))
+                return False
+
+            interval = item.get("interval", 2.0)
+
+            # noinspection PyCallingNonCallable
+            device = c(address=item["address"], interval=interval)
+            check = bus.add_device(device, priority=item.get("priority", 0), interval=interval)
+            if check is False:
+                return False
+
+        self.buses.append(bus)
+        return True
+
+    def load(self, filename: str) -> bool:
+        filename = os.path.abspath(os.path.normpath(filename))
+
+        try:
+            with open(filename, mode="r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            easyb.log.error("Unable to read configuration {0:s}".format(filename))
+            easyb.log.exception(e)
+            return False
+
+        check = check_dict(data, ["ports"])
+        if check is False:
+            easyb.log.error("Configuration has no ports!")
+            return False
+
+        for item in data["ports"]:
+            check = self._add_port(item)
+            if check is False:
+                return False
+
+        easyb.log.inform(self.name, "{0:d} ports, {1:d} devices".format(len(self.buses), len(self.devices)))
+        return True
+
+    def _collect(self, bus: Bus, device: Device):
+        # captured frames are decoded after the run, there is no row yet
+        if device.data.size == 0:
+            return
+
+        row = device.data.rows[-1]
+        values = {column.name: getattr(row, column.name) for column in device.data.columns}
+
+        sample = Sample(row.datetime, bus.port, device, values)
+        self.sink.append(sample)
+        return
+
+    def setup(self):
+        for bus in self.buses:
+            bus.setup()
+        return
+
+    def connect(self) -> bool:
+        for bus in self.buses:
+            check = bus.connect()
+            if check is False:
+                return False
+        return True
+
+    def disconnect(self) -> bool:
+        result = True
+        for bus in self.buses:
+            check = bus.disconnect()
+            if check is False:
+                result = False
+        return result
+
+    def prepare(self) -> bool:
+        for bus in self.buses:
+            check = bus.prepare()
+            if check is False:
+                return False
+        return True
+
+    # noinspection PyUnusedLocal
+    def do_abort(self, signum, frame):
+        for bus in self.buses:
+            bus.abort = True
+        return
+
+    @property
+    def active(self) -> bool:
+        for bus in self.buses:
+            if bus.active is True:
+                return True
+        return False
+
+    def run(self) -> bool:
+        if len(self.buses) == 0:
+            easyb.log.error("No ports configured!")
+            return False
+
+        with ThreadPoolExecutor(max_workers=len(self.buses)) as executor:
+            futures = [executor.submit(bus.run_loop) for bus in self.buses]
+            wait(futures)
+
+            for item in futures:
+                item.result()
+
+        self.status = True
+        for bus in self.buses:
+            if bus.status is False:
+                self.status = False
+        return self.status
+
+    def close(self) -> bool:
+        result = True
+        for bus in self.buses:
+            check = bus.close()
+            if check is False:
+                result = False
+        return result
+
+    @staticmethod
+    def _get_filename(device: Device, filename: str) -> str:
+        port = os.path.basename(device.port)
+        name = "{0:s}_{1:s}_{2:d}".format(filename, port, device.address)
+        return name
+
+    def open(self, file_type: str, filename: str) -> bool:
+        """Open a storage per device, the buses write the rows in batches while running."""
+        for device in self.devices:
+            check = device.open_storage(file_type, self._get_filename(device, filename))
+            if check is False:
+                return False
+        return True
+
+    def store(self, file_type: str, filename: str) -> bool:
+        result = True
+
+        for device in self.devices:
+            check = device.store(file_type, self._get_filename(device, filename))
+            if check is False:
+                result = False
+        return result
@@ -17,6 +17,8 @@
 #
 
 
+from typing import Dict, List, Set
+
 from bbutil.logging import Logging
 from bbutil.logging.types import Message
 from easyb.bit import debug_data
@@ -34,16 +36,53 @@ class SerialLogging(Logging):
     def __init__(self):
         Logging.__init__(self)
 
+        # noinspection PyTypeChecker
+        self.serial_level: int = None
+        self.serial_index: Dict[int, List[str]] = {}
+        self.enabled: Set[str] = set()
+
         self.setup(index=_index)
         return
 
+    def setup(self, **kwargs):
+        Logging.setup(self, **kwargs)
+
+        item = kwargs.get("level", None)
+        if item is not None:
+            self.serial_level = item
+
+        item = kwargs.get("index", None)
+        if item is not None:
+            self.serial_index = item
+
+        self.enabled = set(self.serial_index.get(self.serial_level, []))
+        return
+
+    def is_enabled(self, level: str) -> bool:
+        """Check if messages of the given level are kept, True as long as no level is set up.
+
+        :return: True if the level is enabled, otherwise False.
+        :rtype: bool
+        """
+        if self.serial_level is None:
+            return True
+
+        check = level in self.enabled
+        return check
+
     def serial_write(self, data: bytes):
+        if self.is_enabled("SERIAL") is False:
+            return
+
         content = "> {0:s}".format(debug_data(data))
         _message = Message(tag="SERIAL", level="SERIAL", content=content)
         self.append(_message)
         return
 
     def serial_read(self, data: bytes):
+        if self.is_enabled("SERIAL") is False:
+            return
+
         content = "< {0:s}".format(debug_data(data))
         _message = Message(tag="SERIAL", level="SERIAL", content=content)
         self.append(_message)
@@ -18,7 +18,7 @@
 
 import easyb
 
-from typing import List
+from typing import Dict, List, Tuple
 
 from easyb.command import Command
 from easyb.message.stream import Stream
@@ -27,12 +27,35 @@ from easyb.definitions import Direction, get_direction, Length, get_length, Prio
 from easyb.bit import crop_u8
 
 __all__ = [
+    "decoder",
     "stream",
 
     "Message"
 ]
 
 
+def _create_header_table() -> List[Tuple[int, Priority, Length, Direction]]:
+    table = []
+
+    for value in range(256):
+        code = (value & 0xf0) >> 4
+        priority = get_priority((value & 0x8) >> 3)
+        length = get_length((value & 0x6) >> 1)
+        direction = get_direction(value & 0x1)
+
+        table.append((code, priority, length, direction))
+    return table
+
+
+#: decoded (code, priority, length, direction) for every value of the header control byte
+_header_table: List[Tuple[int, Priority, Length, Direction]] = _create_header_table()
+
+#: header control byte for every (code, priority, length, direction), the reverse of _header_table
+_encode_table: Dict[Tuple[int, Priority, Length, Direction], int] = {
+    item: value for (value, item) in enumerate(_header_table)
+}
+
+
 class Message(object):
 
     def __init__(self, **kwargs):
@@ -102,33 +125,17 @@ class Message(object):
 
         return True
 
-    def _encode_header(self, data: List[int]):
-        u8 = 0
-
-        direction = crop_u8(self.direction.value)
-        length = crop_u8(self.length.value << 1)
-        priority = crop_u8(self.priority.value << 3)
-        code = crop_u8(self.code << 4)
-
-        u8 = crop_u8(u8 | direction)
-        u8 = crop_u8(u8 | length)
-        u8 = crop_u8(u8 | priority)
-        u8 = crop_u8(u8 | code)
-
-        byte = crop_u8(self.address)
-        data.append(byte)
-
-        result = int(u8)
-        data.append(result)
-
-        data.append(0)
+    def _encode_header(self, data: bytearray):
+        data[0] = crop_u8(self.address)
+        data[1] = _encode_table[(self.code & 0x0f, self.priority, self.length, self.direction)]
+        data[2] = 0
         return
 
-    def _encode_data(self, data: List[int]):
+    def _encode_data(self, data: bytearray):
         length = len(self.param)
 
         pos_set = 0
-        n = 0
+        n = 3
         while True:
             if pos_set >= length:
                 break
@@ -136,28 +143,19 @@ class Message(object):
             pos1 = pos_set + 0
             pos2 = pos_set + 1
 
-            data.append(self.param[pos1])
-            data.append(self.param[pos2])
-            data.append(0)
+            data[n + 0] = self.param[pos1]
+            data[n + 1] = self.param[pos2]
+            data[n + 2] = 0
 
             pos_set += 2
             n += 3
         return
 
     def _decode_header(self):
-        byte0 = self.stream.data[0]
-        byte1 = self.stream.data[1]
+        data = self.stream.data
 
-        self.address = 255 - byte0
-        self.code = (byte1 & 0xf0) >> 4
-
-        priority = (byte1 & 0x8) >> 3
-        length = (byte1 & 0x6) >> 1
-        direction = byte1 & 0x1
-
-        self.priority = get_priority(priority)
-        self.length = get_length(length)
-        self.direction = get_direction(direction)
+        self.address = 255 - data[0]
+        (self.code, self.priority, self.length, self.direction) = _header_table[data[1]]
         return
 
     def encode(self) -> bool:
@@ -165,12 +163,11 @@ class Message(object):
         if check is False:
             return False
 
-        data = []
-        self._encode_header(data)
-        self._encode_data(data)
+        size = 3 + (len(self.param) // 2) * 3
 
-        out = Stream(self.length)
-        out.set_data(data)
+        out = Stream(self.length, size)
+        self._encode_header(out.data)
+        self._encode_data(out.data)
         out.encode()
         self.stream = out
         return True
@@ -186,6 +183,9 @@ class Message(object):
         return True
 
     def info(self, debug: str):
+        if easyb.log.is_enabled("DEBUG2") is False:
+            return
+
         line = "Address {0:d}, Code {1:d}, {2:s}, {3:s}, {4:s}"
         logging = line.format(self.address, self.code, self.priority.name, self.length.name, self.direction.name)
         easyb.log.debug2(debug, logging)
@@ -0,0 +1,214 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+from typing import List, Union
+
+from easyb.bit import get_crc_table
+from easyb.definitions import Length
+from easyb.message import Message
+from easyb.message.stream import Stream
+
+__all__ = [
+    "get_body_size",
+    "Decoder"
+]
+
+
+def get_body_size(length: Length) -> int:
+    """Number of bytes following the header, -1 for variable length.
+
+    :return: body size.
+    :rtype: int
+    """
+    number = 0
+
+    if length is Length.Byte6:
+        number = 3
+
+    if length is Length.Byte9:
+        number = 6
+
+    if length is Length.Variable:
+        number = -1
+
+    return number
+
+
+class Decoder(object):
+    """Incremental frame decoder for EASYBus byte streams.
+
+    Bytes are fed in arbitrary chunks. A frame starts at a triplet with valid CRC, fixed length frames end after
+    their body, variable length frames end at the next triplet with invalid CRC or when flush is called. Bytes
+    that do not belong to a valid frame are dropped one at a time until the stream is in sync again, an
+    incomplete frame left at flush is dropped as a whole.
+    """
+
+    def __init__(self):
+        self.buffer: bytearray = bytearray()
+        self.dropped: int = 0
+        self._checked: int = 0
+        return
+
+    @property
+    def variable(self) -> bool:
+        """True while a variable length frame is pending.
+
+        :return: pending state.
+        :rtype: bool
+        """
+        if len(self.buffer) < 3:
+            return False
+
+        message = self._decode_header()
+        if message is None:
+            return False
+
+        check = message.length is Length.Variable
+        return check
+
+    @property
+    def needed(self) -> int:
+        """Number of bytes still missing for the frame at the start of the buffer.
+
+        :return: number of bytes, at least 1.
+        :rtype: int
+        """
+        length = len(self.buffer)
+
+        if length < 3:
+            return 3 - length
+
+        message = self._decode_header()
+        if message is None:
+            return 1
+
+        size = get_body_size(message.length)
+        if size == -1:
+            return 3 - (length % 3)
+
+        number = 3 + size - length
+        if number < 1:
+            return 1
+        return number
+
+    def _check(self, position: int) -> bool:
+        table = get_crc_table()
+        data = self.buffer
+
+        crc = 255 - table[table[data[position]] ^ data[position + 1]]
+        result = crc == data[position + 2]
+        return result
+
+    def _decode_header(self) -> Union[None, Message]:
+        check = self._check(0)
+        if check is False:
+            return None
+
+        message = Message()
+        message.stream = Stream(Length.Byte3, 3)
+        message.stream.data[0:3] = self.buffer[0:3]
+
+        # noinspection PyProtectedMember
+        message._decode_header()
+        return message
+
+    def _drop(self, number: int):
+        del self.buffer[0:number]
+        self._checked = 0
+        return
+
+    def _skip(self):
+        self._drop(1)
+        self.dropped += 1
+        return
+
+    def _emit(self, message: Message, number: int) -> Message:
+        stream = message.stream
+        stream.data = bytearray(self.buffer[0:number])
+        stream.length = message.length
+
+        self._drop(number)
+        return message
+
+    def _parse(self, final: bool) -> List[Message]:
+        result = []
+
+        while len(self.buffer) >= 3:
+            length = len(self.buffer)
+
+            message = self._decode_header()
+            if message is None:
+                self._skip()
+                continue
+
+            size = get_body_size(message.length)
+
+            if size >= 0:
+                if length < 3 + size:
+                    break
+
+                position = 3
+                while (position < 3 + size) and self._check(position):
+                    position += 3
+
+                if position != 3 + size:
+                    self._skip()
+                    continue
+
+                result.append(self._emit(message, 3 + size))
+                continue
+
+            position = max(3, self._checked)
+            while (position + 3 <= length) and self._check(position):
+                position += 3
+
+            if (position + 3 <= length) or (final is True):
+                result.append(self._emit(message, position))
+                continue
+
+            self._checked = position
+            break
+
+        if final is True:
+            self.dropped += len(self.buffer)
+            self._drop(len(self.buffer))
+        return result
+
+    def feed(self, data: Union[bytes, bytearray, memoryview]) -> List[Message]:
+        """Add received bytes and return all frames completed by them.
+
+        :return: list of messages.
+        :rtype: List[Message]
+        """
+        self.buffer.extend(data)
+        result = self._parse(False)
+        return result
+
+    def flush(self) -> List[Message]:
+        """End the input, a pending variable length frame is returned, incomplete frames are dropped.
+
+        :return: list of messages.
+        :rtype: List[Message]
+        """
+        result = self._parse(True)
+        return result
+
+    def reset(self):
+        self._drop(len(self.buffer))
+        self.dropped = 0
+        return
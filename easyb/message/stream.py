@@ -17,7 +17,6 @@
 
 import easyb
 
-from typing import List
 from easyb.definitions import Length
 from easyb.bit import debug_data, crop_u8, create_crc, check_crc
 
@@ -28,8 +27,8 @@ __all__ = [
 
 class Stream(object):
 
-    def __init__(self, length: Length):
-        self.data: List[int] = []
+    def __init__(self, length: Length, size: int = 0):
+        self.data: bytearray = bytearray(size)
         self.length: Length = length
         return
 
@@ -43,19 +42,17 @@ class Stream(object):
         return len(self.data)
 
     def __str__(self):
-        return debug_data(self.bytes)
+        return debug_data(self.data)
 
     def __repr__(self):
-        return debug_data(self.bytes)
+        return debug_data(self.data)
 
     def expand_data(self, number):
-        if number == self.len:
+        n = self.len
+        if number <= n:
             return
 
-        n = self.len
-        while n < number:
-            self.data.append(0)
-            n += 1
+        self.data.extend(bytes(number - n))
         return
 
     def encode(self) -> bool:
@@ -66,9 +63,8 @@ class Stream(object):
             easyb.log.error("Data is empty!")
             return False
 
-        for item in self.data:
-            if item != 0:
-                check = True
+        if self.data.count(0) != length:
+            check = True
 
         if check is False:
             easyb.log.error("Data is empty!")
@@ -95,10 +91,7 @@ class Stream(object):
         return True
 
     def decode(self, data_input: bytes):
-        self.data = []
-
-        for item in data_input:
-            self.data.append(int(item))
+        self.data = bytearray(data_input)
 
         length = len(self.data)
 
@@ -126,8 +119,7 @@ class Stream(object):
             easyb.log.error("Data size is not a triplet! ({0:d})".format(length))
             return False
 
-        for item in data_input:
-            self.data.append(int(item))
+        self.data.extend(data_input)
 
         check = self.verify_crc()
         return check
@@ -190,9 +182,5 @@ class Stream(object):
             easyb.log.error("Invalid data size of {0:d}, need {1:d}!".format(length, self.len))
             return False
 
-        n = 0
-        for item in data_input:
-            value = int(item)
-            self.data[n] = value
-            n += 1
+        self.data[0:length] = data_input
         return True
@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2020, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import math
+import time
+
+__all__ = [
+    "Latency",
+    "Ticker"
+]
+
+
+class Latency(object):
+
+    def __init__(self):
+        self.count: int = 0
+        self.total: float = 0.0
+        self.minimum: float = 0.0
+        self.maximum: float = 0.0
+        self.last: float = 0.0
+        return
+
+    def __str__(self):
+        line = "{0:d} transactions, mean {1:.1f} ms, min {2:.1f} ms, max {3:.1f} ms"
+        return line.format(self.count, self.mean * 1000.0, self.minimum * 1000.0, self.maximum * 1000.0)
+
+    @property
+    def mean(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self.total / float(self.count)
+
+    def add(self, seconds: float):
+        if (self.count == 0) or (seconds < self.minimum):
+            self.minimum = seconds
+
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+        self.last = seconds
+        self.total += seconds
+        self.count += 1
+        return
+
+    def reset(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = 0.0
+        self.maximum = 0.0
+        self.last = 0.0
+        return
+
+
+class Ticker(object):
+    """Fixed rate deadlines on the monotonic clock, the period does not drift with the run time.
+
+    A run which ends after the next deadline is an overrun. With catch_up the missed runs are done
+    back to back until the ticker is on time again, otherwise the missed deadlines are skipped and
+    counted and the next run waits for the next deadline on the grid.
+    """
+
+    def __init__(self, interval: float, catch_up: bool = False):
+        self.interval: float = interval
+        self.catch_up: bool = catch_up
+        self.deadline: float = 0.0
+        self.missed: int = 0
+        self.overruns: int = 0
+        return
+
+    def __str__(self):
+        line = "{0:d} overruns, {1:d} missed deadlines"
+        return line.format(self.overruns, self.missed)
+
+    def start(self):
+        self.deadline = time.monotonic()
+        self.missed = 0
+        self.overruns = 0
+        return
+
+    def delay(self) -> float:
+        """Advance to the next deadline.
+
+        :return: seconds to wait until the next run
+        :rtype: float
+        """
+        self.deadline += self.interval
+        now = time.monotonic()
+
+        if now <= self.deadline:
+            return self.deadline - now
+
+        self.overruns += 1
+
+        if (self.catch_up is True) or (self.interval <= 0.0):
+            return 0.0
+
+        missed = int(math.ceil((now - self.deadline) / self.interval))
+        self.missed += missed
+        self.deadline += missed * self.interval
+        return self.deadline - now
+
+    def wait(self):
+        delay = self.delay()
+        if delay > 0.0:
+            time.sleep(delay)
+        return
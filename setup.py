@@ -22,7 +22,7 @@ import easyb
 with open("README.md", "r") as fh:
     long_description = fh.read()
 
-packages = find_packages(where=".", exclude=["tests", "tests.console", "tests.data", "tests.device"])
+packages = find_packages(where=".", exclude=["tests", "tests.console", "tests.data", "tests.device", "benchmarks"])
 
 setup(
     name=easyb.__name__,
@@ -24,7 +24,7 @@ from easyb.data.base import Type
 from easyb.command import Command
 from easyb.device import Device
 from easyb.message import Message
-from easyb.bit import Value
+from easyb.bit import Value, create_crc
 from easyb.definitions import Error
 
 __all__ = [
@@ -32,23 +32,35 @@ __all__ = [
     "data",
     "device",
 
+    "aio",
     "bit",
+    "bulk",
+    "bus",
+    "capture",
     "command",
     "config",
+    "decoder",
     "definitions",
+    "engine",
+    "logging",
     "message",
     "stream",
+    "timing",
 
     "TestDevice",
     "TestException",
-    "TestSerial"
+    "TestSerial",
+    "TestBusSerial"
 ]
 
 
 class TestDevice(Device):
 
     def __init__(self, **kwargs):
-        Device.__init__(self, name="TEST-DEVICE", wait_time=0.1, address=1, **kwargs)
+        if "address" not in kwargs:
+            kwargs["address"] = 1
+
+        Device.__init__(self, name="TEST-DEVICE", wait_time=0.1, **kwargs)
 
         self.value: float = 0.0
 
@@ -92,13 +104,7 @@ class TestDevice(Device):
     def prepare(self) -> bool:
         return True
 
-    def run(self) -> bool:
-        command = self.get_command(0)
-
-        message = self.execute(command)
-        if message is None:
-            return False
-
+    def measure(self, message: Message) -> bool:
         data = message.stream.data
         bitio = Value(data=data)
 
@@ -116,6 +122,16 @@ class TestDevice(Device):
             easyb.log.inform(self.name, debug)
         return True
 
+    def run(self) -> bool:
+        command = self.get_command(self.measure_command)
+
+        message = self.execute(command)
+        if message is None:
+            return False
+
+        check = self.measure(message)
+        return check
+
     def close(self) -> bool:
         length = len(self.data.rows)
 
@@ -153,6 +169,12 @@ class TestSerial(object):
         self.write_exception: TestException = None
         return
 
+    @property
+    def in_waiting(self) -> int:
+        if self.read_run >= len(self.read_data):
+            return 0
+        return len(self.read_data[self.read_run])
+
     def open(self):
         self.is_open = True
         return
@@ -188,3 +210,21 @@ class TestSerial(object):
         result = bytes(data)
         self.read_run += 1
         return result
+
+
+class TestBusSerial(TestSerial):
+    """Answers every request with body from the addressed device, like several devices sharing a port."""
+
+    def __init__(self, body: List[int], **kwargs):
+        TestSerial.__init__(self, **kwargs)
+
+        self.body: List[int] = body
+        return
+
+    def write(self, data: bytes):
+        TestSerial.write(self, data)
+
+        header = int(data[0])
+        self.read_data.append([header, 0x05, create_crc(header, 0x05)])
+        self.read_data.append(list(self.body))
+        return
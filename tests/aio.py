@@ -0,0 +1,280 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import fcntl
+import struct
+import termios
+import asyncio
+import unittest
+
+from typing import List
+
+import easyb
+
+from easyb.aio import Transport, SerialTransport, AsyncDevice, run_devices
+from easyb.logging import SerialLogging
+from tests import TestDevice
+
+__all__ = [
+    "TestAio",
+    "TestPtySerial",
+    "TestTransport"
+]
+
+old_logging = easyb.log
+new_logging = SerialLogging()
+new_logging.setup(app="Device", level=0)
+console = new_logging.get_writer("console")
+console.setup(text_space=15, error_index=["ERROR", "EXCEPTION"])
+new_logging.register(console)
+new_logging.open()
+
+
+class TestTransport(Transport):
+
+    def __init__(self):
+        Transport.__init__(self)
+        self.is_open: bool = False
+        self.read_run: int = 0
+        self.read_data: List[List[int]] = []
+        self.write_data: List[List[int]] = []
+        return
+
+    async def open(self) -> bool:
+        self.is_open = True
+        return True
+
+    async def close(self) -> bool:
+        self.is_open = False
+        return True
+
+    async def write(self, data: bytes):
+        self.write_data.append(list(data))
+        return
+
+    # noinspection PyUnusedLocal
+    async def read(self, number: int, timeout: float) -> bytes:
+        await asyncio.sleep(0)
+
+        if self.read_run >= len(self.read_data):
+            return bytes()
+
+        data = self.read_data[self.read_run]
+        self.read_run += 1
+        return bytes(data)
+
+
+class TestPtySerial(object):
+    """Serial port on the slave side of a pseudo terminal, the test writes the responses to the master side."""
+
+    def __init__(self):
+        (self.master, self.slave) = os.openpty()
+        self.timeout: float = 2.0
+        self.is_open: bool = True
+
+        mode = termios.tcgetattr(self.slave)
+        mode[3] = mode[3] & ~(termios.ICANON | termios.ECHO)
+        termios.tcsetattr(self.slave, termios.TCSANOW, mode)
+        return
+
+    def fileno(self) -> int:
+        return self.slave
+
+    @property
+    def in_waiting(self) -> int:
+        data = fcntl.ioctl(self.slave, termios.FIONREAD, struct.pack("I", 0))
+        return struct.unpack("I", data)[0]
+
+    def read(self, count: int = 1) -> bytes:
+        if self.in_waiting == 0:
+            return bytes()
+        return os.read(self.slave, count)
+
+    def write(self, data: bytes):
+        os.write(self.slave, data)
+        return
+
+    def close(self):
+        os.close(self.master)
+        os.close(self.slave)
+        self.is_open = False
+        return
+
+
+# noinspection DuplicatedCode
+class TestAio(unittest.TestCase):
+
+    def setUp(self):
+        easyb.set_logging(new_logging)
+        return
+
+    def tearDown(self):
+        easyb.set_logging(old_logging)
+        return
+
+    def test_execute_1(self):
+        transport = TestTransport()
+        transport.read_data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        device = AsyncDevice(TestDevice(), transport)
+        command = device.device.get_command(0)
+
+        message = asyncio.run(device.execute(command))
+
+        self.assertIsNotNone(message)
+        self.assertEqual(len(message.stream.data), 9)
+        self.assertListEqual(transport.write_data, [[254, 0, 61]])
+        self.assertEqual(device.device.latency.count, 1)
+        return
+
+    def test_execute_2(self):
+        transport = TestTransport()
+        transport.read_data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48]
+        ]
+
+        device = AsyncDevice(TestDevice(), transport)
+        command = device.device.get_command(0)
+
+        message = asyncio.run(device.execute(command))
+
+        self.assertIsNone(message)
+        return
+
+    def test_run_command_1(self):
+        transport = TestTransport()
+        transport.read_data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        device = AsyncDevice(TestDevice(), transport)
+
+        check1 = asyncio.run(device.run_command(0))
+        check2 = asyncio.run(device.run_command(1))
+
+        self.assertTrue(check1)
+        self.assertFalse(check2)
+        self.assertIsNotNone(device.device.message)
+        return
+
+    def test_run_devices_1(self):
+        devices = []
+
+        for address in [1, 2, 3]:
+            transport = TestTransport()
+            transport.read_data = [
+                [0xfe, 0x05, 0x26],
+                [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+                [0xfe, 0x05, 0x26],
+                [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+            ]
+
+            device = TestDevice(interval=0.01)
+            devices.append(AsyncDevice(device, transport))
+
+        check = asyncio.run(run_devices(devices))
+
+        self.assertFalse(check)
+
+        for item in devices:
+            self.assertFalse(item.device.active)
+            self.assertEqual(item.device.interval_counter, 3)
+            self.assertEqual(item.device.data.len, 2)
+        return
+
+    def test_run_loop_1(self):
+        transport = TestTransport()
+        transport.read_data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        device = AsyncDevice(TestDevice(interval=0.01, batch_size=2), transport)
+
+        check1 = device.device.open_storage("text", "AIO")
+        asyncio.run(device.run_loop())
+
+        length = device.device.data.len
+        stored = device.device.data.stored
+
+        check2 = device.device.store("text", "AIO")
+
+        with open("AIO.csv") as f:
+            lines = f.read().splitlines()
+        os.remove("AIO.csv")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertEqual(length, 0)
+        self.assertEqual(stored, 3)
+        self.assertEqual(lines[4], "")
+        return
+
+    def test_serial_transport_1(self):
+        port = TestPtySerial()
+        transport = SerialTransport(port)
+        device = AsyncDevice(TestDevice(), transport)
+
+        async def _execute():
+            loop = asyncio.get_running_loop()
+            await device.connect()
+
+            loop.call_later(0.02, os.write, port.master, bytes([0xfe, 0x05, 0x26, 0x71]))
+            loop.call_later(0.05, os.write, port.master, bytes([0x00, 0x48, 0xf8, 0x7b, 0x25]))
+
+            result = await device.execute(device.device.get_command(0))
+            await transport.close()
+            return result
+
+        message = asyncio.run(_execute())
+        request = os.read(port.master, 16)
+        timeout = port.timeout
+        port.close()
+
+        self.assertIsNotNone(message)
+        self.assertEqual(message.stream.data, bytearray([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]))
+        self.assertEqual(request, bytes([254, 0, 61]))
+        self.assertEqual(timeout, 0)
+        self.assertEqual(len(transport.buffer), 0)
+        return
+
+    def test_serial_transport_2(self):
+        port = TestPtySerial()
+        transport = SerialTransport(port)
+
+        async def _read():
+            await transport.open()
+            result = await transport.read(3, 0.05)
+            await transport.close()
+            return result
+
+        data = asyncio.run(_read())
+        port.close()
+
+        self.assertEqual(data, bytes())
+        return
@@ -18,7 +18,7 @@
 
 import unittest
 
-from easyb.bit import Value, debug_data, crop_u8, crop_u16, crop_u32, check_crc, create_crc
+from easyb.bit import Value, debug_data, crop_u8, crop_u16, crop_u32, check_crc, create_crc, get_crc_table
 
 __all__ = [
     "TestBit"
@@ -42,6 +42,18 @@ class TestBit(unittest.TestCase):
         self.assertEqual(tests, value)
         return
 
+    def test_debug_data_2(self):
+        data = bytearray([0x0a, 0xff, 0x00])
+
+        value1 = debug_data(memoryview(data))
+        value2 = debug_data([])
+        value3 = debug_data([0x100, 1.0])
+
+        self.assertEqual(value1, "0x0a 0xff 0x00")
+        self.assertEqual(value2, "")
+        self.assertEqual(value3, "0x100 0x01")
+        return
+
     def test_create_crc(self):
         byte1 = 0xfe
         byte2 = 0x00
@@ -51,6 +63,32 @@ class TestBit(unittest.TestCase):
         self.assertEqual(crc, 0x3d)
         return
 
+    def test_create_crc_2(self):
+        for byte1 in range(256):
+            for byte2 in range(256):
+                ui16_integer = (byte1 << 8) | byte2
+
+                counter = 0
+                while counter < 16:
+                    if ui16_integer & 0x8000:
+                        ui16_integer = (ui16_integer << 1) ^ 0x0700
+                    else:
+                        ui16_integer = ui16_integer << 1
+                    counter += 1
+
+                check = 255 - ((ui16_integer >> 8) & 0xff)
+                crc = create_crc(byte1, byte2)
+                self.assertEqual(crc, check)
+        return
+
+    def test_get_crc_table(self):
+        table = get_crc_table()
+
+        self.assertIsInstance(table, bytes)
+        self.assertEqual(len(table), 256)
+        self.assertEqual(255 - table[table[0xfe] ^ 0x00], create_crc(0xfe, 0x00))
+        return
+
     def test_crop_u8_1(self):
         value1 = 0xffffffffffffffff
         value2 = 0x00000000000000ff
@@ -99,6 +137,14 @@ class TestBit(unittest.TestCase):
         self.assertEqual(value2, value)
         return
 
+    def test_crop_u32_2(self):
+        value1 = 0x1ffffffff
+        value2 = 0x0ffffffff
+
+        value = crop_u32(value1)
+        self.assertEqual(value2, value)
+        return
+
     def test_check_crc_1(self):
         check = check_crc(0xfe, 0x00, 0x3d)
 
@@ -0,0 +1,174 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import unittest
+import unittest.mock as mock
+
+import easyb
+
+from easyb.bit import Value
+from easyb.bulk import check_crc_bulk, decode16_bulk, decode32_bulk, _check_crc_python, _decode16_python, \
+    _decode32_python
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+_frames16 = bytes([0xfe, 0x05, 0x26, 183, 70, 14,
+                   0xfe, 0x05, 0x26, 0xc0, 0xed, 0x00])
+
+_frames32 = bytes([0xfe, 0x05, 0x26, 0x72, 0xff, 0x00, 0x00, 0xfc, 0x00,
+                   0xfe, 0x65, 0x01, 0x70, 0xf6, 0x91, 0xdf, 0xed, 0x0b])
+
+__all__ = [
+    "TestBulk"
+]
+
+
+# noinspection DuplicatedCode
+class TestBulk(unittest.TestCase):
+
+    def setUp(self):
+        return
+
+    def tearDown(self):
+        return
+
+    def test_check_crc_bulk_1(self):
+        data = bytes([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25,
+                      0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+
+        result = check_crc_bulk(data)
+        check = [bool(item) for item in result]
+
+        self.assertListEqual(check, [True, True, True, True, True, True])
+        return
+
+    def test_check_crc_bulk_2(self):
+        data = bytearray([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+        data[4] = 0x01
+
+        result = check_crc_bulk(memoryview(data))
+        check = [bool(item) for item in result]
+
+        self.assertListEqual(check, [True, False, True])
+        return
+
+    def test_check_crc_bulk_3(self):
+        data = bytes([0xfe, 0x05, 0x26, 0x71])
+
+        self.assertRaises(ValueError, check_crc_bulk, data)
+        return
+
+    def test_check_crc_bulk_4(self):
+        data = bytes([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x26])
+
+        result = _check_crc_python(data)
+
+        self.assertListEqual(result, [True, True, False])
+        return
+
+    def test_decode32_bulk_1(self):
+        frames = bytes([0xfe, 0x05, 0x26, 0x72, 0xff, 0x00, 0x00, 0xfc, 0x00,
+                        0xfe, 0x65, 0x01, 0x70, 0xf6, 0x91, 0xdf, 0xed, 0x0b])
+
+        (values, errors) = decode32_bulk(frames)
+        error = easyb.conf.get_error(int(errors[1]))
+
+        self.assertListEqual([float(item) for item in values], [-0.04, 0.0])
+        self.assertEqual(int(errors[0]), -1)
+        self.assertEqual(error.text, "No sensor")
+        return
+
+    def test_decode32_bulk_2(self):
+        frames = bytearray()
+        check = []
+
+        for value in [53.84, -0.04, 1234.5, -273.15, 0.0]:
+            bitio = Value(value=value)
+            bitio.encode32()
+            frames.extend([0xfe, 0x05, 0x26] + bitio.data)
+
+            bitio = Value(data=frames[-9:])
+            bitio.decode32()
+            check.append(bitio.value)
+
+        (values, errors) = _decode32_python(frames)
+
+        self.assertListEqual(values, check)
+        self.assertListEqual(errors, [-1, -1, -1, -1, -1])
+        return
+
+    def test_decode32_bulk_3(self):
+        frames = bytes([0xfe, 0x05, 0x26, 0x72, 0xff, 0x00, 0x00, 0xfc])
+
+        self.assertRaises(ValueError, decode32_bulk, frames)
+        return
+
+    def test_decode16_bulk_1(self):
+        frames = bytes([0xfe, 0x05, 0x26, 183, 70, 14,
+                        0xfe, 0x05, 0x26, 0xc0, 0xed, 0x00])
+
+        (values, errors) = decode16_bulk(frames)
+        error = easyb.conf.get_error(int(errors[1]))
+
+        self.assertListEqual([float(item) for item in values], [7.0, 0.0])
+        self.assertEqual(int(errors[0]), -1)
+        self.assertEqual(error.text, "No sensor")
+        return
+
+    def test_decode16_bulk_2(self):
+        frames = bytes([0xfe, 0x05, 0x26, 183, 70, 14,
+                        0xfe, 0x05, 0x26, 0xc0, 0xed, 0x00])
+
+        (values, errors) = _decode16_python(frames)
+
+        self.assertListEqual(values, [7.0, 0.0])
+        self.assertListEqual(errors, [-1, 0x3fed])
+        self.assertRaises(ValueError, decode16_bulk, frames[0:8])
+        return
+
+    @mock.patch("easyb.bulk.numpy", new=None)
+    def test_fallback_1(self):
+        check = check_crc_bulk(_frames32)
+        (values16, errors16) = decode16_bulk(_frames16)
+        (values32, errors32) = decode32_bulk(_frames32)
+
+        self.assertIsInstance(check, list)
+        self.assertListEqual(values16, [7.0, 0.0])
+        self.assertListEqual(errors16, [-1, 0x3fed])
+        self.assertListEqual(values32, [-0.04, 0.0])
+        self.assertEqual(errors32[0], -1)
+        return
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_1(self):
+        check = check_crc_bulk(_frames32)
+        (values16, errors16) = decode16_bulk(_frames16)
+        (values32, errors32) = decode32_bulk(_frames32)
+
+        self.assertIsInstance(check, numpy.ndarray)
+        self.assertIsInstance(values16, numpy.ndarray)
+        self.assertEqual(values16.dtype, numpy.float64)
+        self.assertEqual(errors16.dtype, numpy.int32)
+        self.assertListEqual(values16.tolist(), _decode16_python(_frames16)[0])
+        self.assertListEqual(errors16.tolist(), _decode16_python(_frames16)[1])
+        self.assertListEqual(values32.tolist(), _decode32_python(_frames32)[0])
+        self.assertListEqual(errors32.tolist(), _decode32_python(_frames32)[1])
+        return
@@ -0,0 +1,207 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import time
+import threading
+import unittest
+import unittest.mock as mock
+
+import easyb
+
+from easyb.bus import Bus
+from easyb.logging import SerialLogging
+from tests import TestDevice, TestSerial, TestBusSerial
+
+__all__ = [
+    "TestBus"
+]
+
+old_logging = easyb.log
+new_logging = SerialLogging()
+new_logging.setup(app="Device", level=0)
+console = new_logging.get_writer("console")
+console.setup(text_space=15, error_index=["ERROR", "EXCEPTION"])
+new_logging.register(console)
+new_logging.open()
+
+
+# noinspection DuplicatedCode
+class TestBus(unittest.TestCase):
+
+    def setUp(self):
+        easyb.set_logging(new_logging)
+        return
+
+    def tearDown(self):
+        easyb.set_logging(old_logging)
+        return
+
+    def test_add_device_1(self):
+        bus = Bus(port="TEST")
+
+        check1 = bus.add_device(TestDevice(address=1))
+        check2 = bus.add_device(TestDevice(address=2))
+        check3 = bus.add_device(TestDevice(address=2))
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertFalse(check3)
+        self.assertEqual(len(bus.devices), 2)
+        self.assertIsNotNone(bus.get_device(2))
+        self.assertIsNone(bus.get_device(3))
+        self.assertTrue(bus.devices[0].response_driven)
+        return
+
+    def test_run_once_1(self):
+        serial = TestSerial()
+        serial.read_data = [
+            [0xfd, 0x05, 0x19],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        bus = Bus(port="TEST")
+        bus.add_device(TestDevice(address=1), priority=0, interval=10.0)
+        bus.add_device(TestDevice(address=2), priority=1, interval=10.0)
+        bus.serial = serial
+
+        for device in bus.devices:
+            device.serial = serial
+
+        bus.start()
+        device1 = bus.run_once()
+        device2 = bus.run_once()
+
+        self.assertEqual(device1.address, 2)
+        self.assertEqual(device2.address, 1)
+        self.assertEqual(serial.write_data[0][0], 253)
+        self.assertEqual(serial.write_data[1][0], 254)
+        self.assertIsNone(bus.next_schedule())
+        return
+
+    def test_run_once_3(self):
+        serial = TestSerial()
+        serial.read_data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfd, 0x05, 0x19],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        bus = Bus(port="TEST")
+        bus.add_device(TestDevice(address=2), interval=10.0)
+        bus.serial = serial
+        bus.devices[0].serial = serial
+
+        bus.start()
+        device = bus.run_once()
+
+        self.assertTrue(device.shared_port)
+        self.assertTrue(device.status)
+        self.assertEqual(device.data.len, 1)
+        self.assertEqual(serial.read_run, 4)
+        return
+
+    def test_run_once_4(self):
+        serial = TestBusSerial([0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+        sleep = time.sleep
+
+        bus = Bus(port="TEST")
+        bus.add_device(TestDevice(address=1), interval=0.05)
+        bus.serial = serial
+        bus.devices[0].serial = serial
+
+        bus.start()
+        device1 = bus.run_once()
+
+        # wake up early, run_once has to wait again instead of failing on a missing schedule
+        with mock.patch("time.sleep", new=mock.Mock(side_effect=lambda delay: sleep(delay / 4))) as early:
+            device2 = bus.run_once()
+
+        self.assertIs(device1, device2)
+        self.assertGreater(early.call_count, 1)
+        self.assertEqual(device2.interval_counter, 2)
+        return
+
+    def test_run_once_2(self):
+        serial = TestSerial()
+        serial.read_data = [
+            [0xfd, 0x05, 0x19],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        bus = Bus(port="TEST")
+        bus.add_device(TestDevice(address=1, batch_size=1), priority=0, interval=10.0)
+        bus.add_device(TestDevice(address=2, capture=True), priority=1, interval=10.0)
+        bus.serial = serial
+
+        for device in bus.devices:
+            device.serial = serial
+
+        check1 = bus.devices[0].open_storage("text", "BUS")
+
+        bus.start()
+        device1 = bus.run_once()
+        device2 = bus.run_once()
+
+        frames = len(device1.frames)
+        stored = device2.data.stored
+
+        check2 = device2.store("text", "BUS")
+        os.remove("BUS.csv")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertEqual(frames, 1)
+        self.assertEqual(device1.data.len, 0)
+        self.assertEqual(device1.interval_counter, 1)
+        self.assertEqual(stored, 1)
+        self.assertEqual(device2.data.len, 0)
+        return
+
+    def test_run_loop_1(self):
+        serial = TestBusSerial([0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+
+        bus = Bus(port="TEST")
+        bus.add_device(TestDevice(address=1), interval=0.05)
+        bus.add_device(TestDevice(address=2), interval=0.05)
+        bus.add_device(TestDevice(address=3), interval=0.05)
+        bus.serial = serial
+
+        for device in bus.devices:
+            device.serial = serial
+
+        thread = threading.Thread(target=bus.run_loop)
+        thread.start()
+        time.sleep(0.01)
+
+        while bus.active is True:
+            if bus.counter >= 9:
+                bus.do_abort(None, None)
+            time.sleep(0.01)
+
+        self.assertTrue(bus.status)
+
+        for device in bus.devices:
+            self.assertGreaterEqual(device.interval_counter, 3)
+            self.assertEqual(device.data.len, device.interval_counter)
+        return
@@ -0,0 +1,105 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import unittest
+
+from easyb.capture import Capture
+
+__all__ = [
+    "TestCapture"
+]
+
+_frame = bytes([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+
+
+# noinspection DuplicatedCode
+class TestCapture(unittest.TestCase):
+
+    def setUp(self):
+        return
+
+    def tearDown(self):
+        return
+
+    def test_add_1(self):
+        capture = Capture(capacity=4)
+
+        check1 = capture.add(_frame, 1000, 0)
+        check2 = capture.add(_frame[0:6], 2000, 1)
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertEqual(len(capture), 2)
+        self.assertEqual(len(capture.buffer), 36)
+        self.assertEqual(bytes(capture.data[0:9]), _frame)
+        self.assertEqual(len(capture.data), 18)
+        return
+
+    def test_add_2(self):
+        capture = Capture(frame_size=6)
+
+        check = capture.add(_frame, 1000, 0)
+
+        self.assertFalse(check)
+        self.assertEqual(len(capture), 0)
+        return
+
+    def test_grow_1(self):
+        capture = Capture(capacity=2)
+
+        for number in range(5):
+            capture.add(_frame, 1000 + number, number)
+
+        (timestamp, number, frame) = capture.get(4)
+
+        self.assertEqual(len(capture), 5)
+        self.assertEqual(capture.capacity, 8)
+        self.assertEqual(len(capture.timestamps), 8)
+        self.assertEqual(timestamp, 1004)
+        self.assertEqual(number, 4)
+        self.assertEqual(frame, _frame)
+        return
+
+    def test_grow_2(self):
+        capture = Capture(capacity=2)
+        capture.add(_frame, 1000, 0)
+        capture.add(_frame, 1001, 1)
+
+        view = capture.data
+        check = capture.add(_frame, 1002, 2)
+
+        self.assertTrue(check)
+        self.assertEqual(len(view), 18)
+        self.assertEqual(bytes(view[9:18]), _frame)
+        self.assertEqual(bytes(capture.data[18:27]), _frame)
+        self.assertEqual(capture.get(2)[0], 1002)
+        return
+
+    def test_get_1(self):
+        capture = Capture()
+        capture.add(_frame[0:6], 1000, 7)
+
+        (timestamp, number, frame) = capture.get(0)
+        capture.clear()
+
+        self.assertEqual(timestamp, 1000)
+        self.assertEqual(number, 7)
+        self.assertEqual(frame, _frame[0:6])
+        self.assertEqual(len(capture), 0)
+        self.assertRaises(IndexError, capture.get, 0)
+        return
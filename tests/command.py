@@ -54,3 +54,19 @@ class TestCommand(unittest.TestCase):
         self.assertEqual(command.length, Length.Byte9)
         self.assertEqual(self._message, "TEST")
         return
+
+    def test_command_02(self):
+        command = Command(name="Messwert lesen", address=1, code=15, length=Length.Byte6, param=[202, 0])
+
+        self.assertIsNone(command.frame)
+
+        command.frame = bytes([0xfe, 0xf2, 0xed, 0x35, 0x00, 0x47])
+        self.assertEqual(command.frame, bytes([0xfe, 0xf2, 0xed, 0x35, 0x00, 0x47]))
+
+        command.param[0] = 199
+        self.assertIsNone(command.frame)
+
+        command.frame = bytes([0xfe, 0xf2, 0xed, 0x38, 0x00, 0x6f])
+        command.address = 2
+        self.assertIsNone(command.frame)
+        return
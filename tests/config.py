@@ -17,21 +17,37 @@
 #
 
 import unittest
+import easyb
+import json
+import os
+import sys
+import subprocess
 
+from easyb.logging import SerialLogging
 from easyb.config import Config
 
 __all__ = [
     "TestConfig"
 ]
 
+old_logging = easyb.log
+new_logging = SerialLogging()
+new_logging.setup(app="Device", level=0)
+console = new_logging.get_writer("console")
+console.setup(text_space=15, error_index=["ERROR", "EXCEPTION"])
+new_logging.register(console)
+new_logging.open()
+
 
 # noinspection DuplicatedCode
 class TestConfig(unittest.TestCase):
 
     def setUp(self):
+        easyb.set_logging(new_logging)
         return
 
     def tearDown(self):
+        easyb.set_logging(old_logging)
         return
 
     def test_config_01(self):
@@ -65,3 +81,70 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(status_list[0].bit, 0x0001)
         self.assertEqual(status_list[0].text, "Max. alarm")
         return
+
+    def test_config_03(self):
+        config1 = Config()
+        config2 = Config()
+
+        error = config1.get_error(16370)
+
+        self.assertIs(config1.error, config2.error)
+        self.assertEqual(error.text, "Recording error: marker data invalid")
+        return
+
+    def test_config_04(self):
+        with open("errors.json", "w") as f:
+            json.dump([{"code": 16365, "text": "Sensor missing"}, {"code": 1, "text": "Test"}], f)
+
+        with open("units.json", "w") as f:
+            json.dump([{"code": 999, "value": "ppm"}], f)
+
+        config = Config(errors="errors.json", units="units.json")
+        default = Config()
+
+        os.remove("errors.json")
+        os.remove("units.json")
+
+        self.assertEqual(config.get_error(16365).text, "Sensor missing")
+        self.assertEqual(config.get_error(1).text, "Test")
+        self.assertEqual(config.get_error(16364).text, "Battery empty")
+        self.assertEqual(config.get_unit(999).value, "ppm")
+        self.assertEqual(config.get_unit(1).value, "°C")
+        self.assertEqual(default.get_error(16365).text, "No sensor")
+        self.assertIsNone(default.get_unit(999))
+        return
+
+    def test_config_05(self):
+        with open("errors.json", "w") as f:
+            json.dump([{"code": 1}], f)
+
+        with open("units.json", "w") as f:
+            json.dump({"code": 999, "value": "ppm"}, f)
+
+        config = Config()
+
+        check1 = config.load_errors("errors.json")
+        check2 = config.load_units("units.json")
+        check3 = config.load_units("missing.json")
+
+        os.remove("errors.json")
+        os.remove("units.json")
+
+        self.assertFalse(check1)
+        self.assertFalse(check2)
+        self.assertFalse(check3)
+        self.assertIsNone(config.get_error(1))
+        return
+
+    def test_config_06(self):
+        statement = "import sys, easyb; print('easyb.config' in sys.modules, 'easyb.logging' in sys.modules)"
+        process = subprocess.run([sys.executable, "-c", statement], stdout=subprocess.PIPE, universal_newlines=True)
+
+        config1 = easyb.conf
+        config2 = easyb.conf
+
+        self.assertEqual(process.stdout.strip(), "False False")
+        self.assertIs(config1, config2)
+        self.assertIsInstance(config1, Config)
+        self.assertRaises(AttributeError, getattr, easyb, "unknown")
+        return
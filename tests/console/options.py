@@ -28,14 +28,18 @@ class TestOptions(object):
         self.read = False
         self.list = False
         self.interval = 2.0
+        self.config = ""
 
         self.device = ""
         self.command = 0
+        self.address = 1
 
         self.port = ""
         self.baudrate = 4800
         self.timeout = 2
         self.writetimeout = 2
+        self.response = False
+        self.raw = False
 
         self.output = "none"
         self.filename = "measurement"
@@ -119,3 +123,12 @@ class TestOptions(object):
         self.port = "TEST"
         self.verbose = 2
         self.read = True
+
+    def test_14(self):
+        self.device = "GMH 3710"
+        self.output = "text"
+        self.filename = "TESTCLOSE"
+        self.command = 0
+        self.port = "TEST"
+        self.verbose = 2
+        self.read = True
@@ -17,6 +17,7 @@
 #
 
 import unittest
+import unittest.mock as mock
 import easyb
 import os
 
@@ -24,7 +25,7 @@ from datetime import datetime
 
 from easyb.logging import SerialLogging
 from easyb.data import Data
-from easyb.data.base import Type
+from easyb.data.base import Type, to_epoch
 
 __all__ = [
     "TestData"
@@ -172,3 +173,112 @@ class TestData(unittest.TestCase):
         check = item.store("unknown", "Test")
         self.assertFalse(check)
         return
+
+    @mock.patch("easyb.data.arrow.pyarrow", new=None)
+    def test_store_04(self):
+        item = Data()
+        item.add_column("value", "Value", Type.float)
+        item.create_row()
+
+        check1 = item.store("parquet", "Test")
+        check2 = item.open("parquet", "Test")
+
+        self.assertFalse(check1)
+        self.assertFalse(check2)
+        self.assertFalse(os.path.exists("Test.parquet"))
+        return
+
+    # noinspection PyUnresolvedReferences
+    def test_create_row_02(self):
+        item = Data()
+
+        item.add_column("datetime", "Datetime", Type.datetime)
+        item.add_column("value", "Value", Type.float)
+
+        for counter in range(10):
+            row = item.create_row()
+            row.value = float(counter)
+
+        self.assertEqual(item.len, 10)
+        self.assertEqual(len(item.rows), 10)
+        self.assertEqual(item.rows[-1].value, 9.0)
+        self.assertEqual(item.values["value"].typecode, "d")
+        self.assertEqual(item.values["datetime"].typecode, "q")
+        self.assertListEqual([row.value for row in item.rows], [float(x) for x in range(10)])
+        self.assertRaises(IndexError, item.rows.__getitem__, 10)
+        return
+
+    # noinspection PyUnresolvedReferences
+    def test_create_row_03(self):
+        item = Data()
+
+        item.add_column("value", "Value", Type.float)
+        row = item.create_row()
+
+        self.assertRaises(AttributeError, getattr, row, "unknown")
+        self.assertRaises(AttributeError, setattr, row, "unknown", 1)
+
+        item.clear()
+        self.assertEqual(item.len, 0)
+        self.assertEqual(len(item.values["value"]), 0)
+        return
+
+    def test_create_row_04(self):
+        item = Data()
+        timestamp = datetime(2020, 1, 1, 12, 30, 15, 250)
+
+        item.add_column("datetime", "Time", Type.datetime)
+        item.add_column("value", "Value", Type.float)
+        row = item.create_row(to_epoch(timestamp))
+
+        self.assertEqual(row.datetime, timestamp)
+        self.assertEqual(item.values["datetime"][0], to_epoch(timestamp))
+        return
+
+    # noinspection PyUnresolvedReferences
+    def test_create_row_05(self):
+        item = Data()
+
+        item.add_column("counter", "Counter", Type.integer)
+        item.add_column("value", "Value", Type.float)
+        item.add_column("checked", "Checked", Type.bool)
+        item.add_column("note", "Note", Type.string)
+        row = item.create_row()
+
+        row.counter = 2.6
+        row.value = 3
+        row.checked = 1
+        row.note = 4
+
+        self.assertEqual(row.counter, 3)
+        self.assertEqual(row.value, 3.0)
+        self.assertIs(row.checked, True)
+        self.assertEqual(row.note, "4")
+
+        row.counter = None
+        row.value = None
+        row.note = None
+
+        self.assertEqual(row.counter, 0)
+        self.assertEqual(row.value, 0.0)
+        self.assertEqual(row.note, "")
+        self.assertRaises(ValueError, setattr, row, "value", "high")
+        return
+
+    # noinspection PyUnresolvedReferences
+    def test_create_row_06(self):
+        item = Data()
+
+        item.add_column("value", "Value", Type.float)
+        row1 = item.create_row()
+        row1.value = 1.0
+
+        item.clear()
+        row2 = item.create_row()
+        row2.value = 2.0
+
+        self.assertRaises(IndexError, getattr, row1, "value")
+        self.assertRaises(IndexError, setattr, row1, "value", 3.0)
+        self.assertEqual(row2.value, 2.0)
+        self.assertEqual(item.rows[0].value, 2.0)
+        return
@@ -0,0 +1,144 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import unittest
+import easyb
+import os
+
+from datetime import datetime, timedelta
+
+from easyb.logging import SerialLogging
+from easyb.data import Data
+from easyb.data.base import Type, Info
+from easyb.data.arrow import ParquetStorage, read_infos
+
+try:
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+__all__ = [
+    "TestParquet"
+]
+
+old_logging = easyb.log
+new_logging = SerialLogging()
+new_logging.setup(app="Device", level=0)
+console = new_logging.get_writer("console")
+console.index.append("SERIAL")
+
+# noinspection PyUnresolvedReferences
+console.add_style("SERIAL", "BRIGHT", "YELLOW", "")
+console.setup(text_space=15, error_index=["ERROR", "EXCEPTION"])
+new_logging.register(console)
+new_logging.open()
+
+_now = datetime(2020, 5, 17, 9, 4, 3, 123456)
+
+
+# noinspection DuplicatedCode
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestParquet(unittest.TestCase):
+
+    def setUp(self):
+        easyb.set_logging(new_logging)
+        return
+
+    def tearDown(self):
+        easyb.set_logging(old_logging)
+        return
+
+    @staticmethod
+    def _get_data() -> Data:
+        item = Data()
+        item.filename = "TEST"
+
+        item.add_column("datetime", "Datetime", Type.datetime)
+        item.add_column("checked", "Is checked", Type.bool)
+        item.add_column("temp", "Temperature", Type.float)
+        item.add_column("counter", "Counter", Type.integer)
+        item.add_column("note", "Note", Type.string)
+
+        for counter in range(3):
+            row = item.create_row()
+
+            row.datetime = _now + timedelta(seconds=counter)
+            row.checked = counter == 1
+            row.temp = 0.1 * counter
+            row.counter = counter
+            row.note = "Jo{0:d}".format(counter)
+        return item
+
+    def test_constructor(self):
+        data = self._get_data()
+
+        item = ParquetStorage(data)
+        self.assertEqual(item.name, "PARQUET")
+        self.assertIsNone(item.writer)
+        return
+
+    def test_store(self):
+        data = self._get_data()
+        data.infos.append(Info("Start", Type.datetime, _now))
+        data.infos.append(Info("Duration", Type.datetime, timedelta(seconds=90)))
+        data.status.append(Info("Error", Type.bool, True))
+
+        check = data.store("parquet", "TEST")
+
+        table = pyarrow.parquet.read_table("TEST.parquet")
+        (infos, status) = read_infos("TEST.parquet")
+        os.remove("TEST.parquet")
+
+        self.assertTrue(check)
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column_names, ["datetime", "checked", "temp", "counter", "note"])
+        self.assertEqual(table.column("datetime").to_pylist()[1], _now + timedelta(seconds=1))
+        self.assertEqual(table.column("checked").to_pylist(), [False, True, False])
+        self.assertEqual(table.column("temp").to_pylist(), [0.0, 0.1, 0.2])
+        self.assertEqual(table.column("counter").to_pylist(), [0, 1, 2])
+        self.assertEqual(table.column("note").to_pylist(), ["Jo0", "Jo1", "Jo2"])
+        self.assertEqual(infos[1].value, timedelta(seconds=90))
+        self.assertEqual(status[0].name, "Error")
+        return
+
+    def test_stream(self):
+        data = self._get_data()
+
+        check1 = data.open("parquet", "STREAM")
+        data.storage.row_group_size = 4
+
+        check2 = data.flush()
+
+        for counter in range(3):
+            row = data.create_row()
+            row.counter = counter + 3
+
+        check3 = data.flush()
+        check4 = data.close()
+
+        metadata = pyarrow.parquet.ParquetFile("STREAM.parquet").metadata
+        table = pyarrow.parquet.read_table("STREAM.parquet")
+        os.remove("STREAM.parquet")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertTrue(check3)
+        self.assertTrue(check4)
+        self.assertEqual(metadata.num_row_groups, 2)
+        self.assertEqual(table.column("counter").to_pylist(), [0, 1, 2, 3, 4, 5])
+        return
@@ -0,0 +1,272 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import unittest
+import unittest.mock as mock
+import easyb
+import os
+
+from datetime import datetime, timedelta
+
+from easyb.logging import SerialLogging
+from easyb.data import Data
+from easyb.data.base import Type, Info, to_epoch
+from easyb.data.binary import BinaryStorage, BinaryReader
+
+mocked_open = unittest.mock.mock_open()
+mocked_open.side_effect = OSError(5)
+
+__all__ = [
+    "TestBinary"
+]
+
+old_logging = easyb.log
+new_logging = SerialLogging()
+new_logging.setup(app="Device", level=0)
+console = new_logging.get_writer("console")
+console.index.append("SERIAL")
+
+# noinspection PyUnresolvedReferences
+console.add_style("SERIAL", "BRIGHT", "YELLOW", "")
+console.setup(text_space=15, error_index=["ERROR", "EXCEPTION"])
+new_logging.register(console)
+new_logging.open()
+
+_now = datetime(2020, 5, 17, 9, 4, 3, 123456)
+
+
+# noinspection DuplicatedCode
+class TestBinary(unittest.TestCase):
+
+    def setUp(self):
+        easyb.set_logging(new_logging)
+        return
+
+    def tearDown(self):
+        easyb.set_logging(old_logging)
+        return
+
+    @staticmethod
+    def _get_data() -> Data:
+        item = Data()
+        item.filename = "TEST"
+
+        item.add_column("datetime", "Datetime", Type.datetime)
+        item.add_column("checked", "Is checked", Type.bool)
+        item.add_column("temp", "Temperature", Type.float)
+        item.add_column("counter", "Counter", Type.integer)
+        item.add_column("note", "Note", Type.string)
+
+        for counter in range(3):
+            row = item.create_row()
+
+            row.datetime = _now + timedelta(seconds=counter)
+            row.checked = counter == 1
+            row.temp = 0.1 * counter
+            row.counter = counter
+            row.note = "Jo{0:d}".format(counter)
+        return item
+
+    def test_constructor(self):
+        data = self._get_data()
+
+        item = BinaryStorage(data)
+        self.assertEqual(item.name, "BINARY")
+        self.assertIsNone(item.file)
+        return
+
+    def test_store_01(self):
+        data = self._get_data()
+        data.infos.append(Info("Start", Type.datetime, _now))
+        data.infos.append(Info("Duration", Type.datetime, timedelta(seconds=90)))
+        data.infos.append(Info("Einheit", Type.string, "°C"))
+        data.status.append(Info("Error", Type.bool, True))
+
+        check1 = data.store("binary", "TEST")
+
+        reader = BinaryReader("TEST.ebd")
+        check2 = reader.open()
+
+        datetimes = list(reader.get_column("datetime"))
+        checked = [bool(x) for x in reader.get_column("checked")]
+        temps = list(reader.get_column("temp"))
+        counters = list(reader.get_column("counter"))
+        notes = list(reader.get_column("note"))
+
+        columns = [(column.name, column.description, column.type) for column in reader.columns]
+        infos = [(info.name, info.type, info.value) for info in reader.infos]
+        status = [(info.name, info.type, info.value) for info in reader.status]
+        length = reader.len
+
+        reader.close()
+        os.remove("TEST.ebd")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertEqual(length, 3)
+        self.assertEqual(columns[4], ("note", "Note", Type.string))
+        self.assertEqual(datetimes, [to_epoch(_now) + x * 1000000 for x in range(3)])
+        self.assertEqual(checked, [False, True, False])
+        self.assertEqual(temps, [0.0, 0.1, 0.2])
+        self.assertEqual(counters, [0, 1, 2])
+        self.assertEqual(notes, ["Jo0", "Jo1", "Jo2"])
+        self.assertEqual(infos[0], ("Start", Type.datetime, _now))
+        self.assertEqual(infos[1], ("Duration", Type.datetime, timedelta(seconds=90)))
+        self.assertEqual(infos[2], ("Einheit", Type.string, "°C"))
+        self.assertEqual(status[0], ("Error", Type.bool, True))
+        return
+
+    @mock.patch('builtins.open', new=mocked_open)
+    def test_store_02(self):
+        data = self._get_data()
+
+        item = BinaryStorage(data)
+
+        check = item.store()
+        self.assertFalse(check)
+        return
+
+    def test_stream_01(self):
+        data = self._get_data()
+
+        check1 = data.open("binary", "STREAM")
+        check2 = data.flush()
+
+        row = data.create_row()
+        row.counter = 3
+
+        check3 = data.flush()
+
+        reader = BinaryReader("STREAM.ebd")
+        check4 = reader.open()
+        length1 = reader.len
+        infos = len(reader.infos)
+        reader.close()
+
+        check5 = data.close()
+
+        reader = BinaryReader("STREAM.ebd")
+        reader.open()
+        length2 = reader.len
+        counters = list(reader.get_column("counter"))
+        reader.close()
+
+        os.remove("STREAM.ebd")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertTrue(check3)
+        self.assertTrue(check4)
+        self.assertTrue(check5)
+        self.assertEqual(length1, 4)
+        self.assertEqual(infos, 0)
+        self.assertEqual(length2, 4)
+        self.assertEqual(counters, [0, 1, 2, 3])
+        return
+
+    def test_store_03(self):
+        data = self._get_data()
+        row = data.create_row()
+        row.note = "Recording error: error 6, system restart, Überlauf " * 2
+
+        item = BinaryStorage(data)
+        check = item.store()
+
+        reader = BinaryReader("TEST.ebd")
+        reader.open()
+        notes = reader.get_column("note")
+        reader.close()
+        os.remove("TEST.ebd")
+
+        self.assertTrue(check)
+        self.assertGreater(item.widths[4], item.string_size)
+        self.assertEqual(notes[3], "Recording error: error 6, system restart, Überlauf " * 2)
+        return
+
+    def test_stream_02(self):
+        data = self._get_data()
+        check1 = data.open("binary", "STREAM")
+
+        row = data.create_row()
+        row.note = "x" + "Ä" * 40
+
+        with mock.patch.object(easyb.log, "warn") as warn:
+            check2 = data.flush()
+
+        data.close()
+
+        reader = BinaryReader("STREAM.ebd")
+        reader.open()
+        notes = reader.get_column("note")
+        python = reader._get_column_python(reader.columns[4])
+        reader.close()
+        os.remove("STREAM.ebd")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertEqual(warn.call_count, 1)
+        self.assertEqual(notes[3], "x" + "Ä" * 31)
+        self.assertEqual(python, notes)
+        return
+
+    def test_reader_01(self):
+        with open("BROKEN.ebd", "wb") as f:
+            f.write(b"NOTEASYB" + bytes(24))
+
+        reader = BinaryReader("BROKEN.ebd")
+        check1 = reader.open()
+        os.remove("BROKEN.ebd")
+
+        reader = BinaryReader("MISSING.ebd")
+        check2 = reader.open()
+
+        self.assertFalse(check1)
+        self.assertFalse(check2)
+        return
+
+    def test_reader_02(self):
+        data = self._get_data()
+        data.store("binary", "TEST")
+
+        reader = BinaryReader("TEST.ebd")
+        reader.open()
+
+        self.assertRaises(ValueError, reader.get_column, "unknown")
+        reader.close()
+        os.remove("TEST.ebd")
+        return
+
+    def test_reader_03(self):
+        data = self._get_data()
+        data.store("binary", "TEST")
+
+        with open("TEST.ebd", "r+b") as f:
+            content = f.read()
+            f.seek(content.index(b"Jo1"))
+            f.write(b"J\xc3")
+
+        reader = BinaryReader("TEST.ebd")
+        reader.open()
+        notes = reader.get_column("note")
+        python = reader._get_column_python(reader.columns[4])
+        reader.close()
+        os.remove("TEST.ebd")
+
+        self.assertEqual(notes, ["Jo0", "J\ufffd1", "Jo2"])
+        self.assertEqual(python, notes)
+        return
@@ -110,3 +110,22 @@ class TestExcel(unittest.TestCase):
         self.assertTrue(check1)
         os.remove("TEST.xlsx")
         return
+
+    def test_store_2(self):
+        data = self._get_data()
+
+        for counter in range(100):
+            row = data.create_row()
+            row.counter = counter
+
+        item = ExcelStorage(data)
+
+        check = item.store()
+        self.assertTrue(check)
+        self.assertEqual(item.row, 102)
+        self.assertEqual(len(item.formats), len(Type))
+
+        check1 = os.path.exists("TEST.xlsx")
+        self.assertTrue(check1)
+        os.remove("TEST.xlsx")
+        return
@@ -0,0 +1,201 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import unittest
+import unittest.mock as mock
+import sqlite3
+import easyb
+import os
+
+from datetime import datetime, timedelta
+
+from easyb.logging import SerialLogging
+from easyb.data import Data
+from easyb.data.base import Type, Info, to_epoch
+from easyb.data.sqlite import SqliteStorage, query_range
+
+__all__ = [
+    "TestSqlite"
+]
+
+old_logging = easyb.log
+new_logging = SerialLogging()
+new_logging.setup(app="Device", level=0)
+console = new_logging.get_writer("console")
+console.index.append("SERIAL")
+
+# noinspection PyUnresolvedReferences
+console.add_style("SERIAL", "BRIGHT", "YELLOW", "")
+console.setup(text_space=15, error_index=["ERROR", "EXCEPTION"])
+new_logging.register(console)
+new_logging.open()
+
+_now = datetime(2020, 5, 17, 9, 4, 3, 123456)
+
+
+def _remove(filename: str):
+    for suffix in ["", "-wal", "-shm"]:
+        if os.path.exists(filename + suffix):
+            os.remove(filename + suffix)
+    return
+
+
+# noinspection DuplicatedCode
+class TestSqlite(unittest.TestCase):
+
+    def setUp(self):
+        easyb.set_logging(new_logging)
+        return
+
+    def tearDown(self):
+        easyb.set_logging(old_logging)
+        return
+
+    @staticmethod
+    def _get_data() -> Data:
+        item = Data()
+        item.filename = "TEST"
+
+        item.add_column("datetime", "Datetime", Type.datetime)
+        item.add_column("checked", "Is checked", Type.bool)
+        item.add_column("temp", "Temperature", Type.float)
+        item.add_column("counter", "Counter", Type.integer)
+        item.add_column("note", "Note", Type.string)
+
+        for counter in range(3):
+            row = item.create_row()
+
+            row.datetime = _now + timedelta(seconds=counter)
+            row.checked = counter == 1
+            row.temp = 0.1 * counter
+            row.counter = counter
+            row.note = "Jo{0:d}".format(counter)
+        return item
+
+    def test_constructor(self):
+        data = self._get_data()
+
+        item = SqliteStorage(data)
+        self.assertEqual(item.name, "SQLITE")
+        self.assertIsNone(item.connection)
+        return
+
+    def test_store_01(self):
+        data = self._get_data()
+        data.infos.append(Info("Start", Type.datetime, _now))
+        data.status.append(Info("Error", Type.bool, True))
+
+        check1 = data.store("sqlite", "TEST")
+        check2 = data.store("sqlite", "TEST")
+
+        connection = sqlite3.connect("TEST.sqlite")
+        sessions = connection.execute("SELECT id FROM sessions").fetchall()
+        mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        indexes = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+        infos = connection.execute("SELECT name, value FROM infos WHERE session = 2").fetchall()
+        status = connection.execute("SELECT name, value FROM status WHERE session = 2").fetchall()
+        rows = connection.execute("SELECT * FROM session_2").fetchall()
+        connection.close()
+
+        selected = query_range("TEST.sqlite", 1, _now + timedelta(seconds=1), _now + timedelta(seconds=10))
+        _remove("TEST.sqlite")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertEqual(sessions, [(1,), (2,)])
+        self.assertEqual(mode, "wal")
+        self.assertEqual(indexes, [("session_1_datetime",), ("session_2_datetime",)])
+        self.assertEqual(infos, [("Start", '["datetime", {0:d}]'.format(to_epoch(_now)))])
+        self.assertEqual(status, [("Error", "true")])
+        self.assertEqual(rows[1], (to_epoch(_now) + 1000000, 1, 0.1, 1, "Jo1"))
+        self.assertEqual(len(selected), 2)
+        self.assertEqual(selected[0][3], 1)
+        return
+
+    @mock.patch('sqlite3.connect', new=mock.Mock(side_effect=sqlite3.OperationalError("unable to open")))
+    def test_store_02(self):
+        data = self._get_data()
+
+        item = SqliteStorage(data)
+
+        check = item.store()
+        self.assertFalse(check)
+        return
+
+    def test_stream_01(self):
+        data = self._get_data()
+
+        check1 = data.open("sqlite", "STREAM")
+        check2 = data.flush()
+
+        connection = sqlite3.connect("STREAM.sqlite")
+        count1 = connection.execute("SELECT COUNT(*) FROM session_1").fetchone()[0]
+
+        row = data.create_row()
+        row.counter = 3
+
+        check3 = data.close()
+
+        count2 = connection.execute("SELECT COUNT(*) FROM session_1").fetchone()[0]
+        connection.close()
+        _remove("STREAM.sqlite")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertTrue(check3)
+        self.assertEqual(count1, 3)
+        self.assertEqual(count2, 4)
+        return
+
+    def test_store_03(self):
+        data = self._get_data()
+        data.add_column("Note", "Duplicate", Type.string)
+
+        item = SqliteStorage(data)
+
+        check = item.store()
+        _remove("TEST.sqlite")
+
+        self.assertFalse(check)
+        self.assertIsNone(item.connection)
+        return
+
+    def test_stream_02(self):
+        data = self._get_data()
+
+        check1 = data.open("sqlite", "STREAM")
+        data.add_column("extra", "Extra", Type.integer)
+
+        check2 = data.flush()
+        check3 = data.storage.close()
+        _remove("STREAM.sqlite")
+
+        self.assertTrue(check1)
+        self.assertFalse(check2)
+        self.assertTrue(check3)
+        return
+
+    def test_query_range_01(self):
+        connection = mock.Mock()
+        connection.execute.side_effect = sqlite3.OperationalError("no such table")
+
+        with mock.patch('sqlite3.connect', new=mock.Mock(return_value=connection)):
+            self.assertRaises(sqlite3.OperationalError, query_range, "TEST.sqlite", 1, _now, _now)
+
+        connection.close.assert_called_once_with()
+        return
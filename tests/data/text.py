@@ -27,7 +27,8 @@ from datetime import datetime
 from easyb.logging import SerialLogging
 from easyb.data import Data
 from easyb.data.base import Type, Info
-from easyb.data.text import TextStorage
+from easyb.data.text import TextStorage, convert_time
+from easyb.data.base import to_epoch
 
 mocked_open = unittest.mock.mock_open()
 mocked_open.side_effect = OSError(5)
@@ -140,3 +141,83 @@ class TestText(unittest.TestCase):
         check = item.store()
         self.assertFalse(check)
         return
+
+    def test_stream_01(self):
+        data = self._get_data()
+
+        check1 = data.open("text", "STREAM")
+        row = data.create_row()
+        row.counter = 3
+
+        check2 = data.flush()
+
+        data.infos.append(Info("Test1", Type.integer, 1))
+        check3 = data.close()
+
+        with open("STREAM.csv") as f:
+            lines = f.read().splitlines()
+        os.remove("STREAM.csv")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertTrue(check3)
+        self.assertIsNone(data.storage)
+        self.assertEqual(data.len, 0)
+        self.assertEqual(data.total, 2)
+        self.assertEqual(len(lines), 9)
+        self.assertEqual(lines[0], "Datetime\tIs checked\tTemperature\tCounter\tNote")
+        self.assertTrue(lines[1].endswith("\tFalse\t0.10\t2\tJo"))
+        self.assertTrue(lines[2].endswith("\tFalse\t0.00\t3\t"))
+        self.assertEqual(lines[4], "Name\tValue")
+        self.assertEqual(lines[5], "Test1\t1")
+        return
+
+    @mock.patch('builtins.open', new=mocked_open)
+    def test_stream_02(self):
+        data = self._get_data()
+
+        check1 = data.open("text", "STREAM")
+        check2 = data.flush()
+        check3 = data.close()
+
+        self.assertFalse(check1)
+        self.assertFalse(check2)
+        self.assertFalse(check3)
+        return
+
+    def test_convert_time(self):
+        _now = datetime(2020, 5, 17, 9, 4, 3, 999999)
+
+        text = convert_time(to_epoch(_now))
+        self.assertEqual(text, _now.strftime("%H:%M:%S"))
+
+        _before = datetime(1969, 12, 31, 23, 59, 59, 500000)
+
+        text = convert_time(to_epoch(_before))
+        self.assertEqual(text, "23:59:59")
+        return
+
+    def test_store_03(self):
+        data = self._get_data()
+
+        for counter in range(10):
+            row = data.create_row()
+            row.checked = True
+            row.temp = counter * 0.5
+            row.counter = counter
+
+        item = TextStorage(data)
+        item.chunk_size = 3
+
+        check = item.store()
+
+        with open("TEST.csv") as f:
+            lines = f.read().splitlines()
+        os.remove("TEST.csv")
+
+        self.assertTrue(check)
+        self.assertEqual(len(lines), 16)
+        self.assertTrue(lines[5].endswith("\tFalse\t0.10\t2\tJo"))
+        self.assertTrue(lines[14].endswith("\tTrue\t4.00\t8\t"))
+        self.assertTrue(lines[15].endswith("\tTrue\t4.50\t9\t"))
+        return
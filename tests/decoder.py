@@ -0,0 +1,140 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import unittest
+import easyb
+
+from easyb.logging import SerialLogging
+from easyb.definitions import Length
+from easyb.message.decoder import Decoder
+
+__all__ = [
+    "TestDecoder"
+]
+
+old_logging = easyb.log
+new_logging = SerialLogging()
+new_logging.setup(app="Device", level=0)
+console = new_logging.get_writer("console")
+console.setup(text_space=15, error_index=["ERROR", "EXCEPTION"])
+new_logging.register(console)
+new_logging.open()
+
+_frame9 = [0xfe, 0x0d, 0x1e, 0x72, 0xff, 0x84, 0x00, 0xfc, 0x05]
+_frame3 = [254, 1, 58]
+_variable = [254, 7, 40, 141, 255, 83, 141, 255, 83]
+
+
+# noinspection DuplicatedCode
+class TestDecoder(unittest.TestCase):
+
+    def setUp(self):
+        easyb.set_logging(new_logging)
+        return
+
+    def tearDown(self):
+        easyb.set_logging(old_logging)
+        return
+
+    def test_feed_1(self):
+        decoder = Decoder()
+
+        result = []
+        needed = []
+        for item in _frame9:
+            needed.append(decoder.needed)
+            result.extend(decoder.feed(bytes([item])))
+
+        self.assertEqual(len(result), 1)
+        self.assertEqual(needed, [3, 2, 1, 6, 5, 4, 3, 2, 1])
+        self.assertEqual(result[0].address, 1)
+        self.assertEqual(result[0].length, Length.Byte9)
+        self.assertEqual(result[0].stream.data, bytearray(_frame9))
+        self.assertTrue(result[0].stream.verify_length())
+        self.assertEqual(len(decoder.buffer), 0)
+        return
+
+    def test_feed_2(self):
+        decoder = Decoder()
+
+        result = decoder.feed(bytes([0x00, 0x13] + _frame9 + _frame3))
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(decoder.dropped, 2)
+        self.assertEqual(result[0].stream.data, bytearray(_frame9))
+        self.assertEqual(result[1].stream.data, bytearray(_frame3))
+        return
+
+    def test_feed_3(self):
+        decoder = Decoder()
+
+        result1 = decoder.feed(bytes(_variable))
+        result2 = decoder.feed(bytes([0x00, 0x00, 0x00]))
+
+        self.assertEqual(len(result1), 0)
+        self.assertEqual(len(result2), 1)
+        self.assertEqual(result2[0].length, Length.Variable)
+        self.assertEqual(result2[0].stream.data, bytearray(_variable))
+        return
+
+    def test_variable_1(self):
+        decoder = Decoder()
+
+        check1 = decoder.variable
+        decoder.feed(bytes(_variable[0:3]))
+        check2 = decoder.variable
+        decoder.reset()
+        decoder.feed(bytes(_frame9[0:3]))
+        check3 = decoder.variable
+
+        self.assertFalse(check1)
+        self.assertTrue(check2)
+        self.assertFalse(check3)
+        return
+
+    def test_flush_1(self):
+        decoder = Decoder()
+
+        result1 = decoder.feed(bytes(_variable))
+        result2 = decoder.flush()
+
+        self.assertEqual(len(result1), 0)
+        self.assertEqual(len(result2), 1)
+        self.assertEqual(result2[0].stream.data, bytearray(_variable))
+        return
+
+    def test_flush_2(self):
+        decoder = Decoder()
+
+        result1 = decoder.feed(bytes(_frame9[0:6]))
+        result2 = decoder.flush()
+
+        self.assertEqual(len(result1), 0)
+        self.assertEqual(len(result2), 0)
+        self.assertEqual(decoder.dropped, 6)
+        self.assertEqual(len(decoder.buffer), 0)
+        return
+
+    def test_reset_1(self):
+        decoder = Decoder()
+        decoder.feed(bytes([0x00] + _frame9[0:4]))
+        decoder.reset()
+
+        self.assertEqual(decoder.dropped, 0)
+        self.assertEqual(decoder.needed, 3)
+        return
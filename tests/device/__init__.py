@@ -25,11 +25,14 @@ import unittest
 
 import easyb
 
+from datetime import datetime
+
 from serial import SerialException
 
 from serial import EIGHTBITS, PARITY_NONE, STOPBITS_ONE
 from easyb.definitions import Direction, Length, Priority
 from easyb.command import Command
+from easyb.data.base import to_epoch
 from tests import TestDevice, TestException, TestSerial
 from easyb.logging import SerialLogging
 
@@ -416,7 +419,7 @@ class TestControl(unittest.TestCase):
         self.assertEqual(message.length, Length.Byte6)
         self.assertEqual(message.direction, Direction.FromSlave)
         self.assertEqual(message.priority, Priority.NoPriority)
-        self.assertEqual(message.stream.data, [254, 3, 52, 0x72, 0xff, 0x84])
+        self.assertEqual(message.stream.data, bytearray([254, 3, 52, 0x72, 0xff, 0x84]))
         return
 
     def test_read_receive_7(self):
@@ -449,7 +452,7 @@ class TestControl(unittest.TestCase):
         self.assertEqual(message.length, Length.Variable)
         self.assertEqual(message.direction, Direction.FromSlave)
         self.assertEqual(message.priority, Priority.NoPriority)
-        self.assertEqual(message.stream.data, [254, 7, 40, 141, 255, 83, 141, 255, 83, 141, 255, 83])
+        self.assertEqual(message.stream.data, bytearray([254, 7, 40, 141, 255, 83, 141, 255, 83, 141, 255, 83]))
         return
 
     def test_read_receive_8(self):
@@ -517,6 +520,54 @@ class TestControl(unittest.TestCase):
         self.assertIsNone(message)
         return
 
+    def test_read_receive_11(self):
+        data = [
+            [0x00, 0x13, 0xfe],
+            [0x0d, 0x1e],
+            [0x72, 0xff, 0x84, 0x00, 0xfc, 0x05]
+        ]
+
+        device = TestDevice()
+
+        serial = TestSerial()
+        serial.read_data = data
+
+        device.serial = serial
+
+        message = device.receive()
+
+        self.assertIsNotNone(message)
+        self.assertEqual(message.address, 1)
+        self.assertEqual(message.stream.data, bytearray([0xfe, 0x0d, 0x1e, 0x72, 0xff, 0x84, 0x00, 0xfc, 0x05]))
+        return
+
+    def test_read_until_gap_1(self):
+        data = [
+            [141, 255],
+            [83],
+            [141, 255, 83]
+        ]
+
+        device = TestDevice(gap_time=0.01)
+
+        serial = TestSerial()
+        serial.read_data = data
+
+        device.serial = serial
+
+        result = device.read_until_gap(time.monotonic() + 2.0)
+
+        self.assertEqual(result, bytes([141, 255, 83, 141, 255, 83]))
+        self.assertEqual(serial.read_run, 3)
+        return
+
+    def test_in_waiting_1(self):
+        device = TestDevice()
+        device.serial = mock.Mock()
+
+        self.assertEqual(device.in_waiting(), -1)
+        return
+
     def test_status_1(self):
         device = TestDevice()
 
@@ -592,6 +643,74 @@ class TestControl(unittest.TestCase):
         self.assertIsNone(message)
         return
 
+    def test_execute_4(self):
+        data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        serial = TestSerial()
+        serial.read_data = data
+
+        device = TestDevice()
+        device.serial = serial
+
+        command = device.get_command(0)
+        frame = command.frame
+
+        message1 = device.execute(command)
+        message2 = device.execute(command)
+
+        self.assertEqual(frame, bytes([254, 0, 61]))
+        self.assertIs(command.frame, frame)
+        self.assertIsNotNone(message1)
+        self.assertIsNotNone(message2)
+        self.assertListEqual(serial.write_data, [[254, 0, 61], [254, 0, 61]])
+        return
+
+    def test_execute_5(self):
+        data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        serial = TestSerial()
+        serial.read_data = data
+
+        device = TestDevice(response_driven=True)
+        device.serial = serial
+
+        command = device.get_command(0)
+
+        start = time.monotonic()
+        message = device.execute(command)
+        delta = time.monotonic() - start
+
+        self.assertIsNotNone(message)
+        self.assertLess(delta, device.wait_time)
+        self.assertEqual(device.latency.count, 1)
+        self.assertLess(device.latency.last, device.wait_time)
+        return
+
+    def test_compile_command_1(self):
+        device = TestDevice()
+
+        command = Command(name="Messwert lesen", code=0)
+
+        frame1 = device.compile_command(command)
+        command.address = 2
+        frame2 = device.compile_command(command)
+
+        command.length = Length.Byte6
+        frame3 = device.compile_command(command)
+
+        self.assertEqual(frame1, bytes([254, 0, 61]))
+        self.assertEqual(frame2[0], 253)
+        self.assertIsNone(frame3)
+        return
+
     def test_run_command_1(self):
         data = [
             [0xfe, 0x05, 0x26],
@@ -807,6 +926,165 @@ class TestControl(unittest.TestCase):
         self.assertFalse(device.status)
         return
 
+    def test_run_loop_4(self):
+        data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        serial = TestSerial()
+        serial.read_data = data
+
+        device = TestDevice(interval=0.2)
+        device.serial = serial
+
+        device.run_loop()
+
+        rows = device.data.rows
+        delta = (rows[2].datetime - rows[0].datetime).total_seconds()
+
+        self.assertFalse(device.status)
+        self.assertEqual(device.interval_counter, 4)
+        self.assertGreaterEqual(delta, 0.35)
+        self.assertLess(delta, 0.5)
+        self.assertEqual(device.ticker.overruns, 0)
+        return
+
+    def test_run_loop_5(self):
+        data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        serial = TestSerial()
+        serial.read_data = data
+
+        device = TestDevice(interval=0.05, batch_size=2)
+        device.serial = serial
+
+        check1 = device.open_storage("text", "STREAM")
+        device.run_loop()
+
+        length = device.data.len
+        stored = device.data.stored
+
+        check2 = device.store("text", "STREAM")
+
+        with open("STREAM.csv") as f:
+            lines = f.read().splitlines()
+        os.remove("STREAM.csv")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertEqual(length, 0)
+        self.assertEqual(stored, 3)
+        self.assertEqual(lines[4], "")
+        self.assertEqual(len(lines[1].split("\t")), 4)
+        return
+
+    def test_run_loop_6(self):
+        data = [
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25],
+            [0xfe, 0x05, 0x26],
+            [0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25]
+        ]
+
+        serial = TestSerial()
+        serial.read_data = data
+
+        device = TestDevice(interval=0.05, capture=True)
+        device.serial = serial
+
+        device.run_loop()
+
+        rows = device.data.rows
+
+        self.assertEqual(device.data.len, 3)
+        self.assertEqual(len(device.frames), 0)
+        self.assertIsNone(device.frame_time)
+        self.assertEqual(device.interval_counter, 4)
+        self.assertEqual(rows[0].number, 0)
+        self.assertEqual(rows[2].number, 2)
+        self.assertEqual(rows[0].value, 19.15)
+        self.assertLess(rows[0].datetime, rows[1].datetime)
+        return
+
+    def test_handle_response_1(self):
+        frame = bytes([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+
+        message = easyb.message.Message()
+        message.decode(frame)
+
+        device1 = TestDevice()
+        device2 = TestDevice(capture=True)
+
+        check1 = device1.handle_response(message)
+        check2 = device2.handle_response(message)
+        check3 = device2.end_step(False)
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertFalse(check3)
+        self.assertEqual(device1.data.len, 1)
+        self.assertEqual(device2.data.len, 0)
+        self.assertEqual(len(device2.frames), 1)
+        self.assertEqual(device2.interval_counter, 1)
+        return
+
+    def test_decode_frames_1(self):
+        frame = bytes([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+        timestamp = datetime(2020, 1, 1, 12, 0, 0)
+
+        device = TestDevice()
+        device.interval_counter = 10
+        device.frames.add(frame, to_epoch(timestamp), 5)
+        device.frames.add(frame[0:8], to_epoch(timestamp), 6)
+
+        check = device.decode_frames()
+
+        self.assertFalse(check)
+        self.assertEqual(device.data.len, 1)
+        self.assertEqual(device.data.rows[0].datetime, timestamp)
+        self.assertEqual(device.data.rows[0].number, 5)
+        self.assertEqual(device.interval_counter, 10)
+        return
+
+    def test_decode_frames_2(self):
+        frame = bytes([0xfe, 0x05, 0x26, 0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+
+        device = TestDevice(batch_size=2, capture=True)
+        check1 = device.open_storage("text", "STREAM")
+
+        for number in range(3):
+            device.frames.add(frame, to_epoch(datetime.now()), number)
+
+        device.flush_batch()
+
+        length = device.data.len
+        stored = device.data.stored
+        frames = len(device.frames)
+
+        check2 = device.store("text", "STREAM")
+        os.remove("STREAM.csv")
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertEqual(frames, 0)
+        self.assertEqual(stored, 2)
+        self.assertEqual(length, 1)
+        return
+
     def test_store_1(self):
         data = [
             [0xfe, 0x05, 0x26],
@@ -16,6 +16,7 @@
 #    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
 #
 
+import time
 import unittest
 
 import easyb
@@ -25,7 +26,8 @@ from easyb.devices.gmh3710 import GMH3710
 from easyb.logging import SerialLogging
 
 __all__ = [
-    "TestGMH3710"
+    "TestGMH3710",
+    "TestSlowSerial"
 ]
 
 
@@ -42,6 +44,22 @@ new_logging.register(console)
 new_logging.open()
 
 
+class TestSlowSerial(TestSerial):
+    """Serial port which blocks for its timeout when no data is left, like pyserial."""
+
+    def __init__(self):
+        TestSerial.__init__(self)
+        self.timeout: float = 2.0
+        return
+
+    def read(self, count: int = 0) -> bytes:
+        if self.read_run >= len(self.read_data):
+            time.sleep(self.timeout)
+
+        result = TestSerial.read(self, count)
+        return result
+
+
 class TestGMH3710(unittest.TestCase):
     """Testing class for locking module."""
 
@@ -392,6 +410,28 @@ class TestGMH3710(unittest.TestCase):
         self.assertFalse(check)
         return
 
+    def test_command_12(self):
+        data = [
+            [0xfe, 0x07, 0x28],
+            [0x71, 0x00, 0x48],
+            [0xf8, 0x7b, 0x25]
+        ]
+
+        serial = TestSlowSerial()
+        serial.read_data = data
+
+        device = GMH3710(port="TEST", address=1, timeout=2, wait_time=0.0, gap_time=0.02)
+        device.serial = serial
+
+        start = time.monotonic()
+        check = device.run_command(0)
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(check)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(serial.read_run, 3)
+        return
+
     def test_run_01(self):
         data = [
             [0xfe, 0x33, 0xa4],
@@ -0,0 +1,198 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import os
+import json
+import threading
+import unittest
+
+import easyb
+
+from datetime import datetime, timedelta
+
+from easyb.engine import Engine, Sample, Sink
+from easyb.logging import SerialLogging
+from tests import TestDevice, TestBusSerial
+
+__all__ = [
+    "TestEngine"
+]
+
+old_logging = easyb.log
+new_logging = SerialLogging()
+new_logging.setup(app="Device", level=0)
+console = new_logging.get_writer("console")
+console.setup(text_space=15, error_index=["ERROR", "EXCEPTION"])
+new_logging.register(console)
+new_logging.open()
+
+config = {
+    "ports": [
+        {
+            "port": "TEST0",
+            "devices": [
+                {"device": "GMH 3710", "address": 1, "interval": 0.05},
+                {"device": "GMH 3710", "address": 2, "interval": 0.05, "priority": 1}
+            ]
+        },
+        {
+            "port": "TEST1",
+            "baudrate": 9600,
+            "devices": [
+                {"device": "GMH 3710", "address": 1, "interval": 0.05}
+            ]
+        }
+    ]
+}
+
+
+# noinspection DuplicatedCode
+class TestEngine(unittest.TestCase):
+
+    def setUp(self):
+        easyb.set_logging(new_logging)
+        return
+
+    def tearDown(self):
+        easyb.set_logging(old_logging)
+
+        if os.path.exists("engine.json"):
+            os.remove("engine.json")
+        return
+
+    @staticmethod
+    def _write_config(data: dict):
+        with open("engine.json", mode="w") as f:
+            json.dump(data, f)
+        return
+
+    def test_load_1(self):
+        self._write_config(config)
+
+        engine = Engine()
+        check = engine.load("engine.json")
+
+        self.assertTrue(check)
+        self.assertEqual(len(engine.buses), 2)
+        self.assertEqual(len(engine.devices), 3)
+        self.assertEqual(engine.buses[1].baudrate, 9600)
+        self.assertEqual(engine.buses[0].devices[1].address, 2)
+        return
+
+    def test_load_2(self):
+        engine = Engine()
+        check = engine.load("engine.json")
+
+        self.assertFalse(check)
+        return
+
+    def test_load_3(self):
+        self._write_config({"ports": [{"port": "TEST0", "devices": [{"device": "GMH 9999", "address": 1}]}]})
+
+        engine = Engine()
+        check = engine.load("engine.json")
+
+        self.assertFalse(check)
+        return
+
+    def test_run_1(self):
+        self._write_config(config)
+
+        engine = Engine()
+        engine.load("engine.json")
+
+        for bus in engine.buses:
+            serial = TestBusSerial([0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+
+            bus.serial = serial
+            for device in bus.devices:
+                device.serial = serial
+
+        timer = threading.Timer(0.3, engine.do_abort, (None, None))
+        timer.start()
+
+        check = engine.run()
+        samples = engine.sink.pop()
+
+        self.assertTrue(check)
+        self.assertFalse(engine.active)
+        self.assertGreater(len(samples), 3)
+        self.assertEqual(engine.sink.len, 0)
+
+        for n in range(1, len(samples)):
+            self.assertLessEqual(samples[n - 1].timestamp, samples[n].timestamp)
+
+        self.assertEqual(samples[0].values["value"], 19.15)
+        return
+
+    def test_run_2(self):
+        self._write_config(config)
+
+        engine = Engine()
+        engine.load("engine.json")
+
+        for bus in engine.buses:
+            serial = TestBusSerial([0x71, 0x00, 0x48, 0xf8, 0x7b, 0x25])
+
+            bus.serial = serial
+            for device in bus.devices:
+                device.serial = serial
+                device.batch_size = 2
+
+        check1 = engine.open("text", "ENGINE")
+
+        timer = threading.Timer(0.3, engine.do_abort, (None, None))
+        timer.start()
+
+        check2 = engine.run()
+        stored = [device.data.stored for device in engine.devices]
+        length = [device.data.len for device in engine.devices]
+
+        check3 = engine.store("text", "ENGINE")
+
+        filenames = ["ENGINE_TEST0_1.csv", "ENGINE_TEST0_2.csv", "ENGINE_TEST1_1.csv"]
+        exists = [os.path.exists(item) for item in filenames]
+
+        for item in filenames:
+            if os.path.exists(item):
+                os.remove(item)
+
+        self.assertTrue(check1)
+        self.assertTrue(check2)
+        self.assertTrue(check3)
+        self.assertListEqual(exists, [True, True, True])
+        self.assertListEqual(length, [0, 0, 0])
+
+        for item in stored:
+            self.assertGreater(item, 1)
+        return
+
+    def test_sink_1(self):
+        sink = Sink(size=3)
+        device = TestDevice(address=1)
+        start = datetime(2020, 1, 1)
+
+        for n in [4, 0, 3, 1, 2]:
+            sink.append(Sample(start + timedelta(seconds=n), "TEST0", device, {"value": float(n)}))
+
+        samples = sink.pop()
+
+        self.assertEqual(sink.dropped, 2)
+        self.assertEqual(sink.counter, 5)
+        self.assertListEqual([item.values["value"] for item in samples], [2.0, 3.0, 4.0])
+        return
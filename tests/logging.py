@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import unittest
+import unittest.mock as mock
+
+import easyb
+
+from easyb.logging import SerialLogging
+from easyb.message import Message
+
+__all__ = [
+    "TestLogging"
+]
+
+
+# noinspection DuplicatedCode
+class TestLogging(unittest.TestCase):
+
+    def setUp(self):
+        return
+
+    def tearDown(self):
+        return
+
+    def test_is_enabled_1(self):
+        logging = SerialLogging()
+
+        check1 = logging.is_enabled("SERIAL")
+
+        logging.setup(app="Test", level=0)
+        check2 = logging.is_enabled("SERIAL")
+        check3 = logging.is_enabled("INFORM")
+
+        logging.setup(level=3)
+        check4 = logging.is_enabled("SERIAL")
+        check5 = logging.is_enabled("DEBUG2")
+
+        self.assertTrue(check1)
+        self.assertFalse(check2)
+        self.assertTrue(check3)
+        self.assertTrue(check4)
+        self.assertTrue(check5)
+        return
+
+    def test_serial_1(self):
+        logging = SerialLogging()
+        logging.setup(app="Test", level=0)
+        logging.append = mock.Mock()
+
+        with mock.patch("easyb.logging.debug_data") as debug:
+            logging.serial_write(bytes([0xfe, 0x05, 0x26]))
+            logging.serial_read(bytes([0xfe, 0x05, 0x26]))
+
+            self.assertEqual(debug.call_count, 0)
+
+        self.assertEqual(logging.append.call_count, 0)
+        return
+
+    def test_serial_2(self):
+        logging = SerialLogging()
+        logging.setup(app="Test", level=1)
+        logging.append = mock.Mock()
+
+        logging.serial_write(bytes([0xfe, 0x05, 0x26]))
+        logging.serial_read(bytes([0xfe, 0x05, 0x26]))
+
+        message = logging.append.call_args[0][0]
+
+        self.assertEqual(logging.append.call_count, 2)
+        self.assertEqual(message.content, "< 0xfe 0x05 0x26")
+        return
+
+    def test_message_info_1(self):
+        old_logging = easyb.log
+
+        logging = SerialLogging()
+        logging.setup(app="Test", level=0)
+        logging.debug2 = mock.Mock()
+
+        easyb.set_logging(logging)
+
+        message = Message(address=1, code=0)
+        message.info("SEND")
+
+        logging.setup(level=3)
+        message.info("SEND")
+
+        easyb.set_logging(old_logging)
+
+        self.assertEqual(logging.debug2.call_count, 1)
+        return
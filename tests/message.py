@@ -194,3 +194,39 @@ class TestMessage(unittest.TestCase):
         check = message.decode(bytes(header))
         self.assertFalse(check)
         return
+
+    def test_header_table_1(self):
+        result = []
+
+        for value in range(256):
+            message = easyb.message.Message()
+            message.stream = easyb.message.stream.Stream(Length.Byte3, 3)
+            message.stream.data[0] = 0xfe
+            message.stream.data[1] = value
+            message._decode_header()
+
+            data = bytearray(3)
+            message._encode_header(data)
+            result.append(data[1])
+
+        self.assertListEqual(result, list(range(256)))
+        return
+
+    def test_header_table_2(self):
+        message = easyb.message.Message(address=1, code=0xf, priority=Priority.Priority, length=Length.Variable,
+                                        direction=Direction.FromSlave)
+        message.stream = easyb.message.stream.Stream(Length.Byte3, 3)
+        message.stream.data[0] = 0xfd
+        message.stream.data[1] = 0x5e
+
+        data = bytearray(3)
+        message._encode_header(data)
+        message._decode_header()
+
+        self.assertEqual(data[1], 0xff)
+        self.assertEqual(message.address, 2)
+        self.assertEqual(message.code, 5)
+        self.assertIs(message.priority, Priority.Priority)
+        self.assertIs(message.length, Length.Variable)
+        self.assertIs(message.direction, Direction.FromMaster)
+        return
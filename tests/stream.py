@@ -52,7 +52,7 @@ class TestStream(unittest.TestCase):
         self.assertTrue(check)
 
         self.assertIs(stream.length, Length.Byte6)
-        self.assertEqual(stream.data, data1)
+        self.assertEqual(stream.data, bytearray(data1))
         self.assertEqual(stream.bytes, data2)
         self.assertEqual(repr(stream), data3)
         self.assertEqual(str(stream), data3)
@@ -72,7 +72,7 @@ class TestStream(unittest.TestCase):
         self.assertTrue(check)
 
         self.assertIs(stream.length, Length.Variable)
-        self.assertEqual(stream.data, data1)
+        self.assertEqual(stream.data, bytearray(data1))
         self.assertEqual(stream.bytes, data2)
         self.assertEqual(repr(stream), data3)
         self.assertEqual(str(stream), data3)
@@ -117,6 +117,20 @@ class TestStream(unittest.TestCase):
         self.assertFalse(check)
         return
 
+    def test_append_5(self):
+        stream = Stream(Length.Variable)
+        stream.append(bytes([0xfe, 0x0d, 0x1e]))
+
+        data = stream.bytes
+        check = stream.append(bytes([0xfe, 0x0d, 0x1e]))
+        stream.expand_data(9)
+
+        self.assertTrue(check)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(data, bytes([0xfe, 0x0d, 0x1e]))
+        self.assertEqual(stream.len, 9)
+        return
+
     def test_verify_length_1(self):
         data = [0xfe, 0x0d, 0x1e, 0x72, 0xff, 0x84, 0x00, 0xfc, 0x05]
 
@@ -186,7 +200,7 @@ class TestStream(unittest.TestCase):
 
         check = stream.encode()
         self.assertTrue(check)
-        self.assertEqual(stream.data, data_check)
+        self.assertEqual(stream.data, bytearray(data_check))
         return
 
     def test_encode_2(self):
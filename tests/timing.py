@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+#
+#    Copyright (C) 2017, Kai Raphahn <kai.raphahn@laburec.de>
+#
+
+import time
+import unittest
+
+from easyb.timing import Latency, Ticker
+
+__all__ = [
+    "TestTiming"
+]
+
+
+# noinspection DuplicatedCode
+class TestTiming(unittest.TestCase):
+
+    def setUp(self):
+        return
+
+    def tearDown(self):
+        return
+
+    def test_latency_1(self):
+        latency = Latency()
+
+        self.assertEqual(latency.count, 0)
+        self.assertEqual(latency.mean, 0.0)
+        return
+
+    def test_latency_2(self):
+        latency = Latency()
+        latency.add(0.2)
+        latency.add(0.1)
+        latency.add(0.3)
+
+        self.assertEqual(latency.count, 3)
+        self.assertAlmostEqual(latency.mean, 0.2)
+        self.assertEqual(latency.minimum, 0.1)
+        self.assertEqual(latency.maximum, 0.3)
+        self.assertEqual(latency.last, 0.3)
+        self.assertEqual(str(latency), "3 transactions, mean 200.0 ms, min 100.0 ms, max 300.0 ms")
+
+        latency.reset()
+        self.assertEqual(latency.count, 0)
+        return
+
+    def test_ticker_1(self):
+        ticker = Ticker(0.05)
+        ticker.start()
+        start = ticker.deadline
+
+        for n in range(5):
+            time.sleep(0.01)
+            ticker.wait()
+
+        delta = time.monotonic() - start
+
+        self.assertGreaterEqual(delta, 0.25)
+        self.assertLess(delta, 0.29)
+        self.assertEqual(ticker.overruns, 0)
+        self.assertEqual(ticker.missed, 0)
+        return
+
+    def test_ticker_2(self):
+        ticker = Ticker(0.05)
+        ticker.start()
+        start = ticker.deadline
+
+        time.sleep(0.12)
+        delay = ticker.delay()
+
+        self.assertEqual(ticker.overruns, 1)
+        self.assertEqual(ticker.missed, 2)
+        self.assertAlmostEqual(ticker.deadline - start, 0.15)
+        self.assertGreater(delay, 0.0)
+        return
+
+    def test_ticker_3(self):
+        ticker = Ticker(0.05, catch_up=True)
+        ticker.start()
+
+        time.sleep(0.12)
+        delay1 = ticker.delay()
+        delay2 = ticker.delay()
+        delay3 = ticker.delay()
+
+        self.assertEqual(delay1, 0.0)
+        self.assertEqual(delay2, 0.0)
+        self.assertGreater(delay3, 0.0)
+        self.assertEqual(ticker.overruns, 2)
+        self.assertEqual(ticker.missed, 0)
+        self.assertEqual(str(ticker), "2 overruns, 0 missed deadlines")
+        return